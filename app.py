@@ -1,4 +1,11 @@
 #!/usr/bin/env python3
+import argparse
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Sequence, Tuple
+
 import aws_cdk as cdk
 import boto3
 
@@ -6,8 +13,12 @@ from deploy_monitor.ecs_deploy_monitor import EcsDeploymentNotifierStack
 from ecs_monitor.api_server_monitor import ApiServerHealthMonitor
 from etl_monitor.batch_monitor import BatchFailureAlertStack
 from linked_paper_web_infra.backend_stack import BackendInfraStack
+from linked_paper_web_infra.certificates import EdgeCertificateStack
+from linked_paper_web_infra.environments import ENVIRONMENTS, EnvironmentConfig
 from linked_paper_web_infra.front_stack import LinkedPaperWebInfraStack
-from security.waf_stack import WafStack
+from linked_paper_web_infra.result_cache import ResultCacheProps
+from load_generator.load_test_stack import LoadTestStack
+from security.waf_stack import WAF_LOG_GROUP_NAME, WafStack
 from traffic_monitor.nat_gateway import NatGatewayMonitoringStack
 
 
@@ -21,57 +32,186 @@ def get_default_region():
     return session.region_name
 
 
-app = cdk.App()
-LinkedPaperWebInfraStack(
-    app,
-    "LinkedPaperWebInfraStack",
-    # If you don't specify 'env', this stack will be environment-agnostic.
-    # Account/Region-dependent features and context lookups will not work,
-    # but a single synthesized template can be deployed anywhere.
-    # Uncomment the next line to specialize this stack for the AWS Account
-    # and Region that are implied by the current CLI configuration.
-    # env=cdk.Environment(account=os.getenv('CDK_DEFAULT_ACCOUNT'), region=os.getenv('CDK_DEFAULT_REGION')),
-    # Uncomment the next line if you know exactly what Account and Region you
-    # want to deploy the stack to. */
-    env=cdk.Environment(account=get_aws_account_id(), region=get_default_region()),
-    # For more information, see https://docs.aws.amazon.com/cdk/latest/guide/environments.html
-)
-
-WafStack(
-    app,
-    "WafStack",
-    env=cdk.Environment(account=get_aws_account_id(), region=get_default_region()),
-)
-
-
-BackendInfraStack(
-    app,
-    "BackendInfraStack",
-    env=cdk.Environment(account=get_aws_account_id(), region=get_default_region()),
-)
-
-NatGatewayMonitoringStack(
-    app,
-    "NatGatewayMonitoringStack",
-    env=cdk.Environment(account=get_aws_account_id(), region=get_default_region()),
-)
-
-EcsDeploymentNotifierStack(
-    app,
-    "EcsDeploymentNotifierStack",
-    env=cdk.Environment(account=get_aws_account_id(), region=get_default_region()),
-)
-
-BatchFailureAlertStack(
-    app,
-    "BatchFailureAlertStack",
-    env=cdk.Environment(account=get_aws_account_id(), region=get_default_region()),
-)
-
-ApiServerHealthMonitor(
-    app,
-    "ApiServerHealthMonitor",
-    env=cdk.Environment(account=get_aws_account_id(), region=get_default_region()),
-)
-
-app.synth()
+def build_app(app: cdk.App, config: EnvironmentConfig) -> cdk.App:
+    """app에 config 환경의 모든 스택을 추가 (테스트/정책 검사에서도 AWS 호출 없이 사용)"""
+    env = cdk.Environment(account=config.account, region=config.region)
+    # CloudFront 인증서와 WAF는 us-east-1에 배포해야 함
+    edge_env = cdk.Environment(account=config.account, region="us-east-1")
+
+    # 기존 인증서 ARN이 없는 환경은 us-east-1 스택에서 인증서 발급
+    cloudfront_certificate = None
+    if not config.cloudfront_certificate_arn:
+        cloudfront_certificate = EdgeCertificateStack(
+            app,
+            config.stack_id("EdgeCertificateStack"),
+            domain_name=config.domain_name,
+            env=edge_env,
+        ).certificate
+
+    front_stack = LinkedPaperWebInfraStack(
+        app,
+        config.stack_id("LinkedPaperWebInfraStack"),
+        capacity=config.capacity,
+        domain_name=config.domain_name,
+        cloudfront_certificate_arn=config.cloudfront_certificate_arn,
+        cloudfront_certificate=cloudfront_certificate,
+        cross_region_references=True,  # us-east-1 인증서 참조
+        # If you don't specify 'env', this stack will be environment-agnostic.
+        # Account/Region-dependent features and context lookups will not work,
+        # but a single synthesized template can be deployed anywhere.
+        env=env,
+        # For more information, see https://docs.aws.amazon.com/cdk/latest/guide/environments.html
+    )
+
+    waf_stack = WafStack(
+        app,
+        config.stack_id("WafStack"),
+        waf_scope="CLOUDFRONT",
+        log_group_name=config.resource_name(WAF_LOG_GROUP_NAME),
+        export_prefix=config.stack_prefix,
+        env=edge_env,
+    )
+
+    backend_stack = BackendInfraStack(
+        app,
+        config.stack_id("BackendInfraStack"),
+        edge_web_acl_arn=waf_stack.web_acl_arn,
+        result_cache=ResultCacheProps(),
+        capacity=config.capacity,
+        search_domain_migration=config.search_domain_migration,
+        vpc_id=config.vpc_id,
+        # 기존 VPC ID가 없는 환경은 같은 환경의 프론트 스택 VPC 사용
+        vpc=None if config.vpc_id else front_stack.vpc,
+        private_endpoints=config.private_endpoints,
+        domain_name=config.domain_name,
+        cloudfront_certificate_arn=config.cloudfront_certificate_arn,
+        cloudfront_certificate=cloudfront_certificate,
+        export_prefix=config.stack_prefix,
+        cross_region_references=True,  # us-east-1 WAF ARN, 인증서 참조
+        env=env,
+    )
+
+    # 프론트 VPC와 백엔드 VPC의 NAT Gateway (기존 VPC를 조회한 백엔드는 nat_gateway_ids로 지정)
+    nat_vpcs = [front_stack.vpc]
+    if backend_stack.vpc is not front_stack.vpc:
+        nat_vpcs.append(backend_stack.vpc)
+    NatGatewayMonitoringStack(
+        app,
+        config.stack_id("NatGatewayMonitoringStack"),
+        vpcs=nat_vpcs,
+        nat_gateway_ids=config.nat_gateway_ids,
+        slack_secret_name=config.slack_webhook_secret_name,
+        env=env,
+    )
+
+    EcsDeploymentNotifierStack(
+        app,
+        config.stack_id("EcsDeploymentNotifierStack"),
+        slack_secret_name=config.slack_webhook_secret_name,
+        env=env,
+    )
+
+    BatchFailureAlertStack(
+        app,
+        config.stack_id("BatchFailureAlertStack"),
+        slack_secret_name=config.slack_webhook_secret_name,
+        env=env,
+    )
+
+    ApiServerHealthMonitor(
+        app,
+        config.stack_id("ApiServerHealthMonitor"),
+        slack_secret_name=config.slack_webhook_secret_name,
+        export_prefix=config.stack_prefix,
+        env=env,
+    )
+
+    if config.load_test:
+        LoadTestStack(
+            app,
+            config.stack_id("LoadGeneratorStack"),
+            vpc=backend_stack.vpc,
+            target_load_balancer=backend_stack.api_load_balancer,
+            domain_name=config.domain_name,
+            env=env,
+        )
+
+    return app
+
+
+def load_context(directory: str = ".") -> dict:
+    """cdk.json의 context와 cdk.context.json의 조회 캐시 (CDK CLI 없이 합성할 때 사용)"""
+    context = {}
+    for name in ("cdk.json", "cdk.context.json"):
+        path = os.path.join(directory, name)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as source:
+                loaded = json.load(source)
+            context.update(loaded.get("context", {}) if name == "cdk.json" else loaded)
+    return context
+
+
+def synth_environment(
+    name: str, account: str, region: str, outdir: str, context: dict
+) -> Tuple[str, str, List[str]]:
+    """작업 프로세스에서 한 환경을 outdir/<name>에 합성 -> (환경, 디렉터리, 누락된 조회)"""
+    config = ENVIRONMENTS[name].resolve(account, region)
+    app = cdk.App(outdir=os.path.join(outdir, name), context=context)
+    assembly = build_app(app, config).synth()
+    with open(os.path.join(assembly.directory, "manifest.json"), encoding="utf-8") as f:
+        missing = [item["key"] for item in json.load(f).get("missing", [])]
+    return name, assembly.directory, missing
+
+
+def synth_environments(
+    names: Sequence[str], account: str, region: str, outdir: str, context: dict
+) -> List[Tuple[str, str, List[str]]]:
+    """환경마다 별도 프로세스(별도 jsii 런타임)에서 병렬로 합성"""
+    # 부모 프로세스의 jsii 런타임(node)을 fork로 공유하지 않도록 spawn 사용
+    with ProcessPoolExecutor(
+        max_workers=min(len(names), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        futures = [
+            executor.submit(synth_environment, name, account, region, outdir, context)
+            for name in names
+        ]
+        return [future.result() for future in futures]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Synthesize environments into separate cloud assemblies"
+    )
+    parser.add_argument(
+        "--env",
+        action="append",
+        dest="envs",
+        choices=sorted(ENVIRONMENTS),
+        help="repeatable (default: all environments)",
+    )
+    parser.add_argument("--outdir", default="cdk.out.envs")  # <outdir>/<환경>
+    args = parser.parse_args()
+
+    names = args.envs or list(ENVIRONMENTS)
+    results = synth_environments(
+        names, get_aws_account_id(), get_default_region(), args.outdir, load_context()
+    )
+    for name, directory, missing in results:
+        print(f"{name}: {directory}")
+        if missing:
+            # 조회 결과는 CDK CLI가 cdk.context.json에 기록하므로 한 번은 CLI로 합성 필요
+            print(f"  missing lookups, run: cdk synth -c env={name}")
+            for key in missing:
+                print(f"    {key}")
+
+
+if __name__ == "__main__":
+    if "CDK_OUTDIR" in os.environ:
+        # CDK CLI 실행 (cdk synth/deploy -c env=<환경>): 한 환경만 합성
+        app = cdk.App()
+        config = ENVIRONMENTS[app.node.try_get_context("env") or "prod"]
+        build_app(app, config.resolve(get_aws_account_id(), get_default_region()))
+        app.synth()
+    else:
+        main()
@@ -0,0 +1,458 @@
+"""기록된 사용률 지표로 서비스별 태스크 크기/개수와 ASG 범위를 추천합니다.
+
+서비스마다 1분 단위 CSV(timestamp, requests, tasks, cpu, memory[, gpu])를 읽어
+태스크당 요청 수 대비 CPU/메모리/GPU 사용량을 선형 회귀로 맞추고, 목표 분위수(p99)에서
+headroom을 남기는 가장 저렴한 크기와 태스크 수를 계산한 뒤 스택 코드의 현재 값과 비교합니다.
+태스크/GPU 인스턴스 수와 requests_per_target은 scaling.py의 운영 용량 프로파일
+(CAPACITY_PROFILES["prod"])과 비교합니다.
+
+    python -m capacity_planner.planner \\
+        --metrics web=web.csv --metrics api=api.csv --metrics search=search.csv \\
+        --quantile 99 --headroom 0.3
+
+CSV 컬럼 (CloudWatch 1분 지표, 그 밖의 컬럼은 무시):
+    timestamp epoch 초 또는 ISO-8601 (선택)
+    requests  ALB RequestCount (Sum)
+    tasks     ECS/ContainerInsights RunningTaskCount (Average)
+    cpu       AWS/ECS CPUUtilization (Average, %): Fargate는 태스크 CPU, EC2는 컨테이너 예약 CPU 대비
+    memory    AWS/ECS MemoryUtilization (Average, %)
+    gpu       GPU 사용률 (%, 검색 서비스만)
+"""
+
+import argparse
+import csv
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from capacity_planner.stack_sizes import HardCodedValue, hard_coded_sizes, profile_sizes
+
+REQUIRED_COLUMNS = ("requests", "tasks", "cpu", "memory")
+OPTIONAL_COLUMNS = ("timestamp", "gpu")
+# 서비스별 태스크 수/스케일링 목표가 정의된 용량 프로파일
+SCALING_PATH = "linked_paper_web_infra/scaling.py"
+SCALING_PROFILE = "prod"
+
+# 유효한 Fargate (CPU, 메모리 MiB) 조합
+FARGATE_SIZES: Tuple[Tuple[int, int], ...] = (
+    *((256, memory) for memory in (512, 1024, 2048)),
+    *((512, memory) for memory in range(1024, 4097, 1024)),
+    *((1024, memory) for memory in range(2048, 8193, 1024)),
+    *((2048, memory) for memory in range(4096, 16385, 1024)),
+    *((4096, memory) for memory in range(8192, 30721, 1024)),
+)
+# ap-northeast-2 Fargate Linux/x86 시간당 요금 (USD): 후보 크기 간 비용 비교에만 사용
+FARGATE_VCPU_HOUR = 0.04656
+FARGATE_GB_HOUR = 0.00511
+# 사이드카 몫을 뺀 뒤 앱 컨테이너에 남겨야 하는 최소 크기
+MIN_CONTAINER_SIZES = {"cpu": 128, "memory_limit_mib": 256}
+
+
+@dataclass(frozen=True)
+class InstanceShape:
+    cpu: int
+    memory_mib: int  # ECS 에이전트/OS 몫을 제외한 등록 메모리
+    gpus: int
+
+
+G4DN_XLARGE = InstanceShape(cpu=4096, memory_mib=15_360, gpus=1)
+
+
+@dataclass(frozen=True)
+class ServiceSpec:
+    """스택 코드에서 서비스 크기가 정의된 위치"""
+
+    path: str
+    container: str
+    service: str
+    profile: str  # CapacityProfile 필드 (태스크 수는 CAPACITY_PROFILES에서 관리)
+    task: Optional[str] = None  # Fargate 태스크 크기를 정의하는 construct (EC2는 None)
+    instance: Optional[InstanceShape] = None  # EC2(GPU) 서비스: 인스턴스당 태스크 1개
+
+
+SERVICES: Dict[str, ServiceSpec] = {
+    "web": ServiceSpec(
+        path="linked_paper_web_infra/front_stack.py",
+        task="create_task_definition",
+        container="LinkedPaperContainer",
+        service="LinkedPaperFargateService",
+        profile="web",
+    ),
+    "api": ServiceSpec(
+        path="linked_paper_web_infra/backend_stack.py",
+        task="create_api_task_definition",
+        container="ApiServiceContainer",
+        service="ApiServiceFargateService",
+        profile="api",
+    ),
+    "search": ServiceSpec(
+        path="linked_paper_web_infra/backend_stack.py",
+        container="SearchServiceContainer",
+        service="SearchServiceEC2Service",
+        profile="search",
+        instance=G4DN_XLARGE,
+    ),
+}
+
+
+def parse_value(column: str, value: str) -> float:
+    value = value.strip()
+    if not value:
+        return math.nan
+    if column == "timestamp":
+        try:
+            return float(value)
+        except ValueError:
+            return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+
+def load_metrics(path: str) -> Dict[str, np.ndarray]:
+    """헤더가 있는 CSV -> {컬럼: 배열} (사용하는 컬럼만 읽고, 빈 값/nan이 있는 행은 제외)"""
+    with open(path, encoding="utf-8", newline="") as source:
+        reader = csv.reader(source)
+        header = [name.strip() for name in next(reader, [])]
+        missing = set(REQUIRED_COLUMNS) - set(header)
+        if missing:
+            raise ValueError(f"{path} is missing columns: {', '.join(sorted(missing))}")
+        columns = [
+            (name, header.index(name))
+            for name in REQUIRED_COLUMNS + OPTIONAL_COLUMNS
+            if name in header
+        ]
+        rows = []
+        for line, row in enumerate(reader, start=2):
+            if not any(cell.strip() for cell in row):
+                continue
+            try:
+                rows.append([parse_value(name, row[index]) for name, index in columns])
+            except (IndexError, ValueError) as error:
+                raise ValueError(f"{path}:{line}: malformed row ({error})") from None
+    data = np.array(rows, dtype=float).reshape(-1, len(columns))
+    valid = ~np.isnan(data).any(axis=1)
+    valid[valid] &= data[valid, [name for name, _ in columns].index("tasks")] > 0
+    return {name: data[valid, position] for position, (name, _) in enumerate(columns)}
+
+
+@dataclass(frozen=True)
+class UsageModel:
+    """태스크당 사용량 = intercept + slope * 태스크당 요청 수 (+ 목표 분위수 잔차)"""
+
+    intercept: float
+    slope: float
+    residual: float
+
+    @classmethod
+    def fit(cls, load: np.ndarray, usage: np.ndarray, quantile: float) -> "UsageModel":
+        design = np.column_stack([np.ones_like(load), load])
+        (intercept, slope), *_ = np.linalg.lstsq(design, usage, rcond=None)
+        # 부하와 무관한 사용량 (예: 메모리, 수치 오차 수준의 기울기 포함): 분위수 그대로 사용
+        if slope * np.ptp(load) <= 1e-9 * np.abs(usage).max():
+            return cls(float(np.percentile(usage, quantile)), 0.0, 0.0)
+        residual = np.percentile(usage - (intercept + slope * load), quantile)
+        return cls(float(intercept), float(slope), float(max(residual, 0.0)))
+
+    def at(self, load) -> np.ndarray:
+        return self.intercept + self.slope * np.asarray(load) + self.residual
+
+    def capacity(self, limits) -> np.ndarray:
+        """사용량이 limit 이하로 유지되는 최대 태스크당 요청 수 (불가능하면 0)"""
+        limits = np.asarray(limits, dtype=float)
+        spare = limits - self.intercept - self.residual
+        if self.slope == 0:
+            return np.where(spare >= 0, np.inf, 0.0)
+        return np.maximum(spare / self.slope, 0.0)
+
+
+@dataclass(frozen=True)
+class Recommendation:
+    service: str
+    cpu: int
+    memory_mib: int
+    capacity: float  # 태스크당 요청 수 (1분)
+    min_tasks: int
+    max_tasks: int
+    mean_tasks: float
+    models: Dict[str, UsageModel]
+    values: Dict[Tuple[str, str], int]  # (construct, field) -> 추천 값
+    warnings: Tuple[str, ...] = ()
+
+    @property
+    def requests_per_target(self) -> int:
+        return int(self.capacity)
+
+
+def task_counts(total_load: np.ndarray, capacity: np.ndarray) -> np.ndarray:
+    """후보 크기별 시점마다 필요한 태스크 수 (후보 x 시점, 처리 불가능한 후보는 nan)"""
+    capacity = np.where(capacity > 0, capacity, np.nan)
+    return np.maximum(np.ceil(total_load[None, :] / capacity[:, None]), 1)
+
+
+def current_sizes(spec: ServiceSpec) -> Dict[Tuple[str, str], HardCodedValue]:
+    profile = [
+        value
+        for value in profile_sizes(SCALING_PATH, SCALING_PROFILE)
+        if value.construct == f"capacity.{spec.profile}"
+    ]
+    return {
+        (value.construct, value.field): value
+        for value in hard_coded_sizes(spec.path) + profile
+    }
+
+
+def round_up(value: float, step: int) -> int:
+    return int(math.ceil(value / step) * step)
+
+
+def recommend(
+    name: str,
+    spec: ServiceSpec,
+    metrics: Dict[str, np.ndarray],
+    current: Dict[Tuple[str, str], HardCodedValue],
+    quantile: float = 99,
+    headroom: float = 0.3,
+) -> Recommendation:
+    if spec.task:
+        allocated_cpu = current[(spec.task, "cpu")].value
+        allocated_memory = current[(spec.task, "memory_limit_mib")].value
+    else:
+        allocated_cpu = current[(spec.container, "cpu")].value
+        allocated_memory = current[(spec.container, "memory_limit_mib")].value
+
+    load = metrics["requests"] / metrics["tasks"]
+    models = {
+        "cpu": UsageModel.fit(load, metrics["cpu"] / 100 * allocated_cpu, quantile),
+        "memory": UsageModel.fit(
+            load, metrics["memory"] / 100 * allocated_memory, quantile
+        ),
+    }
+    usable = 1 - headroom
+    percentile_low = np.percentile(metrics["requests"], 100 - quantile)
+    peak = metrics["requests"].max()
+
+    if spec.instance is None:
+        return _recommend_fargate(
+            name, spec, metrics, current, models, usable, percentile_low, peak
+        )
+
+    if "gpu" in metrics:
+        models["gpu"] = UsageModel.fit(load, metrics["gpu"], quantile)
+    return _recommend_gpu(
+        name, spec, metrics, current, models, usable, percentile_low, peak
+    )
+
+
+def sidecar_shares(
+    spec: ServiceSpec, current: Dict[Tuple[str, str], HardCodedValue]
+) -> Dict[str, float]:
+    """현재 태스크 크기 중 앱 컨테이너를 뺀 사이드카 몫 (컨테이너 값이 없으면 제외)"""
+    shares = {}
+    for field in ("cpu", "memory_limit_mib"):
+        container = current.get((spec.container, field))
+        if container is not None and container.value is not None:
+            shares[field] = current[(spec.task, field)].value - container.value
+    return shares
+
+
+def _recommend_fargate(
+    name, spec, metrics, current, models, usable, percentile_low, peak
+) -> Recommendation:
+    sizes = np.array(FARGATE_SIZES, dtype=float)
+    capacity = np.minimum(
+        models["cpu"].capacity(sizes[:, 0] * usable),
+        models["memory"].capacity(sizes[:, 1] * usable),
+    )
+    # 사이드카를 빼면 앱 컨테이너가 들어가지 않는 크기는 제외 (더 큰 크기 선택)
+    shares = sidecar_shares(spec, current)
+    for column, field in enumerate(("cpu", "memory_limit_mib")):
+        if field in shares:
+            fits = sizes[:, column] - shares[field] >= MIN_CONTAINER_SIZES[field]
+            capacity = np.where(fits, capacity, 0.0)
+    # 사용량이 부하와 무관하면 관측된 최대 부하까지만 처리량으로 인정
+    capacity = np.where(np.isinf(capacity), peak, capacity)
+    counts = task_counts(metrics["requests"], capacity)
+    mean_tasks = counts.mean(axis=1)
+    price = (
+        sizes[:, 0] / 1024 * FARGATE_VCPU_HOUR + sizes[:, 1] / 1024 * FARGATE_GB_HOUR
+    )
+    cost = np.where(capacity > 0, mean_tasks * price, np.inf)
+    if not np.isfinite(cost).any():
+        raise ValueError(f"{name}: no Fargate size keeps usage under the headroom")
+    best = int(np.argmin(cost))
+    cpu, memory = (int(v) for v in FARGATE_SIZES[best])
+    min_tasks = max(1, math.ceil(percentile_low / capacity[best]))
+    max_tasks = max(min_tasks, math.ceil(peak / capacity[best]))
+
+    # 사이드카 몫(현재 태스크 - 앱 컨테이너)은 그대로 유지
+    values = {(spec.task, "cpu"): cpu, (spec.task, "memory_limit_mib"): memory}
+    for field, size in (("cpu", cpu), ("memory_limit_mib", memory)):
+        if field in shares:
+            values[(spec.container, field)] = int(size - shares[field])
+    # 서비스의 desired_count는 오토스케일링이 덮어쓰므로 용량 프로파일 값을 추천
+    profile = f"capacity.{spec.profile}"
+    values[(profile, "min_capacity")] = min_tasks
+    values[(profile, "max_capacity")] = max_tasks
+    values[(profile, "requests_per_target")] = int(capacity[best])
+
+    return Recommendation(
+        service=name,
+        cpu=cpu,
+        memory_mib=memory,
+        capacity=float(capacity[best]),
+        min_tasks=min_tasks,
+        max_tasks=max_tasks,
+        mean_tasks=float(mean_tasks[best]),
+        models=models,
+        values=values,
+    )
+
+
+def _recommend_gpu(
+    name, spec, metrics, current, models, usable, percentile_low, peak
+) -> Recommendation:
+    instance = spec.instance
+    # 태스크당 처리량은 GPU가 결정 (GPU 지표가 없으면 현재 CPU 예약 기준)
+    capacity = float(
+        models["gpu"].capacity(100 * usable)
+        if "gpu" in models
+        else models["cpu"].capacity(current[(spec.container, "cpu")].value * usable)
+    )
+    if capacity <= 0:
+        raise ValueError(f"{name}: one GPU task cannot stay under the headroom")
+    capacity = min(capacity, peak) if math.isinf(capacity) else capacity
+
+    cpu = round_up(models["cpu"].at(capacity) / usable, 128)
+    memory = round_up(models["memory"].at(capacity) / usable, 512)
+    sidecar_cpu = instance.cpu - current[(spec.container, "cpu")].value
+    warnings = []
+    if cpu + sidecar_cpu > instance.cpu:
+        warnings.append(f"cpu {cpu} + sidecars exceeds the instance ({instance.cpu})")
+    if memory > instance.memory_mib:
+        warnings.append(
+            f"memory {memory} MiB exceeds the instance ({instance.memory_mib} MiB)"
+        )
+
+    counts = task_counts(metrics["requests"], np.array([capacity]))
+    min_tasks = max(1, math.ceil(percentile_low / capacity))
+    max_tasks = max(min_tasks, math.ceil(peak / capacity))
+    # 태스크/인스턴스 수는 스택 코드가 참조하는 용량 프로파일(GpuCapacity)에 추천
+    profile = f"capacity.{spec.profile}"
+    values = {
+        (spec.container, "cpu"): int(min(cpu, instance.cpu - sidecar_cpu)),
+        (spec.container, "memory_limit_mib"): int(min(memory, instance.memory_mib)),
+        (profile, "desired_tasks"): min_tasks,
+        # 인스턴스당 GPU 태스크 1개, 최대값은 배포 중 새 태스크용 인스턴스 1대 추가
+        (profile, "min_instances"): min_tasks,
+        (profile, "desired_instances"): min_tasks,
+        (profile, "max_instances"): max_tasks + 1,
+    }
+    return Recommendation(
+        service=name,
+        cpu=cpu,
+        memory_mib=memory,
+        capacity=capacity,
+        min_tasks=min_tasks,
+        max_tasks=max_tasks,
+        mean_tasks=float(counts.mean()),
+        models=models,
+        values=values,
+        warnings=tuple(warnings),
+    )
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:g}"
+
+
+def size_diff(
+    recommendation: Recommendation, current: Dict[Tuple[str, str], HardCodedValue]
+) -> List[str]:
+    """현재 하드코딩 값과 추천 값이 다른 위치의 diff 행"""
+    lines = []
+    changes = sorted(
+        (
+            (current[key], value)
+            for key, value in recommendation.values.items()
+            if key in current and current[key].value != value
+        ),
+        key=lambda change: (change[0].path, change[0].line),
+    )
+    for hard_coded, value in changes:
+        location = f"{hard_coded.path}:{hard_coded.line}"
+        lines.append(
+            f"- {location} {hard_coded.construct} "
+            f"{hard_coded.field}={hard_coded.expression}"
+        )
+        lines.append(f"+ {location} {hard_coded.construct} {hard_coded.field}={value}")
+    return lines
+
+
+def format_report(
+    recommendation: Recommendation,
+    current: Dict[Tuple[str, str], HardCodedValue],
+    quantile: float,
+    headroom: float,
+) -> str:
+    lines = [f"[{recommendation.service}]"]
+    for resource, model in recommendation.models.items():
+        lines.append(
+            f"  {resource:<7} = {model.intercept:.1f} + {model.slope:.3f} x req/min/task "
+            f"(+{model.residual:.1f} at p{format_value(quantile)})"
+        )
+    lines += [
+        f"  size: cpu {recommendation.cpu}, memory {recommendation.memory_mib} MiB "
+        f"-> {recommendation.capacity:.0f} req/min/task at {headroom:.0%} headroom "
+        f"(requests_per_target {recommendation.requests_per_target})",
+        f"  tasks: min {recommendation.min_tasks}, max {recommendation.max_tasks}, "
+        f"mean {recommendation.mean_tasks:.2f}",
+    ]
+    lines += [f"  warning: {warning}" for warning in recommendation.warnings]
+    lines += size_diff(recommendation, current) or ["  (no changes)"]
+    return "\n".join(lines)
+
+
+def plan(
+    metrics_files: Sequence[Tuple[str, str]],
+    quantile: float = 99,
+    headroom: float = 0.3,
+) -> List[Tuple[Recommendation, Dict[Tuple[str, str], HardCodedValue]]]:
+    results = []
+    for name, path in metrics_files:
+        spec = SERVICES[name]
+        current = current_sizes(spec)
+        results.append(
+            (
+                recommend(name, spec, load_metrics(path), current, quantile, headroom),
+                current,
+            )
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--metrics",
+        action="append",
+        required=True,
+        metavar="SERVICE=CSV",
+        help=f"서비스별 지표 파일 ({', '.join(SERVICES)})",
+    )
+    parser.add_argument("--quantile", type=float, default=99)
+    parser.add_argument("--headroom", type=float, default=0.3)
+    args = parser.parse_args()
+
+    metrics_files = [tuple(item.split("=", 1)) for item in args.metrics]
+    unknown = [name for name, _ in metrics_files if name not in SERVICES]
+    if unknown:
+        parser.error(f"unknown service: {', '.join(unknown)}")
+
+    for recommendation, current in plan(metrics_files, args.quantile, args.headroom):
+        print(format_report(recommendation, current, args.quantile, args.headroom))
+
+
+if __name__ == "__main__":
+    main()
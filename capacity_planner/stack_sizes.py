@@ -0,0 +1,302 @@
+"""스택 코드에 하드코딩된 태스크 크기/개수를 AST로 읽습니다.
+
+`cpu=1024 - sidecar_cpu`처럼 지역 변수나 Props 데이터클래스 기본값을 참조하는 식,
+`capacity.search.max_instances`처럼 운영 용량 프로파일을 참조하는 식도 같은 패키지의
+데이터클래스 기본값과 모듈 상수로 풀어서 계산합니다. 오토스케일링이 정하는 태스크 수는
+`profile_sizes`로 `CAPACITY_PROFILES` 항목에서 직접 읽습니다.
+"""
+
+import ast
+import glob
+import operator
+import os
+from collections import ChainMap
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+SIZE_FIELDS = (
+    "cpu",
+    "memory_limit_mib",
+    "gpu_count",
+    "desired_count",
+    "min_capacity",
+    "max_capacity",
+    "desired_capacity",
+)
+OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.FloorDiv: operator.floordiv,
+    ast.Div: operator.truediv,
+}
+
+
+class Unresolved(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class HardCodedValue:
+    path: str
+    line: int
+    construct: str  # construct ID (ID가 변수면 감싸는 함수 이름)
+    field: str
+    expression: str
+    value: Optional[float]  # 계산할 수 없으면 None
+
+
+def evaluate(node: ast.AST, scope) -> float:
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in OPERATORS:
+        return OPERATORS[type(node.op)](
+            evaluate(node.left, scope), evaluate(node.right, scope)
+        )
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -evaluate(node.operand, scope)
+    if isinstance(node, ast.Name) and isinstance(scope.get(node.id), (int, float)):
+        return scope[node.id]
+    # props.field / capacity.search.max_instances: 매개변수 기본값 데이터클래스의 필드 값
+    if isinstance(node, ast.Attribute):
+        value = _fields(node.value, scope).get(node.attr)
+        if isinstance(value, (int, float)):
+            return value
+    raise Unresolved(ast.unparse(node))
+
+
+def _fields(node: ast.AST, scope) -> dict:
+    if isinstance(node, ast.Name) and isinstance(scope.get(node.id), dict):
+        return scope[node.id]
+    if isinstance(node, ast.Attribute):
+        value = _fields(node.value, scope).get(node.attr)
+        if isinstance(value, dict):
+            return value
+    raise Unresolved(ast.unparse(node))
+
+
+class PackageValues:
+    """패키지의 데이터클래스 기본값과 모듈 상수 (CAPACITY_PROFILES 등)
+
+    데이터클래스 인스턴스는 {필드: 숫자 또는 중첩 dict}로 표현하며, 숫자로 계산할 수 없는
+    필드(Duration 등)는 제외합니다.
+    """
+
+    def __init__(self, paths: List[str]) -> None:
+        self.classes: Dict[str, List[Tuple[str, ast.AST]]] = {}
+        self.constants: Dict[str, ast.AST] = {}
+        self.sources: Dict[str, str] = {}  # 클래스/상수 이름 -> 정의된 파일
+        for path in paths:
+            with open(path, encoding="utf-8") as source:
+                tree = ast.parse(source.read())
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef):
+                    self.classes[node.name] = [
+                        (statement.target.id, statement.value)
+                        for statement in node.body
+                        if isinstance(statement, ast.AnnAssign)
+                        and statement.value is not None
+                    ]
+                    self.sources[node.name] = path
+                elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                    targets = (
+                        node.targets if isinstance(node, ast.Assign) else [node.target]
+                    )
+                    if (
+                        len(targets) == 1
+                        and isinstance(targets[0], ast.Name)
+                        and node.value is not None
+                    ):
+                        self.constants[targets[0].id] = node.value
+                        self.sources[targets[0].id] = path
+        self._defaults: Dict[str, dict] = {}
+
+    def instance(self, name: str, keywords: List[ast.keyword] = ()) -> dict:
+        """name(**keywords)로 만든 인스턴스의 필드 값"""
+        if name not in self._defaults:
+            self._defaults[name] = {}  # 자기 참조 기본값 방지
+            self._defaults[name] = self._resolved(self.classes[name])
+        return {
+            **self._defaults[name],
+            **self._resolved((keyword.arg, keyword.value) for keyword in keywords),
+        }
+
+    def arguments(self, node: ast.AST, path: str) -> List[Tuple[str, ast.AST, str]]:
+        """데이터클래스 생성식의 (필드, 값 노드, 노드가 있는 파일), 생략한 필드는 기본값 위치"""
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            if node.func.id == "field":
+                factory = next(
+                    (k.value for k in node.keywords if k.arg == "default_factory"), None
+                )
+                if isinstance(factory, ast.Name) and factory.id in self.classes:
+                    return self.arguments(ast.Call(factory, [], []), path)
+            elif node.func.id in self.classes and not node.args:
+                keywords = {keyword.arg: keyword.value for keyword in node.keywords}
+                source = self.sources[node.func.id]
+                return [
+                    (
+                        (name, keywords[name], path)
+                        if name in keywords
+                        else (name, default, source)
+                    )
+                    for name, default in self.classes[node.func.id]
+                ]
+        raise Unresolved(ast.unparse(node))
+
+    def value(self, node: ast.AST):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            if node.func.id in self.classes and not node.args:
+                return self.instance(node.func.id, node.keywords)
+            # field(default_factory=CapacityProfile)
+            if node.func.id == "field":
+                factory = next(
+                    (k.value for k in node.keywords if k.arg == "default_factory"), None
+                )
+                if isinstance(factory, ast.Name) and factory.id in self.classes:
+                    return self.instance(factory.id)
+        if isinstance(node, ast.Dict):
+            return self._resolved(
+                (key.value, value)
+                for key, value in zip(node.keys, node.values)
+                if isinstance(key, ast.Constant)
+            )
+        if isinstance(node, ast.Subscript) and isinstance(node.slice, ast.Constant):
+            container = self.value(node.value)
+            if isinstance(container, dict) and node.slice.value in container:
+                return container[node.slice.value]
+        if isinstance(node, ast.Name) and node.id in self.constants:
+            return self.value(self.constants[node.id])
+        return evaluate(node, {})
+
+    def _resolved(self, items) -> dict:
+        values = {}
+        for key, node in items:
+            try:
+                values[key] = self.value(node)
+            except Unresolved:
+                pass
+        return values
+
+
+class _SizeCollector(ast.NodeVisitor):
+    def __init__(self, path: str, package: PackageValues) -> None:
+        self.path = path
+        self.package = package
+        self.scope = ChainMap({})
+        self.functions: List[str] = []
+        self.values: List[HardCodedValue] = []
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        frame = {}
+        arguments = node.args.args + node.args.kwonlyargs
+        defaults = [None] * (len(node.args.args) - len(node.args.defaults))
+        defaults += node.args.defaults + node.args.kw_defaults
+        for argument, default in zip(arguments, defaults):
+            # log_pipeline: LogPipelineProps = LogPipelineProps()
+            # capacity: CapacityProfile = CAPACITY_PROFILES["prod"]
+            if default is None:
+                continue
+            try:
+                value = self.package.value(default)
+            except Unresolved:
+                continue
+            if isinstance(value, dict):
+                frame[argument.arg] = value
+        self.scope = self.scope.new_child(frame)
+        self.functions.append(node.name)
+        self.generic_visit(node)
+        self.functions.pop()
+        self.scope = self.scope.parents
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                self.scope[node.targets[0].id] = evaluate(node.value, self.scope)
+            except Unresolved:
+                pass
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        keywords = [k for k in node.keywords if k.arg in SIZE_FIELDS]
+        if keywords:
+            construct = self._construct_id(node)
+            for keyword in keywords:
+                try:
+                    value = evaluate(keyword.value, self.scope)
+                except Unresolved:
+                    value = None
+                self.values.append(
+                    HardCodedValue(
+                        path=self.path,
+                        line=keyword.value.lineno,
+                        construct=construct,
+                        field=keyword.arg,
+                        expression=ast.unparse(keyword.value),
+                        value=value,
+                    )
+                )
+        self.generic_visit(node)
+
+    def _construct_id(self, node: ast.Call) -> str:
+        # add_container("Name", ...) / Construct(self, "Id", ...)
+        is_method = isinstance(node.func, ast.Attribute) and node.func.attr.startswith(
+            "add_"
+        )
+        args = node.args if is_method else node.args[1:]
+        if args and isinstance(args[0], ast.Constant):
+            return str(args[0].value)
+        return self.functions[-1] if self.functions else "<module>"
+
+
+def hard_coded_sizes(
+    path: str, package_dir: Optional[str] = None
+) -> List[HardCodedValue]:
+    """스택 파일의 크기/개수 키워드 인자 목록"""
+    package_dir = package_dir or os.path.dirname(path)
+    package = PackageValues(sorted(glob.glob(os.path.join(package_dir, "*.py"))))
+    with open(path, encoding="utf-8") as source:
+        tree = ast.parse(source.read())
+    collector = _SizeCollector(path, package)
+    collector.visit(tree)
+    return collector.values
+
+
+def profile_sizes(
+    path: str, profile: str = "prod", package_dir: Optional[str] = None
+) -> List[HardCodedValue]:
+    """CAPACITY_PROFILES[profile]의 서비스별 용량 값
+
+    construct는 스택 코드의 참조식과 같은 `capacity.<서비스>`이며, 프로파일에서 생략한 필드는
+    데이터클래스 기본값의 위치를 가리킵니다.
+    """
+    package_dir = package_dir or os.path.dirname(path)
+    package = PackageValues(sorted(glob.glob(os.path.join(package_dir, "*.py"))))
+    profiles = package.constants["CAPACITY_PROFILES"]
+    entry = next(
+        value
+        for key, value in zip(profiles.keys, profiles.values)
+        if isinstance(key, ast.Constant) and key.value == profile
+    )
+    values = []
+    for service, service_node, service_path in package.arguments(entry, path):
+        try:
+            fields = package.arguments(service_node, service_path)
+        except Unresolved:
+            continue
+        for field, node, field_path in fields:
+            try:
+                value = package.value(node)
+            except Unresolved:
+                continue
+            if isinstance(value, (int, float)):
+                values.append(
+                    HardCodedValue(
+                        path=field_path,
+                        line=node.lineno,
+                        construct=f"capacity.{service}",
+                        field=field,
+                        expression=ast.unparse(node),
+                        value=value,
+                    )
+                )
+    return values
@@ -7,10 +7,19 @@ from aws_cdk import aws_lambda_event_sources as lambda_event_sources
 from aws_cdk import aws_sns as sns
 from constructs import Construct
 
+from linked_paper_web_infra.environments import ENVIRONMENTS
+
 
 class EcsDeploymentNotifierStack(Stack):
 
-    def __init__(self, scope: Construct, id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        slack_secret_name: str = ENVIRONMENTS["prod"].slack_webhook_secret_name,
+        **kwargs,
+    ) -> None:
         super().__init__(scope, id, **kwargs)
 
         # SNS Topic 생성
@@ -21,10 +30,11 @@ class EcsDeploymentNotifierStack(Stack):
             self,
             "SlackNotifierLambda",
             runtime=lambda_.Runtime.PYTHON_3_9,
+            architecture=lambda_.Architecture.ARM_64,  # 순수 Python 핸들러 (Graviton)
             handler="deploy_notifier.lambda_handler",
             code=lambda_.Code.from_asset("lambda"),
             environment={
-                "SECRET_NAME": "GlueSlackWebhookURL",  # Secrets Manager의 Webhook URL 키
+                "SECRET_NAME": slack_secret_name,  # Secrets Manager의 Webhook URL 키
                 "SNS_TOPIC_ARN": sns_topic.topic_arn,
             },
         )
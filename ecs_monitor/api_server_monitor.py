@@ -5,24 +5,35 @@ from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as lambda_
 from constructs import Construct
 
+from linked_paper_web_infra.environments import ENVIRONMENTS
+
 
 class ApiServerHealthMonitor(Stack):
-    def __init__(self, scope: Construct, id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        slack_secret_name: str = ENVIRONMENTS["prod"].slack_webhook_secret_name,
+        export_prefix: str = "",  # BackendInfraStack의 export_prefix
+        **kwargs,
+    ) -> None:
         super().__init__(scope, id, **kwargs)
 
         # ECS 클러스터 및 서비스 이름 가져오기
-        cluster_name = Fn.import_value("ApiClusterName")
-        service_name = Fn.import_value("ApiServiceName")
+        cluster_name = Fn.import_value(f"{export_prefix}ApiClusterName")
+        service_name = Fn.import_value(f"{export_prefix}ApiServiceName")
 
         # Lambda 함수 정의
         slack_notifier_lambda = lambda_.Function(
             self,
             "SlackNotifierLambda",
             runtime=lambda_.Runtime.PYTHON_3_9,
+            architecture=lambda_.Architecture.ARM_64,  # 순수 Python 핸들러 (Graviton)
             handler="ecs_health_notifier.lambda_handler",
             code=lambda_.Code.from_asset("lambda"),
             environment={
-                "SECRET_NAME": "GlueSlackWebhookURL",
+                "SECRET_NAME": slack_secret_name,
             },
         )
 
@@ -59,7 +70,7 @@ class ApiServerHealthMonitor(Stack):
             self,
             "CpuAlarm",
             metric=cpu_metric,
-            threshold=0.8,  # % 사용량 기준
+            threshold=80,  # % 사용량 기준 (CPUUtilization은 0~100 단위)
             evaluation_periods=1,
             alarm_description="Alarm when ECS CPU utilization exceeds 80%",
             comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
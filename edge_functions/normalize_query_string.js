@@ -0,0 +1,38 @@
+// Viewer request 함수: 캐시 키가 파라미터 순서에 따라 갈라지지 않도록
+// 쿼리 스트링을 정규화합니다. (키 정렬, 빈 값 제거)
+// 정규화된 쿼리 스트링이 그대로 오리진에 전달되므로 키의 대소문자와 값은 바꾸지 않습니다.
+function handler(event) {
+    var request = event.request;
+    var querystring = request.querystring;
+    var normalized = {};
+
+    Object.keys(querystring)
+        .sort()
+        .forEach(function (key) {
+            var entry = querystring[key];
+            var values = (entry.multiValue || [entry])
+                .map(function (item) {
+                    return item.value;
+                })
+                .filter(function (value) {
+                    return value.length > 0;
+                });
+
+            if (values.length === 0) {
+                return;
+            }
+            if (values.length === 1) {
+                normalized[key] = { value: values[0] };
+            } else {
+                normalized[key] = {
+                    value: values[0],
+                    multiValue: values.map(function (value) {
+                        return { value: value };
+                    }),
+                };
+            }
+        });
+
+    request.querystring = normalized;
+    return request;
+}
@@ -0,0 +1,21 @@
+// Viewer request 함수: 정적 파일 퍼블리셔가 미리 압축해 둔 .br/.gz 객체를
+// 뷰어의 Accept-Encoding에 맞춰 선택합니다. (static_publisher/publisher.py 참고)
+// CloudFront Function은 객체 존재 여부를 확인할 수 없어 압축본이 없으면 403이 되므로,
+// 이 함수를 연결하기 전에 퍼블리셔로 전체 배포를 한 번 실행해 압축본을 만들어야 합니다.
+var COMPRESSIBLE = /\.(html|css|js|mjs|json|svg|txt|xml|map|webmanifest)$/;
+
+function handler(event) {
+    var request = event.request;
+    var header = request.headers["accept-encoding"];
+    var acceptEncoding = header ? header.value : "";
+
+    if (!COMPRESSIBLE.test(request.uri)) {
+        return request;
+    }
+    if (acceptEncoding.indexOf("br") !== -1) {
+        request.uri += ".br";
+    } else if (acceptEncoding.indexOf("gzip") !== -1) {
+        request.uri += ".gz";
+    }
+    return request;
+}
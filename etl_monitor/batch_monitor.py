@@ -7,20 +7,30 @@ from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as _lambda
 from constructs import Construct
 
+from linked_paper_web_infra.environments import ENVIRONMENTS
+
 
 class BatchFailureAlertStack(Stack):
 
-    def __init__(self, scope: Construct, id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        slack_secret_name: str = ENVIRONMENTS["prod"].slack_webhook_secret_name,
+        **kwargs,
+    ) -> None:
         super().__init__(scope, id, **kwargs)
 
         slack_alert_lambda = _lambda.Function(
             self,
             "SlackAlertLambda",
             runtime=_lambda.Runtime.PYTHON_3_9,
+            architecture=_lambda.Architecture.ARM_64,  # 순수 Python 핸들러 (Graviton)
             handler="batch_alarm.lambda_handler",
             code=_lambda.Code.from_asset("lambda"),
             environment={
-                "SECRET_NAME": "GlueSlackWebhookURL",  # Secrets Manager의 Webhook URL 키
+                "SECRET_NAME": slack_secret_name,  # Secrets Manager의 Webhook URL 키
             },
         )
 
@@ -0,0 +1,32 @@
+-- 로그 레벨 분류 및 debug 로그 샘플링 (fluent-bit.conf의 lua 필터에서 호출)
+
+local sample_rate = tonumber(os.getenv("DEBUG_SAMPLE_RATE") or "0.01")
+math.randomseed(os.time())
+
+local function level_of(record)
+    local level = record["level"] or record["levelname"] or record["severity"]
+    if level ~= nil then
+        return string.lower(tostring(level))
+    end
+
+    local log = string.lower(record["log"] or "")
+    if string.find(log, "error", 1, true) or string.find(log, "traceback", 1, true)
+        or string.find(log, "exception", 1, true) then
+        return "error"
+    elseif string.find(log, "warn", 1, true) then
+        return "warn"
+    elseif string.find(log, "debug", 1, true) then
+        return "debug"
+    end
+    return "info"
+end
+
+function classify(tag, timestamp, record)
+    local level = level_of(record)
+    -- debug 로그는 DEBUG_SAMPLE_RATE 비율만 유지
+    if level == "debug" and math.random() >= sample_rate then
+        return -1, timestamp, record
+    end
+    record["level"] = level
+    return 1, timestamp, record
+end
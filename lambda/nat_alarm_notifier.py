@@ -0,0 +1,71 @@
+import json
+import os
+
+import boto3
+import urllib3
+
+secretsmanager_client = boto3.client("secretsmanager")
+http = urllib3.PoolManager()
+
+
+def lambda_handler(event, context):
+    # Slack Webhook URL 가져오기
+    secret_name = os.environ["SECRET_NAME"]
+    secret_value_response = secretsmanager_client.get_secret_value(SecretId=secret_name)
+    slack_webhook_url = secret_value_response["SecretString"]
+
+    # SNS로 전달된 CloudWatch 알람 메시지 처리
+    for record in event.get("Records", []):
+        alarm = json.loads(record["Sns"]["Message"])
+        alarm_name = alarm.get("AlarmName", "N/A")
+        description = alarm.get("AlarmDescription", "N/A")
+        state_value = alarm.get("NewStateValue", "N/A")
+        reason = alarm.get("NewStateReason", "N/A")
+        timestamp = alarm.get("StateChangeTime", "N/A")
+
+        # 알람 대상 NAT Gateway ID 추출 (단일 지표 또는 이상 탐지 지표)
+        trigger = alarm.get("Trigger", {})
+        metric_name = trigger.get("MetricName")
+        dimensions = trigger.get("Dimensions", [])
+        for query in trigger.get("Metrics", []):
+            metric = query.get("MetricStat", {}).get("Metric")
+            if metric:
+                metric_name = metric.get("MetricName")
+                dimensions = metric.get("Dimensions", [])
+        nat_gateway_id = next(
+            (
+                dimension.get("value")
+                for dimension in dimensions
+                if dimension.get("name") == "NatGatewayId"
+            ),
+            "N/A",
+        )
+
+        # 메시지 포맷팅
+        message = (
+            f"*NAT Gateway Alarm Notification*\n"
+            f"• *알람 이름*: `{alarm_name}`\n"
+            f"• *상태 변경*: `{state_value}`\n"
+            f"• *설명*: {description}\n"
+            f"• *지표*: `{metric_name or 'N/A'}`\n"
+            f"• *NAT Gateway*: `{nat_gateway_id}`\n"
+            f"• *사유*: {reason}\n"
+            f"• *발생 시각*: {timestamp}"
+        )
+
+        # Slack 메시지 전송
+        response = http.request(
+            "POST",
+            slack_webhook_url,
+            body=json.dumps({"text": message}),
+            headers={"Content-Type": "application/json"},
+        )
+
+        # 응답 상태 확인
+        if response.status != 200:
+            raise Exception(f"Slack Webhook 호출 실패. 상태 코드: {response.status}")
+
+    return {
+        "statusCode": 200,
+        "body": json.dumps("Slack notification sent successfully!"),
+    }
@@ -1,33 +1,115 @@
-from aws_cdk import Aws, CfnOutput, Duration, Fn, Stack
+from typing import Optional
+
+from aws_cdk import Aws, CfnOutput, Duration, Stack
 from aws_cdk import aws_apigatewayv2 as apigateway
 from aws_cdk import aws_apigatewayv2_integrations as apigateway_integrations
 from aws_cdk import aws_autoscaling as autoscaling
 from aws_cdk import aws_certificatemanager as acm
+from aws_cdk import aws_cloudfront as cloudfront
+from aws_cdk import aws_cloudfront_origins as origins
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_ecs as ecs
 from aws_cdk import aws_ecs_patterns as ecs_patterns
 from aws_cdk import aws_elasticloadbalancingv2 as elbv2
 from aws_cdk import aws_iam as iam
+from aws_cdk import aws_logs as logs
 from aws_cdk import aws_route53 as route53
 from aws_cdk import aws_route53_targets as route53_targets
-from aws_cdk import aws_wafv2 as wafv2
 from constructs import Construct
 
+from linked_paper_web_infra.certificates import edge_certificate
+from linked_paper_web_infra.deployment import DeploymentProfile
+from linked_paper_web_infra.environments import ENVIRONMENTS
+from linked_paper_web_infra.log_pipeline import LogPipelineProps, ServiceLogPipeline
+from linked_paper_web_infra.result_cache import ResultCacheProps, SearchResultCache
+from linked_paper_web_infra.runtime_platform import (
+    ArchitectureComparison,
+    RuntimeOptions,
+    runtime_platform,
+    verify_image_architecture,
+)
+from linked_paper_web_infra.scaling import (
+    CAPACITY_PROFILES,
+    CapacityProfile,
+    ServiceAutoScaling,
+)
+from linked_paper_web_infra.search_domain import (
+    SearchDomain,
+    SearchDomainMigration,
+    SearchDomainProps,
+)
+from linked_paper_web_infra.tracing import (
+    ACCESS_LOG_FORMAT,
+    TracingProps,
+    add_trace_collector,
+    tracing_environment,
+)
+from linked_paper_web_infra.vpc_endpoints import PrivateServiceEndpoints
+
+# CloudFront에서 캐시하는 검색 경로 (GET 라우트에만 Cache-Control 설정)
+CACHEABLE_API_PATHS = ("/search", "/correlations")
+
 
 class BackendInfraStack(Stack):
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        *,
+        edge_web_acl_arn: str,
+        api_cache_ttl: Duration = Duration.seconds(60),
+        api_stale_while_revalidate: Duration = Duration.minutes(5),
+        result_cache: Optional[ResultCacheProps] = None,
+        search_domain_props: SearchDomainProps = SearchDomainProps(),
+        search_domain_migration: SearchDomainMigration = ENVIRONMENTS[
+            "prod"
+        ].search_domain_migration,
+        search_deployment: DeploymentProfile = DeploymentProfile(),
+        capacity: CapacityProfile = CAPACITY_PROFILES["prod"],
+        api_runtime: RuntimeOptions = RuntimeOptions(),
+        private_endpoints: bool = False,
+        log_pipeline: LogPipelineProps = LogPipelineProps(),
+        tracing: TracingProps = TracingProps(),
+        vpc_id: Optional[str] = ENVIRONMENTS["prod"].vpc_id,
+        vpc: Optional[ec2.IVpc] = None,  # vpc_id 대신 같은 앱의 VPC를 직접 사용
+        domain_name: str = ENVIRONMENTS["prod"].domain_name,
+        cloudfront_certificate_arn: Optional[str] = ENVIRONMENTS[
+            "prod"
+        ].cloudfront_certificate_arn,
+        # EdgeCertificateStack의 us-east-1 인증서 (지정하면 cloudfront_certificate_arn 대신 사용)
+        cloudfront_certificate: Optional[acm.ICertificate] = None,
+        export_prefix: str = "",
+        **kwargs,
+    ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        # 태스크마다 붙는 사이드카(FireLens 라우터, 트레이스 컬렉터)의 CPU/메모리 몫
+        sidecar_cpu = log_pipeline.router_cpu + tracing.collector_cpu
+        sidecar_memory_mib = (
+            log_pipeline.router_memory_limit_mib + tracing.collector_memory_limit_mib
+        )
+
         # VPC를 명시적 속성으로 가져오기
-        linked_paper_vpc = ec2.Vpc.from_lookup(
-            self, "ExistingVpc", vpc_id="vpc-058b5208a767d5d1c"
+        linked_paper_vpc = vpc or ec2.Vpc.from_lookup(
+            self, "ExistingVpc", vpc_id=vpc_id
         )
+        self.vpc = linked_paper_vpc  # LoadTestStack에서 부하 생성기 배치
         private_subnets = [
             ec2.SubnetSelection(
                 subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS,
                 availability_zones=[linked_paper_vpc.availability_zones[0]],
             ),
         ]
+        # GPU 제약이 없는 API 태스크/VPC Link는 모든 AZ의 Private Subnet에 분산
+        api_subnets = ec2.SubnetSelection(
+            subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
+        )
+
+        # VPC 엔드포인트 (기존 VPC에 이미 엔드포인트를 둔 스택이 없을 때만 활성화)
+        if private_endpoints:
+            PrivateServiceEndpoints(
+                self, "BackendServiceEndpoints", vpc=linked_paper_vpc
+            )
 
         # 보안 그룹 생성 (API 서버와 Search Service 간 통신을 허용하는 보안 그룹)
         api_security_group = ec2.SecurityGroup(
@@ -60,11 +142,15 @@ class BackendInfraStack(Stack):
             assumed_by=iam.ServicePrincipal("ecs-tasks.amazonaws.com"),
         )
 
-        # OpenSearch 접근 권한 추가
-        search_service_task_role.add_managed_policy(
-            iam.ManagedPolicy.from_aws_managed_policy_name(
-                "AmazonOpenSearchServiceFullAccess"
-            )
+        # k-NN 검색용 OpenSearch 도메인 (접근 권한은 Search Service Task Role로 제한)
+        search_domain = SearchDomain(
+            self,
+            "SearchDomain",
+            vpc=linked_paper_vpc,
+            client_security_group=search_service_security_group,
+            client_role=search_service_task_role,
+            props=search_domain_props,
+            migration=search_domain_migration,
         )
 
         # EC2 네트워크 리소스 읽기 권한 추가
@@ -103,9 +189,9 @@ class BackendInfraStack(Stack):
             machine_image=ecs.EcsOptimizedImage.amazon_linux2(
                 ecs.AmiHardwareType.GPU
             ),  # GPU용 ECS 최적화 AMI
-            desired_capacity=2,  # 기본 EC2 인스턴스 개수
-            min_capacity=1,  # 최소 EC2 인스턴스 개수
-            max_capacity=3,  # 최대 EC2 인스턴스 개수 ecs 최대 인스턴스 수 + 배포할 인스턴스
+            desired_capacity=capacity.search.desired_instances,  # 기본 EC2 인스턴스 개수
+            min_capacity=capacity.search.min_instances,  # 최소 EC2 인스턴스 개수
+            max_capacity=capacity.search.max_instances,  # ecs 최대 인스턴스 수 + 배포할 인스턴스
             security_group=search_service_security_group,  # 보안 그룹 재사용
             role=ec2_instance_role,  # EC2 인스턴스에 필요한 IAM 역할
             user_data=user_data,  # GPU 지원 활성화
@@ -126,6 +212,11 @@ class BackendInfraStack(Stack):
             can_containers_access_instance_role=True,  # 컨테이너가 EC2 인스턴스의 역할을 사용할 수 있게 함
         )
 
+        # FireLens 로그 파이프라인 (API/검색 서비스 공용)
+        backend_log_pipeline = ServiceLogPipeline(
+            self, "BackendLogPipeline", props=log_pipeline
+        )
+
         # ECS Task 정의 생성 (EC2 기반)
         search_task_definition = ecs.Ec2TaskDefinition(
             self,
@@ -153,13 +244,24 @@ class BackendInfraStack(Stack):
             ),
             environment={
                 "NODE_ENV": "production",
+                **(
+                    {"OPENSEARCH_ENDPOINT": f"https://{search_domain.endpoint}"}
+                    if search_domain.endpoint
+                    else {}
+                ),
+                "OPENSEARCH_INDEX_SETTINGS": search_domain.index_settings,
+                "OPENSEARCH_VECTOR_MAPPING": search_domain.vector_mapping,
+                **tracing_environment("search-service", tracing.search_sample_rate),
             },
             memory_limit_mib=1024 * 8,  # 8 GB 메모리
-            cpu=1024 * 4,  # 4 vCPU
+            # g4dn.xlarge의 4 vCPU 중 사이드카 몫을 제외
+            cpu=1024 * 4 - sidecar_cpu,
             gpu_count=1,  # GPU 자원 요청
-            logging=ecs.LogDrivers.aws_logs(stream_prefix="SearchService"),
+            logging=backend_log_pipeline.log_driver(),
             port_mappings=[ecs.PortMapping(container_port=8000)],
         )
+        backend_log_pipeline.add_router(search_task_definition, "SearchService")
+        add_trace_collector(search_task_definition, "SearchService", tracing)
 
         # ECS 서비스 생성 (EC2 기반)
         search_service = ecs.Ec2Service(
@@ -167,7 +269,11 @@ class BackendInfraStack(Stack):
             "SearchServiceEC2Service",
             cluster=search_cluster,
             task_definition=search_task_definition,
-            desired_count=1,  # 원하는 태스크 개수
+            desired_count=capacity.search.desired_tasks,  # 원하는 태스크 개수
+            min_healthy_percent=search_deployment.min_healthy_percent,
+            max_healthy_percent=search_deployment.max_healthy_percent,
+            circuit_breaker=search_deployment.circuit_breaker(),
+            health_check_grace_period=search_deployment.health_check_grace_period,
             security_groups=[search_service_security_group],
             vpc_subnets=private_subnets[0],
             placement_constraints=[
@@ -202,10 +308,9 @@ class BackendInfraStack(Stack):
                         vpc=linked_paper_vpc,
                         port=8000,
                         targets=[search_service],
-                        health_check=elbv2.HealthCheck(
-                            path="/",
-                            interval=Duration.seconds(30),
-                        ),
+                        health_check=search_deployment.health_check(),  # 모델 로딩 완료 여부 확인
+                        slow_start=search_deployment.slow_start,
+                        deregistration_delay=search_deployment.deregistration_delay,
                     )
                 ]
             ),
@@ -219,52 +324,86 @@ class BackendInfraStack(Stack):
         # Fargate 클러스터 생성 (API 서버용)
         api_cluster = ecs.Cluster(self, "ApiServiceCluster", vpc=linked_paper_vpc)
 
-        # ECS Task 정의 생성 (API 서버)
-        api_task_definition = ecs.FargateTaskDefinition(
-            self,
-            "ApiServiceTaskDef",
-            memory_limit_mib=2048,  # Task memory limit
-            cpu=1024,  # Task CPU limit
-        )
+        api_environment = {
+            "NODE_ENV": "production",
+            "SEARCH_SERVICE_URL": f"http://{search_service_load_balancer_dns}",  # Search Service URL
+            **tracing_environment("api-service", tracing.api_sample_rate),
+        }
+
+        # 검색 결과 공유 캐시 (선택): API 태스크 간 검색/연관 결과 및 임베딩 재사용
+        if result_cache is not None:
+            search_result_cache = SearchResultCache(
+                self,
+                "SearchResultCache",
+                vpc=linked_paper_vpc,
+                client_security_group=api_security_group,
+                props=result_cache,
+            )
+            api_environment["RESULT_CACHE_URL"] = search_result_cache.endpoint_url
+            api_environment["RESULT_CACHE_TTL_SECONDS"] = str(
+                int(search_result_cache.default_ttl.to_seconds())
+            )
 
-        # ECS Task 정의에 API 서버 컨테이너 추가
-        api_task_definition.add_container(
-            "ApiServiceContainer",
-            image=ecs.ContainerImage.from_registry(
-                f"{Aws.ACCOUNT_ID}.dkr.ecr.{Aws.REGION}.amazonaws.com/api_service_image:latest"
-            ),
-            environment={
-                "NODE_ENV": "production",
-                "SEARCH_SERVICE_URL": f"http://{search_service_load_balancer_dns}",  # Search Service URL
-            },
-            cpu=1024,
-            memory_limit_mib=2048,
-            logging=ecs.LogDrivers.aws_logs(stream_prefix="ApiService"),
-            port_mappings=[ecs.PortMapping(container_port=8080)],
-        )
+        api_image_repository = "api_service_image"
+
+        # ECR 이미지가 선택한 CPU 아키텍처를 지원하는지 확인
+        if api_runtime.verify_image:
+            for architecture in api_runtime.architectures():
+                verify_image_architecture(api_image_repository, "latest", architecture)
+
+        def create_api_task_definition(id: str, architecture: str):
+            # ECS Task 정의 생성 (API 서버)
+            task_definition = ecs.FargateTaskDefinition(
+                self,
+                id,
+                memory_limit_mib=2048,  # Task memory limit
+                cpu=1024,  # Task CPU limit
+                runtime_platform=runtime_platform(architecture),  # X86_64 / ARM64
+            )
 
-        # ECR 접근 권한 추가
-        api_task_definition.add_to_execution_role_policy(
-            iam.PolicyStatement(
-                actions=[
-                    "ecr:GetDownloadUrlForLayer",
-                    "ecr:BatchGetImage",
-                    "ecr:GetAuthorizationToken",
-                ],
-                resources=["*"],
+            # ECS Task 정의에 API 서버 컨테이너 추가
+            task_definition.add_container(
+                "ApiServiceContainer",
+                image=ecs.ContainerImage.from_registry(
+                    f"{Aws.ACCOUNT_ID}.dkr.ecr.{Aws.REGION}.amazonaws.com/{api_image_repository}:latest"
+                ),
+                environment=api_environment,
+                # 태스크 자원 중 사이드카 몫을 제외
+                cpu=1024 - sidecar_cpu,
+                memory_limit_mib=2048 - sidecar_memory_mib,
+                logging=backend_log_pipeline.log_driver(),
+                port_mappings=[ecs.PortMapping(container_port=8080)],
+            )
+            backend_log_pipeline.add_router(task_definition, "ApiService")
+            add_trace_collector(task_definition, "ApiService", tracing)
+
+            # ECR 접근 권한 추가
+            task_definition.add_to_execution_role_policy(
+                iam.PolicyStatement(
+                    actions=[
+                        "ecr:GetDownloadUrlForLayer",
+                        "ecr:BatchGetImage",
+                        "ecr:GetAuthorizationToken",
+                    ],
+                    resources=["*"],
+                )
             )
-        )
 
-        # Add EC2 read-only access for VPC and network resources to the execution role
-        api_task_definition.add_to_task_role_policy(
-            iam.PolicyStatement(
-                actions=[
-                    "ec2:DescribeInstances",
-                    "ec2:DescribeNetworkInterfaces",
-                    "ec2:DescribeSecurityGroups",
-                ],
-                resources=["*"],
+            # Add EC2 read-only access for VPC and network resources to the execution role
+            task_definition.add_to_task_role_policy(
+                iam.PolicyStatement(
+                    actions=[
+                        "ec2:DescribeInstances",
+                        "ec2:DescribeNetworkInterfaces",
+                        "ec2:DescribeSecurityGroups",
+                    ],
+                    resources=["*"],
+                )
             )
+            return task_definition
+
+        api_task_definition = create_api_task_definition(
+            "ApiServiceTaskDef", api_runtime.architecture
         )
 
         # API 서버 Fargate 서비스 생성 (Private Subnet에 배포)
@@ -273,45 +412,81 @@ class BackendInfraStack(Stack):
             "ApiServiceFargateService",
             cluster=api_cluster,
             task_definition=api_task_definition,
-            public_load_balancer=True,  # Public ALB (외부에서 API 서버로 접근 가능)
-            task_subnets=private_subnets[0],
+            public_load_balancer=False,  # Internal ALB (API Gateway VPC Link로만 접근)
+            open_listener=False,  # 리스너는 VPC Link 보안 그룹에만 개방
+            task_subnets=api_subnets,
             security_groups=[api_security_group],
         )
 
-        # Auto Scaling 설정 (API 서버)
-        api_scalable_target = api_service.service.auto_scale_task_count(
-            min_capacity=1,
-            max_capacity=2,
+        # 헬스 체크 주기 단축 (기본 30초 x 5회 -> 비정상 태스크를 약 30초 안에 제외)
+        api_service.target_group.configure_health_check(
+            interval=Duration.seconds(10),
+            timeout=Duration.seconds(5),
+            healthy_threshold_count=2,
+            unhealthy_threshold_count=3,
         )
 
-        api_scalable_target.scale_on_cpu_utilization(
-            "CpuScaling",
-            target_utilization_percent=100,  # 목표 CPU 사용률 90%
-            scale_in_cooldown=Duration.seconds(30),  # 스케일 인 쿨다운 (30초)
-            scale_out_cooldown=Duration.seconds(10),  # 스케일 아웃 쿨다운 (10초)
-        )
+        # LoadTestStack의 부하 대상 (CloudFront/WAF를 거치지 않는 내부 ALB)
+        self.api_load_balancer = api_service.load_balancer
+
+        # Auto Scaling 설정 (요청 수 + p99 응답 시간 + CPU 여유 + 피크 사전 확장)
+        ServiceAutoScaling(
+            self,
+            "ApiServiceScaling",
+            service=api_service,
+            profile=capacity.api,
+        )
+
+        # 아키텍처 비교용 태스크 세트 (가중치 기반 트래픽 분할)
+        if api_runtime.compares_architectures:
+            ArchitectureComparison(
+                self,
+                "ApiServiceArchitectureComparison",
+                service=api_service,
+                task_definition=create_api_task_definition(
+                    "ApiServiceComparisonTaskDef",
+                    api_runtime.comparison_architecture,
+                ),
+                options=api_runtime,
+                port=8080,
+                vpc_subnets=api_subnets,
+            )
 
         # Route53 호스팅 영역 가져오기
         hosted_zone = route53.HostedZone.from_lookup(
-            self, "LinkedPaperHostedZone", domain_name="linked-paper.com"
+            self, "LinkedPaperHostedZone", domain_name=domain_name
         )
 
         # ACM 인증서 생성
         api_certificate = acm.Certificate(
             self,
             "ApiServiceCertificate",
-            domain_name="api.linked-paper.com",
+            domain_name=f"api.{domain_name}",
             validation=acm.CertificateValidation.from_dns(hosted_zone),
         )
 
         # Create an API Gateway HTTP API
         api_gateway = apigateway.HttpApi(self, "ApiGateway")
 
+        # HTTP API는 X-Ray 추적을 지원하지 않으므로 액세스 로그로 게이트웨이/통합 구간 지연 시간 기록
+        api_access_log_group = logs.LogGroup(
+            self,
+            "ApiGatewayAccessLogGroup",
+            retention=tracing.access_log_retention,
+        )
+        default_stage = api_gateway.default_stage.node.default_child
+        default_stage.access_log_settings = (
+            apigateway.CfnStage.AccessLogSettingsProperty(
+                destination_arn=api_access_log_group.log_group_arn,
+                format=ACCESS_LOG_FORMAT,
+            )
+        )
+
         # Create a custom domain name for the API Gateway
-        domain_name = apigateway.DomainName(
+        api_domain_name = apigateway.DomainName(
             self,
             "ApiDomainName",
-            domain_name="api.linked-paper.com",
+            domain_name=f"api.{domain_name}",
             certificate=api_certificate,
         )
 
@@ -319,17 +494,38 @@ class BackendInfraStack(Stack):
         apigateway.ApiMapping(
             self,
             "ApiGatewayDomainMapping",
-            domain_name=domain_name,
+            domain_name=api_domain_name,
             api=api_gateway,
             stage=api_gateway.default_stage,
         )
 
-        # Integration with the Load Balancer (Direct DNS approach)
-        lb_dns = api_service.load_balancer.load_balancer_dns_name
+        # VPC Link 보안 그룹 (API Gateway -> Internal ALB 트래픽만 허용)
+        vpc_link_security_group = ec2.SecurityGroup(
+            self,
+            "ApiVpcLinkSecurityGroup",
+            vpc=linked_paper_vpc,
+            allow_all_outbound=True,
+        )
+
+        api_service.load_balancer.connections.allow_from(
+            vpc_link_security_group,
+            ec2.Port.tcp(80),
+        )
+
+        # API Gateway VPC Link 생성 (Private Subnet의 Internal ALB에 연결)
+        vpc_link = apigateway.VpcLink(
+            self,
+            "ApiVpcLink",
+            vpc=linked_paper_vpc,
+            subnets=api_subnets,
+            security_groups=[vpc_link_security_group],
+        )
 
-        lb_integration = apigateway_integrations.HttpUrlIntegration(
+        # Integration with the internal Load Balancer through the VPC Link
+        lb_integration = apigateway_integrations.HttpAlbIntegration(
             "ApiGatewayLoadBalancerIntegration",
-            url=f"http://{lb_dns}/{{proxy}}",  # Correctly forward the path
+            api_service.listener,
+            vpc_link=vpc_link,  # Request path is forwarded as-is
         )
 
         # Add routes for "/search" and "/correlations" paths using a proxy pattern
@@ -339,6 +535,132 @@ class BackendInfraStack(Stack):
             integration=lb_integration,
         )
 
+        # 캐시 가능한 검색 GET 요청 전용 통합 (나머지 경로/메서드는 위 프록시 통합 사용)
+        search_integration = apigateway_integrations.HttpAlbIntegration(
+            "ApiGatewaySearchIntegration",
+            api_service.listener,
+            vpc_link=vpc_link,
+        )
+        cacheable_routes = [
+            route
+            for path in CACHEABLE_API_PATHS
+            for route in api_gateway.add_routes(
+                path=path,
+                methods=[apigateway.HttpMethod.GET],
+                integration=search_integration,
+            )
+        ]
+
+        # 오리진 처리량 한도 (CloudFront 캐시 미스만 도달, 초과 요청은 429)
+        default_stage.default_route_settings = (
+            apigateway.CfnStage.RouteSettingsProperty(
+                throttling_rate_limit=capacity.origin.default.rate_limit,
+                throttling_burst_limit=capacity.origin.default.burst_limit,
+            )
+        )
+        default_stage.route_settings = {
+            "GET /search": {
+                "ThrottlingRateLimit": capacity.origin.search.rate_limit,
+                "ThrottlingBurstLimit": capacity.origin.search.burst_limit,
+            }
+        }
+        # 라우트별 설정은 라우트가 만들어진 뒤에 적용할 수 있음
+        default_stage.node.add_dependency(*cacheable_routes)
+
+        # 검색 응답 캐시 헤더 설정 (CloudFront가 짧은 TTL + stale-while-revalidate로 캐시)
+        search_cfn_integration = next(
+            child
+            for child in api_gateway.node.find_all()
+            if isinstance(child, apigateway.CfnIntegration)
+            and "/ApiGatewaySearchIntegration/" in child.node.path
+        )
+        search_cfn_integration.add_property_override(
+            "ResponseParameters",
+            {
+                "200": {
+                    "overwrite:header.Cache-Control": (
+                        f"public, max-age=0, s-maxage={api_cache_ttl.to_seconds()}, "
+                        f"stale-while-revalidate={api_stale_while_revalidate.to_seconds()}"
+                    )
+                }
+            },
+        )
+
+        # 쿼리 스트링 정규화 CloudFront Function (캐시 적중률 향상)
+        normalize_query_function = cloudfront.Function(
+            self,
+            "ApiNormalizeQueryFunction",
+            code=cloudfront.FunctionCode.from_file(
+                file_path="edge_functions/normalize_query_string.js"
+            ),
+            runtime=cloudfront.FunctionRuntime.JS_2_0,
+        )
+
+        # 검색 결과 캐시 정책 (정규화된 쿼리 스트링 기준, 짧은 TTL)
+        api_cache_policy = cloudfront.CachePolicy(
+            self,
+            "ApiSearchCachePolicy",
+            comment="Short-lived cache for /search and /correlations GET responses",
+            query_string_behavior=cloudfront.CacheQueryStringBehavior.all(),
+            header_behavior=cloudfront.CacheHeaderBehavior.none(),
+            cookie_behavior=cloudfront.CacheCookieBehavior.none(),
+            min_ttl=Duration.seconds(0),
+            default_ttl=api_cache_ttl,
+            max_ttl=api_cache_ttl,
+            enable_accept_encoding_gzip=True,
+            enable_accept_encoding_brotli=True,
+        )
+
+        # API Gateway 커스텀 도메인을 오리진으로 사용 (Host 헤더를 전달해 도메인 매핑 유지)
+        api_origin = origins.HttpOrigin(
+            api_domain_name.regional_domain_name,
+            protocol_policy=cloudfront.OriginProtocolPolicy.HTTPS_ONLY,
+            origin_shield_region=self.region,  # 리전 캐시 앞단에서 요청 병합
+        )
+
+        search_cache_behavior = cloudfront.BehaviorOptions(
+            origin=api_origin,
+            allowed_methods=cloudfront.AllowedMethods.ALLOW_ALL,  # GET 외 메서드는 통과
+            cached_methods=cloudfront.CachedMethods.CACHE_GET_HEAD,
+            cache_policy=api_cache_policy,
+            origin_request_policy=cloudfront.OriginRequestPolicy.ALL_VIEWER,
+            viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+            compress=True,
+            function_associations=[
+                cloudfront.FunctionAssociation(
+                    function=normalize_query_function,
+                    event_type=cloudfront.FunctionEventType.VIEWER_REQUEST,
+                )
+            ],
+        )
+
+        # us-east-1에서 발급된 SSL 인증서 사용 (*.domain_name)
+        api_cloudfront_certificate = edge_certificate(
+            self,
+            "ApiCloudFrontCertificate",
+            certificate=cloudfront_certificate,
+            certificate_arn=cloudfront_certificate_arn,
+        )
+
+        # api.linked-paper.com의 진입점 CloudFront 배포
+        api_distribution = cloudfront.Distribution(
+            self,
+            "ApiDistribution",
+            default_behavior=cloudfront.BehaviorOptions(
+                origin=api_origin,
+                allowed_methods=cloudfront.AllowedMethods.ALLOW_ALL,
+                cache_policy=cloudfront.CachePolicy.CACHING_DISABLED,
+                origin_request_policy=cloudfront.OriginRequestPolicy.ALL_VIEWER,
+                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+            ),
+            additional_behaviors={
+                path: search_cache_behavior for path in CACHEABLE_API_PATHS
+            },
+            domain_names=[f"api.{domain_name}"],
+            certificate=api_cloudfront_certificate,
+            web_acl_id=edge_web_acl_arn,  # CLOUDFRONT 범위 WAF (us-east-1)
+        )
+
         # Route53 A Record for api.linked-paper.com
         route53.ARecord(
             self,
@@ -346,48 +668,47 @@ class BackendInfraStack(Stack):
             zone=hosted_zone,
             record_name="api",  # This creates api.linked-paper.com
             target=route53.RecordTarget.from_alias(
-                route53_targets.ApiGatewayv2DomainProperties(
-                    domain_name.regional_domain_name,
-                    domain_name.regional_hosted_zone_id,
-                )
+                route53_targets.CloudFrontTarget(api_distribution)
             ),
         )
 
-        # Import the WAF Web ACL ARN from the WAF stack
-        waf_acl_arn = Fn.import_value("WafAclArn")
+        # Output: API 서버의 Load Balancer DNS
+        CfnOutput(
+            self,
+            "ApiServiceLoadBalancerDNS",
+            value=api_service.load_balancer.load_balancer_dns_name,
+        )
 
-        # WAF Web ACL association with API Gateway
-        wafv2.CfnWebACLAssociation(
+        CfnOutput(
             self,
-            "ApiGatewayWafAssociation",
-            resource_arn=api_service.load_balancer.load_balancer_arn,
-            web_acl_arn=waf_acl_arn,  # Use the imported ARN here
+            "ApiDistributionId",
+            value=api_distribution.distribution_id,
         )
 
-        # Output: API 서버의 Load Balancer DNS
+        # 데이터 이전 대상 (이전 전에는 검색 서비스가 사용하지 않음)
         CfnOutput(
             self,
-            "ApiServiceLoadBalancerDNS",
-            value=api_service.load_balancer.load_balancer_dns_name,
+            "SearchDomainEndpoint",
+            value=search_domain.domain.domain_endpoint,
         )
 
         CfnOutput(
             self,
             "SearchServiceTaskRoleArn",
             value=search_service_task_role.role_arn,
-            export_name="SearchServiceTaskRoleArn",
+            export_name=f"{export_prefix}SearchServiceTaskRoleArn",
         )
 
         CfnOutput(
             self,
             "ApiServiceName",
             value=api_service.service.service_name,
-            export_name="ApiServiceName",
+            export_name=f"{export_prefix}ApiServiceName",
         )
 
         CfnOutput(
             self,
             "ApiClusterName",
             value=api_cluster.cluster_name,
-            export_name="ApiClusterName",
+            export_name=f"{export_prefix}ApiClusterName",
         )
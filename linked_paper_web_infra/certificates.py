@@ -0,0 +1,48 @@
+from typing import Optional
+
+from aws_cdk import Stack
+from aws_cdk import aws_certificatemanager as acm
+from aws_cdk import aws_route53 as route53
+from constructs import Construct
+
+
+class EdgeCertificateStack(Stack):
+    """CloudFront용 us-east-1 인증서 (*.domain_name, domain_name)를 DNS 검증으로 발급
+
+    CloudFront 인증서는 us-east-1에 있어야 하므로 us-east-1 env로 배포하고, 같은 앱의 스택은
+    cross_region_references로 인증서를 참조합니다.
+    """
+
+    def __init__(
+        self, scope: Construct, construct_id: str, *, domain_name: str, **kwargs
+    ) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        hosted_zone = route53.HostedZone.from_lookup(
+            self, "HostedZone", domain_name=domain_name
+        )
+        self.certificate = acm.Certificate(
+            self,
+            "EdgeCertificate",
+            domain_name=f"*.{domain_name}",
+            subject_alternative_names=[domain_name],
+            validation=acm.CertificateValidation.from_dns(hosted_zone),
+        )
+
+
+def edge_certificate(
+    scope: Construct,
+    id: str,
+    *,
+    certificate: Optional[acm.ICertificate] = None,
+    certificate_arn: Optional[str] = None,
+) -> acm.ICertificate:
+    """CloudFront용 us-east-1 인증서 (EdgeCertificateStack 인증서 또는 기존 인증서 ARN)"""
+    if certificate is not None:
+        return certificate
+    if certificate_arn:
+        return acm.Certificate.from_certificate_arn(scope, id, certificate_arn)
+    raise ValueError(
+        "CloudFront needs a us-east-1 certificate: "
+        "pass EdgeCertificateStack.certificate or cloudfront_certificate_arn"
+    )
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+
+from aws_cdk import Duration
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+
+
+@dataclass(frozen=True)
+class DeploymentProfile:
+    """헬스 체크 및 롤링 배포 설정"""
+
+    readiness_path: str = "/health/ready"  # 모델 로딩 완료 후 200을 반환하는 경로
+    health_check_interval: Duration = Duration.seconds(10)
+    health_check_timeout: Duration = Duration.seconds(5)
+    healthy_threshold_count: int = 2
+    unhealthy_threshold_count: int = 3
+    health_check_grace_period: Duration = Duration.minutes(
+        3
+    )  # 컨테이너 기동 + 모델 로딩
+    slow_start: Duration = Duration.seconds(
+        60
+    )  # 신규 태스크로 트래픽을 점진적으로 증가
+    deregistration_delay: Duration = Duration.seconds(30)
+    min_healthy_percent: int = 100  # 배포 중에도 기존 태스크 유지
+    max_healthy_percent: int = 200
+    rollback_on_failure: bool = True  # 배포 실패 시 서킷 브레이커로 롤백
+
+    def health_check(self) -> elbv2.HealthCheck:
+        return elbv2.HealthCheck(
+            path=self.readiness_path,
+            interval=self.health_check_interval,
+            timeout=self.health_check_timeout,
+            healthy_threshold_count=self.healthy_threshold_count,
+            unhealthy_threshold_count=self.unhealthy_threshold_count,
+            healthy_http_codes="200",
+        )
+
+    def circuit_breaker(self) -> ecs.DeploymentCircuitBreaker:
+        return ecs.DeploymentCircuitBreaker(
+            enable=True,
+            rollback=self.rollback_on_failure,
+        )
@@ -0,0 +1,80 @@
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional, Tuple
+
+from linked_paper_web_infra.scaling import CAPACITY_PROFILES, CapacityProfile
+from linked_paper_web_infra.search_domain import SearchDomainMigration
+
+
+@dataclass(frozen=True)
+class EnvironmentConfig:
+    """배포 환경별 설정 (기존 리소스 ID, 도메인, 시크릿 이름, 용량)
+
+    같은 계정에 여러 환경을 배포할 수 있도록 운영 외 환경은 스택 ID, Export 이름,
+    고정 리소스 이름에 환경 이름을 붙입니다.
+    """
+
+    name: str
+    stack_prefix: str = ""  # 스택 ID / Export 이름 접두사 (운영은 빈 문자열)
+    account: Optional[str] = None  # None이면 현재 자격 증명의 계정
+    region: Optional[str] = None  # None이면 기본 리전
+    # BackendInfraStack이 조회할 VPC (None이면 같은 환경의 LinkedPaperWebInfraStack VPC 사용)
+    vpc_id: Optional[str] = None
+    # vpc_id VPC의 NAT Gateway (조회한 VPC에서는 NatGatewayMonitoringStack이 찾을 수 없음)
+    nat_gateway_ids: Tuple[str, ...] = ()
+    # vpc_id VPC에 BackendInfraStack이 VPC 엔드포인트를 생성 (프론트 VPC는 프론트 스택이 생성)
+    private_endpoints: bool = False
+    # Route53 호스팅 영역 (운영 외 환경의 하위 도메인은 위임 필요)
+    domain_name: str = "linked-paper.com"
+    # us-east-1 인증서 (*.domain_name, domain_name). None이면 EdgeCertificateStack에서 발급
+    cloudfront_certificate_arn: Optional[str] = None
+    slack_webhook_secret_name: str = "GlueSlackWebhookURL"  # Secrets Manager
+    capacity: CapacityProfile = field(default_factory=CapacityProfile)
+    # 데이터가 있는 기존 OpenSearch 도메인에서 SearchDomain으로의 이전 상태
+    search_domain_migration: SearchDomainMigration = field(
+        default_factory=SearchDomainMigration
+    )
+    # 내부 API ALB에 부하를 거는 LoadTestStack 배포 여부
+    load_test: bool = False
+
+    def stack_id(self, base: str) -> str:
+        return f"{self.stack_prefix}{base}"
+
+    def resource_name(self, base: str) -> str:
+        """계정/리전 안에서 고유해야 하는 리소스 이름 (로그 그룹 등)"""
+        return base if not self.stack_prefix else f"{base}-{self.name}"
+
+    def resolve(self, account: str, region: str) -> "EnvironmentConfig":
+        """계정/리전이 지정되지 않은 경우 현재 자격 증명 값으로 채움"""
+        return replace(
+            self, account=self.account or account, region=self.region or region
+        )
+
+
+ENVIRONMENTS: Dict[str, EnvironmentConfig] = {
+    "prod": EnvironmentConfig(
+        name="prod",
+        vpc_id="vpc-058b5208a767d5d1c",
+        nat_gateway_ids=("nat-05c30695a91f4edcb",),
+        private_endpoints=True,
+        cloudfront_certificate_arn="arn:aws:acm:us-east-1:058264275251:certificate/ab1b9c1f-8976-4ed7-8979-a0866a0d28b4",
+        capacity=CAPACITY_PROFILES["prod"],
+        # 기존 도메인의 데이터를 이전할 때까지 검색 서비스의 현재 엔드포인트/권한 유지
+        search_domain_migration=SearchDomainMigration(migrated=False),
+    ),
+    "staging": EnvironmentConfig(
+        name="staging",
+        stack_prefix="Staging",
+        domain_name="staging.linked-paper.com",
+        slack_webhook_secret_name="StagingSlackWebhookURL",
+        capacity=CAPACITY_PROFILES["staging"],
+    ),
+    # 운영과 같은 용량의 부하 테스트 환경 (알림은 운영 채널로 보내지 않음)
+    "loadtest": EnvironmentConfig(
+        name="loadtest",
+        stack_prefix="LoadTest",
+        domain_name="loadtest.linked-paper.com",
+        slack_webhook_secret_name="LoadTestSlackWebhookURL",
+        capacity=CAPACITY_PROFILES["loadtest"],
+        load_test=True,
+    ),
+}
@@ -1,7 +1,10 @@
+from typing import Optional
+
 from aws_cdk import Aws, CfnOutput, Duration, RemovalPolicy, Stack
 from aws_cdk import aws_certificatemanager as acm
 from aws_cdk import aws_cloudfront as cloudfront
 from aws_cdk import aws_cloudfront_origins as origins
+from aws_cdk import aws_cloudwatch as cloudwatch
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_ecs as ecs
 from aws_cdk import aws_ecs_patterns as ecs_patterns
@@ -11,41 +14,111 @@ from aws_cdk import aws_route53_targets as targets
 from aws_cdk import aws_s3 as s3
 from constructs import Construct
 
+from linked_paper_web_infra.certificates import edge_certificate
+from linked_paper_web_infra.environments import ENVIRONMENTS
+from linked_paper_web_infra.log_pipeline import LogPipelineProps, ServiceLogPipeline
+from linked_paper_web_infra.runtime_platform import (
+    ArchitectureComparison,
+    RuntimeOptions,
+    runtime_platform,
+    verify_image_architecture,
+)
+from linked_paper_web_infra.scaling import (
+    CAPACITY_PROFILES,
+    CapacityProfile,
+    ServiceAutoScaling,
+)
+from linked_paper_web_infra.vpc_endpoints import PrivateServiceEndpoints
+
 
 class LinkedPaperWebInfraStack(Stack):
 
-    def __init__(self, scope: Construct, construct_id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        *,
+        capacity: CapacityProfile = CAPACITY_PROFILES["prod"],
+        domain_name: str = ENVIRONMENTS["prod"].domain_name,
+        cloudfront_certificate_arn: Optional[str] = ENVIRONMENTS[
+            "prod"
+        ].cloudfront_certificate_arn,
+        # EdgeCertificateStack의 us-east-1 인증서 (지정하면 cloudfront_certificate_arn 대신 사용)
+        cloudfront_certificate: Optional[acm.ICertificate] = None,
+        web_runtime: RuntimeOptions = RuntimeOptions(),
+        cdn_price_class: cloudfront.PriceClass = cloudfront.PriceClass.PRICE_CLASS_200,
+        log_pipeline: LogPipelineProps = LogPipelineProps(),
+        **kwargs,
+    ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
         # VPC 생성
         linked_paper_vpc = ec2.Vpc(self, "LinkedPaperVpc", max_azs=2, nat_gateways=1)
+        self.vpc = linked_paper_vpc  # NatGatewayMonitoringStack에서 NAT Gateway 탐색
+
+        # ECR/S3/Logs/Secrets Manager/STS 호출이 NAT Gateway를 거치지 않도록 VPC 엔드포인트 추가
+        PrivateServiceEndpoints(
+            self, "LinkedPaperServiceEndpoints", vpc=linked_paper_vpc
+        )
 
         # Fargate 클러스터 생성
         linked_paper_cluster = ecs.Cluster(
             self, "LinkedPaperCluster", vpc=linked_paper_vpc
         )
 
-        # ECS Task 정의 생성 (Fargate)
-        task_definition = ecs.FargateTaskDefinition(
-            self,
-            "LinkedPaperTaskDef",
-            memory_limit_mib=1024,  # Task memory limit
-            cpu=512,  # Task CPU limit
+        web_image_repository = "next_production_image"
+
+        # FireLens 로그 파이프라인 (error -> CloudWatch, 전체 -> S3 gzip)
+        web_log_pipeline = ServiceLogPipeline(
+            self, "LinkedPaperLogPipeline", props=log_pipeline
         )
 
-        # ECS task 정의에 컨테이너 추가
-        task_definition.add_container(
-            "LinkedPaperContainer",
-            image=ecs.ContainerImage.from_registry(
-                f"{Aws.ACCOUNT_ID}.dkr.ecr.{Aws.REGION}.amazonaws.com/next_production_image:latest"
-            ),
-            environment={
-                "NODE_ENV": "production",
-            },
-            cpu=256,
-            memory_limit_mib=512,
-            logging=ecs.LogDrivers.aws_logs(stream_prefix="LinkedPaper"),
-            port_mappings=[ecs.PortMapping(container_port=3000, host_port=3000)],
+        # ECR 이미지가 선택한 CPU 아키텍처를 지원하는지 확인
+        if web_runtime.verify_image:
+            for architecture in web_runtime.architectures():
+                verify_image_architecture(web_image_repository, "latest", architecture)
+
+        def create_task_definition(id: str, architecture: str):
+            # ECS Task 정의 생성 (Fargate)
+            task_definition = ecs.FargateTaskDefinition(
+                self,
+                id,
+                memory_limit_mib=1024,  # Task memory limit
+                cpu=512,  # Task CPU limit
+                runtime_platform=runtime_platform(architecture),  # X86_64 / ARM64
+            )
+
+            # ECS task 정의에 컨테이너 추가
+            task_definition.add_container(
+                "LinkedPaperContainer",
+                image=ecs.ContainerImage.from_registry(
+                    f"{Aws.ACCOUNT_ID}.dkr.ecr.{Aws.REGION}.amazonaws.com/{web_image_repository}:latest"
+                ),
+                environment={
+                    "NODE_ENV": "production",
+                },
+                cpu=256,
+                memory_limit_mib=512,
+                logging=web_log_pipeline.log_driver(),
+                port_mappings=[ecs.PortMapping(container_port=3000, host_port=3000)],
+            )
+            web_log_pipeline.add_router(task_definition, "LinkedPaper")
+
+            # ECR 접근 권한 추가
+            task_definition.add_to_execution_role_policy(
+                iam.PolicyStatement(
+                    actions=[
+                        "ecr:GetDownloadUrlForLayer",
+                        "ecr:BatchGetImage",
+                        "ecr:GetAuthorizationToken",
+                    ],
+                    resources=["*"],
+                )
+            )
+            return task_definition
+
+        task_definition = create_task_definition(
+            "LinkedPaperTaskDef", web_runtime.architecture
         )
 
         # Fargate 서비스 생성
@@ -58,57 +131,65 @@ class LinkedPaperWebInfraStack(Stack):
             desired_count=1,
         )
 
-        # ECR 접근 권한 추가
-        next_was_fargate_service.task_definition.add_to_execution_role_policy(
-            iam.PolicyStatement(
-                actions=[
-                    "ecr:GetDownloadUrlForLayer",
-                    "ecr:BatchGetImage",
-                    "ecr:GetAuthorizationToken",
-                ],
-                resources=["*"],
-            )
-        )
-
-        # Auto Scaling 설정
-        scalable_target = next_was_fargate_service.service.auto_scale_task_count(
-            min_capacity=1,  # 최소 컨테이너 개수
-            max_capacity=2,  # 최대 컨테이너 개수
+        # 헬스 체크 주기 단축 (기본 30초 x 5회 -> 비정상 태스크를 약 30초 안에 제외)
+        next_was_fargate_service.target_group.configure_health_check(
+            interval=Duration.seconds(10),
+            timeout=Duration.seconds(5),
+            healthy_threshold_count=2,
+            unhealthy_threshold_count=3,
         )
 
-        scalable_target.scale_on_cpu_utilization(
-            "CpuScaling",
-            target_utilization_percent=100,  # 목표 CPU 사용률 90%
-            scale_in_cooldown=Duration.seconds(30),  # 스케일 인 쿨다운 (30초)
-            scale_out_cooldown=Duration.seconds(10),  # 스케일 아웃 쿨다운 (10초)
+        # Auto Scaling 설정 (요청 수 + p99 응답 시간 + CPU 여유 + 피크 사전 확장)
+        ServiceAutoScaling(
+            self,
+            "LinkedPaperScaling",
+            service=next_was_fargate_service,
+            profile=capacity.web,
         )
 
         # Route53 호스팅 영역 가져오기
         hosted_zone = route53.HostedZone.from_lookup(
-            self, "LinkedPaperHostedZone", domain_name="linked-paper.com"
+            self, "LinkedPaperHostedZone", domain_name=domain_name
         )
 
         # ACM 인증서 생성
         linked_paper_certificate = acm.Certificate(
             self,
             "LinkedPaperCertificate",
-            domain_name="linked-paper.com",
+            domain_name=domain_name,
+            subject_alternative_names=[f"origin.{domain_name}"],  # CloudFront 오리진용
             validation=acm.CertificateValidation.from_dns(hosted_zone),
         )
 
         # ALB에 도메인 연결 (HTTPS용 리스너 설정)
-        next_was_fargate_service.load_balancer.add_listener(
+        https_listener = next_was_fargate_service.load_balancer.add_listener(
             "HttpsListener",
             port=443,
             certificates=[linked_paper_certificate],
             default_target_groups=[next_was_fargate_service.target_group],
         )
 
-        # Route53 A 레코드 생성
+        # 아키텍처 비교용 태스크 세트 (가중치 기반 트래픽 분할)
+        if web_runtime.compares_architectures:
+            ArchitectureComparison(
+                self,
+                "LinkedPaperArchitectureComparison",
+                service=next_was_fargate_service,
+                task_definition=create_task_definition(
+                    "LinkedPaperComparisonTaskDef",
+                    web_runtime.comparison_architecture,
+                ),
+                options=web_runtime,
+                port=3000,
+                listeners=[https_listener],
+            )
+
+        # CloudFront 오리진용 레코드 (origin.linked-paper.com -> ALB)
         route53.ARecord(
             self,
-            "LinkedPaperRecord",
+            "LinkedPaperOriginRecord",
             zone=hosted_zone,
+            record_name="origin",
             target=route53.RecordTarget.from_alias(
                 targets.LoadBalancerTarget(next_was_fargate_service.load_balancer)
             ),
@@ -123,23 +204,277 @@ class LinkedPaperWebInfraStack(Stack):
         )
 
         # us-east-1에서 발급된 SSL 인증서 사용
-        cloudfront_certificate = acm.Certificate.from_certificate_arn(
+        cloudfront_certificate = edge_certificate(
             self,
             "CloudFrontCertificate",
-            certificate_arn="arn:aws:acm:us-east-1:058264275251:certificate/ab1b9c1f-8976-4ed7-8979-a0866a0d28b4",
+            certificate=cloudfront_certificate,
+            certificate_arn=cloudfront_certificate_arn,
+        )
+
+        web_origin = origins.HttpOrigin(
+            f"origin.{domain_name}",
+            protocol_policy=cloudfront.OriginProtocolPolicy.HTTPS_ONLY,
+        )
+
+        # ISR/SSR 페이지: 오리진의 Cache-Control(s-maxage)을 따르고 기본적으로 캐시하지 않음
+        page_cache_policy = cloudfront.CachePolicy(
+            self,
+            "LinkedPaperPageCachePolicy",
+            comment="Next.js ISR/SSR pages, honors origin Cache-Control",
+            query_string_behavior=cloudfront.CacheQueryStringBehavior.all(),
+            header_behavior=cloudfront.CacheHeaderBehavior.allow_list(
+                "RSC", "Next-Router-Prefetch", "Next-Router-State-Tree", "Next-Url"
+            ),
+            cookie_behavior=cloudfront.CacheCookieBehavior.none(),
+            min_ttl=Duration.seconds(0),
+            default_ttl=Duration.seconds(0),
+            max_ttl=Duration.days(365),
+            enable_accept_encoding_gzip=True,
+            enable_accept_encoding_brotli=True,
+        )
+
+        # 이미지 최적화: 원본 URL/크기/품질과 Accept(webp/avif)별로 캐시
+        image_cache_policy = cloudfront.CachePolicy(
+            self,
+            "LinkedPaperImageCachePolicy",
+            comment="Next.js image optimization responses",
+            query_string_behavior=cloudfront.CacheQueryStringBehavior.allow_list(
+                "url", "w", "q"
+            ),
+            header_behavior=cloudfront.CacheHeaderBehavior.allow_list("Accept"),
+            cookie_behavior=cloudfront.CacheCookieBehavior.none(),
+            min_ttl=Duration.seconds(0),
+            default_ttl=Duration.days(1),
+            max_ttl=Duration.days(365),
+            enable_accept_encoding_gzip=True,
+            enable_accept_encoding_brotli=True,
+        )
+
+        # linked-paper.com CloudFront 배포 (ALB를 오리진으로 사용, 캐시 미스와 동적 요청만 Next.js로 전달)
+        web_distribution = cloudfront.Distribution(
+            self,
+            "LinkedPaperWebDistribution",
+            default_behavior=cloudfront.BehaviorOptions(
+                origin=web_origin,
+                allowed_methods=cloudfront.AllowedMethods.ALLOW_ALL,
+                cache_policy=page_cache_policy,
+                origin_request_policy=cloudfront.OriginRequestPolicy.ALL_VIEWER,
+                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                compress=True,
+            ),
+            additional_behaviors={
+                # 해시된 빌드 산출물 (immutable)
+                "/_next/static/*": cloudfront.BehaviorOptions(
+                    origin=web_origin,
+                    allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
+                    cache_policy=cloudfront.CachePolicy.CACHING_OPTIMIZED,
+                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                    compress=True,
+                ),
+                "/_next/image*": cloudfront.BehaviorOptions(
+                    origin=web_origin,
+                    allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
+                    cache_policy=image_cache_policy,
+                    viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                    compress=True,
+                ),
+            },
+            domain_names=[domain_name],
+            certificate=cloudfront_certificate,  # us-east-1에서 발급된 인증서 사용
+            http_version=cloudfront.HttpVersion.HTTP2_AND_3,
+        )
+
+        # Route53 A 레코드 생성 (linked-paper.com을 CloudFront로 연결)
+        route53.ARecord(
+            self,
+            "LinkedPaperRecord",
+            zone=hosted_zone,
+            target=route53.RecordTarget.from_alias(
+                targets.CloudFrontTarget(web_distribution)
+            ),
+        )
+
+        # 정적 파일 퍼블리셔가 업로드한 .br/.gz 압축본 선택
+        # (압축본이 없는 객체는 403이 되므로 연결 전에 퍼블리셔로 전체 배포 필요)
+        select_precompressed_function = cloudfront.Function(
+            self,
+            "CdnSelectPrecompressedFunction",
+            code=cloudfront.FunctionCode.from_file(
+                file_path="edge_functions/select_precompressed.js"
+            ),
+            runtime=cloudfront.FunctionRuntime.JS_2_0,
+        )
+
+        # CloudFront 표준 로그 버킷 (표준 로그는 ACL 기반으로 기록됨)
+        cdn_log_bucket = s3.Bucket(
+            self,
+            "CdnLogBucket",
+            object_ownership=s3.ObjectOwnership.OBJECT_WRITER,
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            lifecycle_rules=[s3.LifecycleRule(expiration=Duration.days(90))],
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+        # 정적 파일: 쿼리/헤더/쿠키를 캐시 키에서 제외하고 압축 응답 허용
+        cdn_cache_policy = cloudfront.CachePolicy(
+            self,
+            "CdnStaticCachePolicy",
+            comment=f"cdn.{domain_name} static assets",
+            query_string_behavior=cloudfront.CacheQueryStringBehavior.none(),
+            header_behavior=cloudfront.CacheHeaderBehavior.none(),
+            cookie_behavior=cloudfront.CacheCookieBehavior.none(),
+            min_ttl=Duration.seconds(0),
+            default_ttl=Duration.days(1),
+            max_ttl=Duration.days(365),
+            enable_accept_encoding_gzip=True,
+            enable_accept_encoding_brotli=True,
+        )
+
+        # 웹 페이지에서 폰트/스크립트를 교차 출처로 불러오고 Resource Timing으로 TTFB 측정
+        cdn_response_headers_policy = cloudfront.ResponseHeadersPolicy(
+            self,
+            "CdnResponseHeadersPolicy",
+            comment=f"cdn.{domain_name} CORS, security and timing headers",
+            cors_behavior=cloudfront.ResponseHeadersCorsBehavior(
+                access_control_allow_credentials=False,
+                access_control_allow_headers=["*"],
+                access_control_allow_methods=["GET", "HEAD"],
+                access_control_allow_origins=[f"https://{domain_name}"],
+                access_control_max_age=Duration.days(1),
+                origin_override=True,
+            ),
+            custom_headers_behavior=cloudfront.ResponseCustomHeadersBehavior(
+                custom_headers=[
+                    cloudfront.ResponseCustomHeader(
+                        header="Timing-Allow-Origin",
+                        value=f"https://{domain_name}",
+                        override=True,
+                    )
+                ]
+            ),
+            security_headers_behavior=cloudfront.ResponseSecurityHeadersBehavior(
+                content_type_options=cloudfront.ResponseHeadersContentTypeOptions(
+                    override=True
+                ),
+                strict_transport_security=cloudfront.ResponseHeadersStrictTransportSecurity(
+                    access_control_max_age=Duration.days(365),
+                    include_subdomains=True,
+                    override=True,
+                ),
+            ),
+            server_timing_sampling_rate=10,  # Server-Timing 헤더로 cdn-cache-hit 등 샘플링
+        )
+
+        # S3 오리진 (Origin Shield를 같은 리전에 두어 오리진 요청 집약)
+        cdn_origin = origins.HttpOrigin(
+            static_files_bucket.bucket_regional_domain_name,
+            origin_shield_region=self.region,
         )
 
         # CloudFront 배포 생성 (S3를 오리진으로 사용)
         cloudfront_distribution = cloudfront.Distribution(
             self,
             "LinkedPaperDistribution",
-            default_behavior={
-                "origin": origins.S3Origin(static_files_bucket),
-                "allowed_methods": cloudfront.AllowedMethods.ALLOW_GET_HEAD,
-                "viewer_protocol_policy": cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
-            },
-            domain_names=["cdn.linked-paper.com"],  # CDN 도메인
+            default_behavior=cloudfront.BehaviorOptions(
+                origin=cdn_origin,
+                allowed_methods=cloudfront.AllowedMethods.ALLOW_GET_HEAD,
+                cache_policy=cdn_cache_policy,
+                response_headers_policy=cdn_response_headers_policy,
+                viewer_protocol_policy=cloudfront.ViewerProtocolPolicy.REDIRECT_TO_HTTPS,
+                compress=True,
+                function_associations=[
+                    cloudfront.FunctionAssociation(
+                        function=select_precompressed_function,
+                        event_type=cloudfront.FunctionEventType.VIEWER_REQUEST,
+                    )
+                ],
+            ),
+            domain_names=[f"cdn.{domain_name}"],  # CDN 도메인
             certificate=cloudfront_certificate,  # us-east-1에서 발급된 인증서 사용
+            http_version=cloudfront.HttpVersion.HTTP2_AND_3,
+            price_class=cdn_price_class,  # 기본값 PRICE_CLASS_200 (한국/아시아 엣지 포함)
+            enable_logging=True,
+            log_bucket=cdn_log_bucket,
+            log_file_prefix="cdn/",
+            publish_additional_metrics=True,  # CacheHitRate, OriginLatency 등 추가 지표
+        )
+
+        # Origin Access Control (OAC)로 S3 접근 (CDK L2 미지원으로 L1 + escape hatch 사용)
+        cdn_origin_access_control = cloudfront.CfnOriginAccessControl(
+            self,
+            "CdnOriginAccessControl",
+            origin_access_control_config=cloudfront.CfnOriginAccessControl.OriginAccessControlConfigProperty(
+                name=f"{self.stack_name}-cdn-oac",
+                origin_access_control_origin_type="s3",
+                signing_behavior="always",
+                signing_protocol="sigv4",
+            ),
+        )
+        cfn_cdn_distribution = cloudfront_distribution.node.default_child
+        cfn_cdn_distribution.add_property_deletion_override(
+            "DistributionConfig.Origins.0.CustomOriginConfig"
+        )
+        cfn_cdn_distribution.add_property_override(
+            "DistributionConfig.Origins.0.S3OriginConfig.OriginAccessIdentity", ""
+        )
+        cfn_cdn_distribution.add_property_override(
+            "DistributionConfig.Origins.0.OriginAccessControlId",
+            cdn_origin_access_control.attr_id,
+        )
+
+        # 이 배포에서 서명된 요청만 버킷 객체 읽기 허용
+        static_files_bucket.add_to_resource_policy(
+            iam.PolicyStatement(
+                actions=["s3:GetObject"],
+                principals=[iam.ServicePrincipal("cloudfront.amazonaws.com")],
+                resources=[static_files_bucket.arn_for_objects("*")],
+                conditions={
+                    "StringEquals": {
+                        "AWS:SourceArn": f"arn:aws:cloudfront::{self.account}:distribution/{cloudfront_distribution.distribution_id}"
+                    }
+                },
+            )
+        )
+
+        # CDN 캐시 적중률 대시보드 (CloudFront 지표는 us-east-1, Region=Global)
+        def cdn_metric(metric_name: str, statistic: str = "Average"):
+            return cloudwatch.Metric(
+                namespace="AWS/CloudFront",
+                metric_name=metric_name,
+                dimensions_map={
+                    "DistributionId": cloudfront_distribution.distribution_id,
+                    "Region": "Global",
+                },
+                region="us-east-1",
+                statistic=statistic,
+                period=Duration.minutes(5),
+            )
+
+        cloudwatch.Dashboard(
+            self,
+            "CdnDashboard",
+            widgets=[
+                [
+                    cloudwatch.GraphWidget(
+                        title=f"cdn.{domain_name} cache hit rate (%)",
+                        left=[cdn_metric("CacheHitRate")],
+                        left_y_axis=cloudwatch.YAxisProps(min=0, max=100),
+                    ),
+                    cloudwatch.GraphWidget(
+                        title=f"cdn.{domain_name} origin latency (ms)",
+                        left=[cdn_metric("OriginLatency", "p90")],
+                    ),
+                    cloudwatch.GraphWidget(
+                        title=f"cdn.{domain_name} requests / error rate",
+                        left=[cdn_metric("Requests", "Sum")],
+                        right=[
+                            cdn_metric("4xxErrorRate"),
+                            cdn_metric("5xxErrorRate"),
+                        ],
+                    ),
+                ]
+            ],
         )
 
         # Route53에 A 레코드 생성 (cdn.linked-paper.com을 CloudFront로 연결)
@@ -160,3 +495,32 @@ class LinkedPaperWebInfraStack(Stack):
             value=f"https://{cloudfront_distribution.distribution_domain_name}",
             description="URL of the CloudFront distribution",
         )
+
+        # 정적 파일 퍼블리셔(static_publisher)에서 사용
+        CfnOutput(
+            self,
+            "StaticFilesBucketName",
+            value=static_files_bucket.bucket_name,
+            description=f"Bucket served on cdn.{domain_name}",
+        )
+
+        CfnOutput(
+            self,
+            "CdnDistributionId",
+            value=cloudfront_distribution.distribution_id,
+            description=f"ID of the cdn.{domain_name} CloudFront distribution",
+        )
+
+        CfnOutput(
+            self,
+            "CdnLogBucketName",
+            value=cdn_log_bucket.bucket_name,
+            description=f"CloudFront standard logs for cdn.{domain_name}",
+        )
+
+        CfnOutput(
+            self,
+            "WebDistributionId",
+            value=web_distribution.distribution_id,
+            description=f"ID of the {domain_name} CloudFront distribution",
+        )
@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+
+from aws_cdk import Duration, RemovalPolicy
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_logs as logs
+from aws_cdk import aws_s3 as s3
+from aws_cdk import aws_s3_assets as s3_assets
+from constructs import Construct
+
+# S3에서 설정 파일을 내려받아 포함하는 aws-for-fluent-bit init 이미지
+FLUENT_BIT_INIT_IMAGE = (
+    "public.ecr.aws/aws-observability/aws-for-fluent-bit:init-latest"
+)
+# init 이미지가 S3 파일을 내려받는 경로
+INIT_S3_FILES_DIR = "/init/fluent-bit-init-s3-files"
+
+
+@dataclass(frozen=True)
+class LogPipelineProps:
+    """FireLens(Fluent Bit) 로그 파이프라인 설정"""
+
+    flush_seconds: int = 5  # 배치 전송 주기
+    # 앱 컨테이너 -> 라우터 사이 로그 드라이버 메모리 버퍼 (바이트)
+    driver_buffer_limit: int = 2 * 1024 * 1024
+    mem_buf_limit: str = "16M"  # Fluent Bit 내부 메모리 버퍼 상한
+    router_cpu: int = 64
+    router_memory_reservation_mib: int = 64
+    router_memory_limit_mib: int = 192
+    debug_sample_rate: float = 0.01  # 유지할 debug 로그 비율
+    error_retention: logs.RetentionDays = logs.RetentionDays.ONE_MONTH
+    archive_file_size: str = "50M"
+    archive_upload_timeout: str = "1m"
+    archive_store_limit: str = "256M"  # S3 업로드 대기 로컬 버퍼 상한
+    archive_infrequent_access_after: Duration = Duration.days(30)
+    archive_expiration: Duration = Duration.days(365)
+
+
+class ServiceLogPipeline(Construct):
+    """태스크 정의에 FireLens 사이드카를 추가하고 error는 CloudWatch, 전체 로그는 S3로 보냄"""
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        props: LogPipelineProps = LogPipelineProps(),
+    ) -> None:
+        super().__init__(scope, id)
+        self.props = props
+
+        # 전체 로그 아카이브 (gzip)
+        self.archive_bucket = s3.Bucket(
+            self,
+            "ArchiveBucket",
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            enforce_ssl=True,
+            lifecycle_rules=[
+                s3.LifecycleRule(
+                    transitions=[
+                        s3.Transition(
+                            storage_class=s3.StorageClass.INFREQUENT_ACCESS,
+                            transition_after=props.archive_infrequent_access_after,
+                        )
+                    ],
+                    expiration=props.archive_expiration,
+                )
+            ],
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+        # Fluent Bit 설정과 Lua 필터 (init 이미지가 태스크 역할로 내려받음)
+        self.config_asset = s3_assets.Asset(
+            self, "FluentBitConfig", path="fluent_bit/fluent-bit.conf"
+        )
+        self.lua_asset = s3_assets.Asset(
+            self, "FluentBitLuaFilter", path="fluent_bit/classify_level.lua"
+        )
+
+    def log_driver(self) -> ecs.LogDriver:
+        """앱 컨테이너에서 사용할 FireLens 로그 드라이버 (메모리 버퍼 상한 지정)"""
+        return ecs.LogDrivers.firelens(
+            options={"log-driver-buffer-limit": str(self.props.driver_buffer_limit)}
+        )
+
+    def add_router(
+        self, task_definition: ecs.TaskDefinition, service_name: str
+    ) -> ecs.FirelensLogRouter:
+        """태스크 정의에 FireLens 라우터 추가 (앱 컨테이너를 기본 컨테이너로 두기 위해 나중에 호출)"""
+        props = self.props
+
+        error_log_group = logs.LogGroup(
+            self,
+            f"{task_definition.node.id}ErrorLogGroup",
+            retention=props.error_retention,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+
+        router = task_definition.add_firelens_log_router(
+            "LogRouter",
+            image=ecs.ContainerImage.from_registry(FLUENT_BIT_INIT_IMAGE),
+            firelens_config=ecs.FirelensConfig(
+                type=ecs.FirelensLogRouterType.FLUENTBIT,
+                options=ecs.FirelensOptions(enable_ecs_log_metadata=True),
+            ),
+            essential=True,
+            cpu=props.router_cpu,
+            memory_reservation_mib=props.router_memory_reservation_mib,
+            memory_limit_mib=props.router_memory_limit_mib,
+            environment={
+                "aws_fluent_bit_init_s3_1": self._object_arn(self.config_asset),
+                "aws_fluent_bit_init_s3_2": self._object_arn(self.lua_asset),
+                "LUA_SCRIPT": f"{INIT_S3_FILES_DIR}/{self.lua_asset.s3_object_key}",
+                "SERVICE_NAME": service_name,
+                "FLUSH_SECONDS": str(props.flush_seconds),
+                "MEM_BUF_LIMIT": props.mem_buf_limit,
+                "DEBUG_SAMPLE_RATE": str(props.debug_sample_rate),
+                "ERROR_LOG_GROUP": error_log_group.log_group_name,
+                "ARCHIVE_BUCKET": self.archive_bucket.bucket_name,
+                "ARCHIVE_FILE_SIZE": props.archive_file_size,
+                "ARCHIVE_UPLOAD_TIMEOUT": props.archive_upload_timeout,
+                "ARCHIVE_STORE_LIMIT": props.archive_store_limit,
+            },
+            # 라우터 자체 로그는 짧은 보존 기간으로 CloudWatch에 기록
+            logging=ecs.LogDrivers.aws_logs(
+                stream_prefix=f"{service_name}LogRouter",
+                log_retention=logs.RetentionDays.ONE_WEEK,
+            ),
+        )
+
+        task_role = task_definition.task_role
+        self.config_asset.grant_read(task_role)
+        self.lua_asset.grant_read(task_role)
+        self.archive_bucket.grant_put(task_role)
+        error_log_group.grant_write(task_role)
+        return router
+
+    @staticmethod
+    def _object_arn(asset: s3_assets.Asset) -> str:
+        return f"{asset.bucket.bucket_arn}/{asset.s3_object_key}"
@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+
+from aws_cdk import Duration
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_elasticache as elasticache
+from constructs import Construct
+
+RESULT_CACHE_PORT = 6379
+
+
+@dataclass(frozen=True)
+class ResultCacheProps:
+    """검색/연관 논문 결과 및 임베딩 공유 캐시 설정"""
+
+    engine: str = "valkey"  # "valkey" 또는 "redis"
+    engine_version: str = "7.2"
+    node_type: str = "cache.t4g.medium"  # 노드 메모리 크기 (히트율 기준으로 산정)
+    replicas: int = 1  # 읽기 복제본 수 (0이면 단일 노드)
+    max_memory_policy: str = "allkeys-lru"  # 메모리 초과 시 축출 정책
+    reserved_memory_percent: int = 25  # 백그라운드 저장/복제용 예약 메모리
+    default_ttl: Duration = Duration.minutes(10)  # API 서비스가 사용하는 기본 TTL
+
+
+class SearchResultCache(Construct):
+    """API 태스크들이 공유하는 VPC 내부 결과 캐시 (ElastiCache 복제 그룹)"""
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        vpc: ec2.IVpc,
+        client_security_group: ec2.ISecurityGroup,
+        props: ResultCacheProps,
+    ) -> None:
+        super().__init__(scope, id)
+
+        # 캐시 보안 그룹 (API 서버에서만 접근 허용)
+        self.security_group = ec2.SecurityGroup(
+            self,
+            "SecurityGroup",
+            vpc=vpc,
+            allow_all_outbound=False,
+        )
+        self.security_group.add_ingress_rule(
+            peer=client_security_group,
+            connection=ec2.Port.tcp(RESULT_CACHE_PORT),
+        )
+
+        subnet_group = elasticache.CfnSubnetGroup(
+            self,
+            "SubnetGroup",
+            description="Private subnets for the search result cache",
+            subnet_ids=vpc.select_subnets(
+                subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
+            ).subnet_ids,
+        )
+
+        # 축출 정책 및 메모리 예약 설정
+        parameter_group = elasticache.CfnParameterGroup(
+            self,
+            "ParameterGroup",
+            cache_parameter_group_family=f"{props.engine}{props.engine_version.split('.')[0]}",
+            description="Eviction and memory settings for the search result cache",
+            properties={
+                "maxmemory-policy": props.max_memory_policy,
+                "reserved-memory-percent": str(props.reserved_memory_percent),
+            },
+        )
+
+        replication_group = elasticache.CfnReplicationGroup(
+            self,
+            "ReplicationGroup",
+            replication_group_description="Shared search and correlation result cache",
+            engine=props.engine,
+            engine_version=props.engine_version,
+            cache_node_type=props.node_type,
+            num_cache_clusters=1 + props.replicas,
+            automatic_failover_enabled=props.replicas > 0,
+            multi_az_enabled=props.replicas > 0,
+            cache_subnet_group_name=subnet_group.ref,
+            cache_parameter_group_name=parameter_group.ref,
+            security_group_ids=[self.security_group.security_group_id],
+            port=RESULT_CACHE_PORT,
+            at_rest_encryption_enabled=True,
+            transit_encryption_enabled=True,
+        )
+
+        self.endpoint_address = replication_group.attr_primary_end_point_address
+        self.endpoint_url = f"rediss://{self.endpoint_address}:{RESULT_CACHE_PORT}"
+        self.default_ttl = props.default_ttl
@@ -0,0 +1,164 @@
+import json
+import urllib.request
+from dataclasses import dataclass
+from typing import Optional, Sequence, Set
+
+import boto3
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_ecs_patterns as ecs_patterns
+from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+from constructs import Construct
+
+# ECS CPU 아키텍처 -> 이미지 매니페스트의 architecture 값
+IMAGE_ARCHITECTURES = {
+    "X86_64": "amd64",
+    "ARM64": "arm64",
+}
+
+MANIFEST_MEDIA_TYPES = [
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+    "application/vnd.oci.image.manifest.v1+json",
+]
+
+
+@dataclass(frozen=True)
+class RuntimeOptions:
+    """Fargate 태스크 CPU 아키텍처 설정 (X86_64 / ARM64)"""
+
+    architecture: str = "X86_64"
+    # 지연 시간 비교용 태스크 세트 (예: 기본 X86_64 + 비교 ARM64)
+    comparison_architecture: Optional[str] = None
+    comparison_weight: int = 0  # 비교 태스크 세트로 보낼 트래픽 비율 (%)
+    comparison_desired_count: int = 1
+    verify_image: bool = False  # synth 시 ECR 이미지가 아키텍처를 지원하는지 확인
+
+    def __post_init__(self):
+        for architecture in (self.architecture, self.comparison_architecture):
+            if architecture is not None and architecture not in IMAGE_ARCHITECTURES:
+                raise ValueError(f"Unsupported CPU architecture: {architecture}")
+        if not 0 <= self.comparison_weight <= 100:
+            raise ValueError("comparison_weight must be between 0 and 100")
+
+    @property
+    def compares_architectures(self) -> bool:
+        return self.comparison_architecture is not None and self.comparison_weight > 0
+
+    def architectures(self) -> Sequence[str]:
+        if self.compares_architectures:
+            return [self.architecture, self.comparison_architecture]
+        return [self.architecture]
+
+
+def runtime_platform(architecture: str) -> ecs.RuntimePlatform:
+    return ecs.RuntimePlatform(
+        cpu_architecture=ecs.CpuArchitecture.of(architecture),
+        operating_system_family=ecs.OperatingSystemFamily.LINUX,
+    )
+
+
+def image_architectures(
+    repository_name: str,
+    tag: str,
+    ecr_client=None,
+    urlopen=urllib.request.urlopen,
+) -> Set[str]:
+    """ECR 이미지(또는 멀티 아키텍처 인덱스)가 지원하는 architecture 목록"""
+    ecr_client = ecr_client or boto3.client("ecr")
+    response = ecr_client.batch_get_image(
+        repositoryName=repository_name,
+        imageIds=[{"imageTag": tag}],
+        acceptedMediaTypes=MANIFEST_MEDIA_TYPES,
+    )
+    if not response["images"]:
+        raise ValueError(f"Image {repository_name}:{tag} was not found in ECR")
+
+    manifest = json.loads(response["images"][0]["imageManifest"])
+
+    # 멀티 아키텍처 이미지: 인덱스에 플랫폼이 명시됨
+    if "manifests" in manifest:
+        return {
+            entry["platform"]["architecture"]
+            for entry in manifest["manifests"]
+            if "platform" in entry
+        }
+
+    # 단일 아키텍처 이미지: config blob에서 architecture 확인
+    layer = ecr_client.get_download_url_for_layer(
+        repositoryName=repository_name,
+        layerDigest=manifest["config"]["digest"],
+    )
+    with urlopen(layer["downloadUrl"]) as config_blob:
+        return {json.loads(config_blob.read())["architecture"]}
+
+
+def verify_image_architecture(
+    repository_name: str, tag: str, architecture: str, **kwargs
+) -> None:
+    supported = image_architectures(repository_name, tag, **kwargs)
+    if IMAGE_ARCHITECTURES[architecture] not in supported:
+        raise ValueError(
+            f"Image {repository_name}:{tag} does not support {architecture} "
+            f"(available: {', '.join(sorted(supported))})"
+        )
+
+
+class ArchitectureComparison(Construct):
+    """다른 아키텍처의 태스크 세트를 같은 ALB 뒤에 두고 가중치로 트래픽을 분할"""
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        service: ecs_patterns.ApplicationLoadBalancedFargateService,
+        task_definition: ecs.FargateTaskDefinition,
+        options: RuntimeOptions,
+        port: int,
+        vpc_subnets: Optional[ec2.SubnetSelection] = None,
+        listeners: Sequence[elbv2.ApplicationListener] = (),
+    ) -> None:
+        super().__init__(scope, id)
+
+        self.service = ecs.FargateService(
+            self,
+            "Service",
+            cluster=service.cluster,
+            task_definition=task_definition,
+            desired_count=options.comparison_desired_count,
+            security_groups=service.service.connections.security_groups,
+            vpc_subnets=vpc_subnets,
+        )
+
+        # 아키텍처별 TargetResponseTime을 비교할 수 있도록 별도 타겟 그룹 사용
+        self.target_group = elbv2.ApplicationTargetGroup(
+            self,
+            "TargetGroup",
+            vpc=service.cluster.vpc,
+            port=port,
+            protocol=elbv2.ApplicationProtocol.HTTP,
+            targets=[self.service],
+        )
+
+        weighted_forward = elbv2.ListenerAction.weighted_forward(
+            [
+                elbv2.WeightedTargetGroup(
+                    target_group=service.target_group,
+                    weight=100 - options.comparison_weight,
+                ),
+                elbv2.WeightedTargetGroup(
+                    target_group=self.target_group,
+                    weight=options.comparison_weight,
+                ),
+            ]
+        )
+
+        for index, listener in enumerate([service.listener, *listeners]):
+            listener.add_action(
+                f"WeightedForward{index}",
+                priority=10,
+                conditions=[elbv2.ListenerCondition.path_patterns(["/*"])],
+                action=weighted_forward,
+            )
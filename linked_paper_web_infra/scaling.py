@@ -0,0 +1,187 @@
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+from aws_cdk import Duration, TimeZone
+from aws_cdk import aws_applicationautoscaling as appscaling
+from aws_cdk import aws_ecs_patterns as ecs_patterns
+from constructs import Construct
+
+
+@dataclass(frozen=True)
+class ScheduledPrewarm:
+    """알려진 피크 시간대 전에 최소 태스크 수를 올려두는 스케줄"""
+
+    name: str
+    start: str  # 피크 시작 전 cron 식 (Asia/Seoul 기준)
+    end: str  # 피크 종료 후 기본 최소 용량으로 복귀하는 cron 식
+    min_capacity: int
+
+
+@dataclass(frozen=True)
+class ScalingProfile:
+    """Fargate 서비스 오토스케일링 설정"""
+
+    min_capacity: int = 1
+    max_capacity: int = 4
+    requests_per_target: int = 100  # 태스크당 ALB 요청 수 (1분 합계) 목표
+    cpu_target_percent: int = 60  # 포화 전에 스케일 아웃되도록 CPU 여유 확보
+    # p99 TargetResponseTime(초) 하한별 추가 태스크 수
+    latency_steps: Tuple[Tuple[float, int], ...] = ((0.5, 1), (1.0, 2))
+    scale_in_cooldown: Duration = Duration.seconds(120)
+    scale_out_cooldown: Duration = Duration.seconds(30)
+    prewarm: Tuple[ScheduledPrewarm, ...] = ()
+
+
+@dataclass(frozen=True)
+class GpuCapacity:
+    """검색 서비스 GPU ASG 인스턴스 수와 태스크 수 (인스턴스당 검색 태스크 1개)"""
+
+    min_instances: int = 1
+    desired_instances: int = 2
+    max_instances: int = 3  # 최대 태스크 수 + 롤링 배포용 인스턴스 1대
+    desired_tasks: int = 1
+
+
+@dataclass(frozen=True)
+class RouteThrottle:
+    """API Gateway 라우트 스로틀 (토큰 버킷)"""
+
+    rate_limit: float  # 지속 처리량 (req/s)
+    burst_limit: int
+
+
+@dataclass(frozen=True)
+class OriginThrottle:
+    """검색 서비스가 감당할 수 있는 오리진 처리량
+
+    CloudFront 캐시 히트는 오리진까지 오지 않으므로 전체 처리량 한도는 엣지 WAF가 아니라
+    API Gateway 스테이지에서 적용합니다. 한도를 넘은 요청은 API Gateway가 429로 응답합니다.
+    """
+
+    # GET /search 라우트 (검색 서비스 지속 처리량 약 20 req/s)
+    search: RouteThrottle = field(
+        default_factory=lambda: RouteThrottle(rate_limit=20, burst_limit=40)
+    )
+    # 나머지 라우트 (/correlations 등)
+    default: RouteThrottle = field(
+        default_factory=lambda: RouteThrottle(rate_limit=40, burst_limit=80)
+    )
+
+
+@dataclass(frozen=True)
+class CapacityProfile:
+    """환경별 서비스 용량 프로파일"""
+
+    web: ScalingProfile = field(default_factory=ScalingProfile)
+    api: ScalingProfile = field(default_factory=ScalingProfile)
+    search: GpuCapacity = field(default_factory=GpuCapacity)
+    origin: OriginThrottle = field(default_factory=OriginThrottle)
+
+
+# 평일 오전 업무 시간 대비 사전 확장
+WEEKDAY_MORNING_PREWARM = ScheduledPrewarm(
+    name="WeekdayMorning",
+    start="40 8 ? * MON-FRI *",
+    end="0 19 ? * MON-FRI *",
+    min_capacity=2,
+)
+
+CAPACITY_PROFILES: Dict[str, CapacityProfile] = {
+    "prod": CapacityProfile(
+        web=ScalingProfile(
+            min_capacity=1,
+            max_capacity=6,
+            requests_per_target=300,
+            prewarm=(WEEKDAY_MORNING_PREWARM,),
+        ),
+        api=ScalingProfile(
+            min_capacity=1,
+            max_capacity=6,
+            requests_per_target=150,
+            prewarm=(WEEKDAY_MORNING_PREWARM,),
+        ),
+    ),
+    "staging": CapacityProfile(
+        web=ScalingProfile(max_capacity=2),
+        api=ScalingProfile(max_capacity=2),
+        search=GpuCapacity(desired_instances=1, max_instances=2),
+    ),
+    # 운영과 같은 크기/한도로 부하 테스트 (사전 확장 스케줄 없이 스케일링 반응을 측정)
+    "loadtest": CapacityProfile(
+        web=ScalingProfile(min_capacity=1, max_capacity=6, requests_per_target=300),
+        api=ScalingProfile(min_capacity=1, max_capacity=6, requests_per_target=150),
+    ),
+}
+
+
+class ServiceAutoScaling(Construct):
+    """요청 수, p99 응답 시간, CPU 여유를 함께 사용하는 ALB Fargate 서비스 스케일링"""
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        service: ecs_patterns.ApplicationLoadBalancedFargateService,
+        profile: ScalingProfile,
+    ) -> None:
+        super().__init__(scope, id)
+
+        self.scalable_target = service.service.auto_scale_task_count(
+            min_capacity=profile.min_capacity,
+            max_capacity=profile.max_capacity,
+        )
+
+        # 태스크당 요청 수 기준 Target Tracking
+        self.scalable_target.scale_on_request_count(
+            "RequestCountScaling",
+            requests_per_target=profile.requests_per_target,
+            target_group=service.target_group,
+            scale_in_cooldown=profile.scale_in_cooldown,
+            scale_out_cooldown=profile.scale_out_cooldown,
+        )
+
+        # CPU 여유 기준 Target Tracking
+        self.scalable_target.scale_on_cpu_utilization(
+            "CpuScaling",
+            target_utilization_percent=profile.cpu_target_percent,
+            scale_in_cooldown=profile.scale_in_cooldown,
+            scale_out_cooldown=profile.scale_out_cooldown,
+        )
+
+        # p99 응답 시간 기준 Step Scaling (스케일 인은 Target Tracking에 맡김)
+        first_threshold = profile.latency_steps[0][0]
+        self.scalable_target.scale_on_metric(
+            "LatencyStepScaling",
+            metric=service.target_group.metrics.target_response_time(
+                statistic="p99",
+                period=Duration.minutes(1),
+            ),
+            scaling_steps=[
+                appscaling.ScalingInterval(upper=first_threshold, change=0),
+                *[
+                    appscaling.ScalingInterval(lower=threshold, change=change)
+                    for threshold, change in profile.latency_steps
+                ],
+            ],
+            adjustment_type=appscaling.AdjustmentType.CHANGE_IN_CAPACITY,
+            metric_aggregation_type=appscaling.MetricAggregationType.MAXIMUM,
+            evaluation_periods=2,
+            datapoints_to_alarm=2,
+            cooldown=profile.scale_out_cooldown,
+        )
+
+        # 피크 시간대 사전 확장
+        for prewarm in profile.prewarm:
+            self.scalable_target.scale_on_schedule(
+                f"{prewarm.name}Prewarm",
+                schedule=appscaling.Schedule.expression(f"cron({prewarm.start})"),
+                min_capacity=prewarm.min_capacity,
+                time_zone=TimeZone.ASIA_SEOUL,
+            )
+            self.scalable_target.scale_on_schedule(
+                f"{prewarm.name}Cooldown",
+                schedule=appscaling.Schedule.expression(f"cron({prewarm.end})"),
+                min_capacity=profile.min_capacity,
+                time_zone=TimeZone.ASIA_SEOUL,
+            )
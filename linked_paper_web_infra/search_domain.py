@@ -0,0 +1,216 @@
+import json
+from dataclasses import dataclass
+from typing import Optional
+
+from aws_cdk import RemovalPolicy, Stack
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_logs as logs
+from aws_cdk import aws_opensearchservice as opensearch
+from constructs import Construct
+
+
+@dataclass(frozen=True)
+class SearchDomainProps:
+    """k-NN 검색용 OpenSearch 도메인 설정"""
+
+    engine_version: str = "2.13"
+    master_nodes: int = 3  # 전용 마스터 노드 (홀수 유지)
+    master_node_instance_type: str = "m6g.large.search"
+    data_nodes: int = 2  # 가용 영역 수의 배수
+    data_node_instance_type: str = "r6g.large.search"  # k-NN 그래프는 메모리에 적재됨
+    data_volume_size_gib: int = 100
+    availability_zone_count: int = 2
+    # k-NN 인덱스 설정 (HNSW, faiss 엔진)
+    vector_dimension: int = 768
+    knn_engine: str = "faiss"
+    knn_space_type: str = "innerproduct"  # 정규화된 임베딩 기준 코사인 유사도와 동일
+    knn_m: int = 16
+    knn_ef_construction: int = 256
+    knn_ef_search: int = 100
+    number_of_shards: int = 2
+    number_of_replicas: int = 1
+    refresh_interval: str = "30s"
+    # 슬로우 로그 임계값
+    slow_query_warn_threshold: str = "500ms"
+    slow_query_info_threshold: str = "200ms"
+
+
+@dataclass(frozen=True)
+class SearchDomainMigration:
+    """기존 도메인에서 SearchDomain으로의 데이터 이전 상태
+
+    이전이 끝나기 전(migrated=False)에는 검색 서비스가 데이터가 있는 기존 도메인을 계속
+    사용하고, 새 도메인은 이전 대상으로만 생성됩니다.
+    """
+
+    migrated: bool = True
+    # 기존 도메인 엔드포인트 (https:// 제외). None이면 검색 서비스 설정의 엔드포인트와
+    # 기존 관리형 정책(AmazonOpenSearchServiceFullAccess)을 유지
+    existing_endpoint: Optional[str] = None
+
+
+def domain_name_from_endpoint(endpoint: str) -> str:
+    """vpc-<도메인 이름>-<ID>.<리전>.es.amazonaws.com -> 도메인 이름"""
+    label = endpoint.split(".", 1)[0]
+    for prefix in ("vpc-", "search-"):
+        if label.startswith(prefix):
+            label = label[len(prefix) :]
+            break
+    return label.rsplit("-", 1)[0]
+
+
+def knn_index_settings(props: SearchDomainProps) -> dict:
+    """검색 서비스가 인덱스를 생성할 때 사용하는 index settings"""
+    return {
+        "index.knn": True,
+        "index.knn.algo_param.ef_search": props.knn_ef_search,
+        "index.number_of_shards": props.number_of_shards,
+        "index.number_of_replicas": props.number_of_replicas,
+        "index.refresh_interval": props.refresh_interval,
+        "index.search.slowlog.threshold.query.warn": props.slow_query_warn_threshold,
+        "index.search.slowlog.threshold.query.info": props.slow_query_info_threshold,
+    }
+
+
+def knn_vector_mapping(props: SearchDomainProps) -> dict:
+    """임베딩 필드의 knn_vector 매핑"""
+    return {
+        "type": "knn_vector",
+        "dimension": props.vector_dimension,
+        "method": {
+            "name": "hnsw",
+            "engine": props.knn_engine,
+            "space_type": props.knn_space_type,
+            "parameters": {
+                "m": props.knn_m,
+                "ef_construction": props.knn_ef_construction,
+            },
+        },
+    }
+
+
+class SearchDomain(Construct):
+    """Private Subnet에 배치되는 k-NN 검색용 OpenSearch 도메인"""
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        vpc: ec2.IVpc,
+        client_security_group: ec2.ISecurityGroup,
+        client_role: iam.IRole,
+        props: SearchDomainProps,
+        migration: SearchDomainMigration = SearchDomainMigration(),
+    ) -> None:
+        super().__init__(scope, id)
+
+        # 도메인 보안 그룹 (Search Service에서만 HTTPS 접근 허용)
+        security_group = ec2.SecurityGroup(
+            self,
+            "SecurityGroup",
+            vpc=vpc,
+            allow_all_outbound=False,
+        )
+        security_group.add_ingress_rule(
+            peer=client_security_group,
+            connection=ec2.Port.tcp(443),
+        )
+
+        self.domain = opensearch.Domain(
+            self,
+            "Domain",
+            version=opensearch.EngineVersion.open_search(props.engine_version),
+            vpc=vpc,
+            vpc_subnets=[
+                ec2.SubnetSelection(
+                    subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS,
+                    one_per_az=True,
+                )
+            ],
+            security_groups=[security_group],
+            capacity=opensearch.CapacityConfig(
+                master_nodes=props.master_nodes,
+                master_node_instance_type=props.master_node_instance_type,
+                data_nodes=props.data_nodes,
+                data_node_instance_type=props.data_node_instance_type,
+                multi_az_with_standby_enabled=False,
+            ),
+            ebs=opensearch.EbsOptions(
+                volume_size=props.data_volume_size_gib,
+                volume_type=ec2.EbsDeviceVolumeType.GP3,
+            ),
+            zone_awareness=opensearch.ZoneAwarenessConfig(
+                enabled=True,
+                availability_zone_count=props.availability_zone_count,
+            ),
+            logging=opensearch.LoggingOptions(
+                slow_search_log_enabled=True,
+                slow_search_log_group=logs.LogGroup(
+                    self,
+                    "SlowSearchLogs",
+                    retention=logs.RetentionDays.ONE_MONTH,
+                    removal_policy=RemovalPolicy.DESTROY,
+                ),
+                slow_index_log_enabled=True,
+                slow_index_log_group=logs.LogGroup(
+                    self,
+                    "SlowIndexLogs",
+                    retention=logs.RetentionDays.ONE_MONTH,
+                    removal_policy=RemovalPolicy.DESTROY,
+                ),
+                app_log_enabled=True,
+                app_log_group=logs.LogGroup(
+                    self,
+                    "AppLogs",
+                    retention=logs.RetentionDays.ONE_MONTH,
+                    removal_policy=RemovalPolicy.DESTROY,
+                ),
+            ),
+            encryption_at_rest=opensearch.EncryptionAtRestOptions(enabled=True),
+            node_to_node_encryption=True,
+            enforce_https=True,
+            off_peak_window_enabled=True,
+            removal_policy=RemovalPolicy.RETAIN,  # 삭제 방지
+        )
+
+        # 도메인 접근은 Search Service Task Role로 제한
+        self.domain.add_access_policies(
+            iam.PolicyStatement(
+                principals=[iam.ArnPrincipal(client_role.role_arn)],
+                actions=["es:ESHttp*"],
+                resources=[f"{self.domain.domain_arn}/*"],
+            )
+        )
+        self.domain.grant_read_write(client_role)
+
+        # 검색 서비스가 사용할 엔드포인트 (이전 전에는 기존 도메인, None이면 서비스 설정 유지)
+        self.endpoint: Optional[str] = self.domain.domain_endpoint
+        if not migration.migrated:
+            if migration.existing_endpoint:
+                # from_domain_endpoint는 VPC 엔드포인트의 vpc- 접두사를 도메인 이름에 포함하므로
+                # 도메인 이름을 직접 추출해 ARN 구성
+                existing_domain = opensearch.Domain.from_domain_attributes(
+                    self,
+                    "ExistingDomain",
+                    domain_arn=Stack.of(self).format_arn(
+                        service="es",
+                        resource="domain",
+                        resource_name=domain_name_from_endpoint(
+                            migration.existing_endpoint
+                        ),
+                    ),
+                    domain_endpoint=f"https://{migration.existing_endpoint}",
+                )
+                existing_domain.grant_read_write(client_role)
+                self.endpoint = migration.existing_endpoint
+            else:
+                client_role.add_managed_policy(
+                    iam.ManagedPolicy.from_aws_managed_policy_name(
+                        "AmazonOpenSearchServiceFullAccess"
+                    )
+                )
+                self.endpoint = None
+        self.index_settings = json.dumps(knn_index_settings(props))
+        self.vector_mapping = json.dumps(knn_vector_mapping(props))
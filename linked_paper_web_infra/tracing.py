@@ -0,0 +1,123 @@
+import json
+from dataclasses import dataclass
+from typing import Dict
+
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_logs as logs
+
+# X-Ray로 트레이스를 내보내는 AWS Distro for OpenTelemetry 컬렉터
+ADOT_COLLECTOR_IMAGE = "public.ecr.aws/aws-observability/aws-otel-collector:v0.40.0"
+OTLP_GRPC_PORT = 4317
+OTLP_HTTP_PORT = 4318
+
+# API Gateway HTTP API 액세스 로그 형식 (HTTP API는 X-Ray 추적을 지원하지 않으므로 구간 지연 시간을 기록)
+ACCESS_LOG_FORMAT = json.dumps(
+    {
+        "requestId": "$context.requestId",
+        "requestTime": "$context.requestTimeEpoch",
+        "routeKey": "$context.routeKey",
+        "path": "$context.path",
+        "status": "$context.status",
+        "responseLatency": "$context.responseLatency",
+        "integrationLatency": "$context.integrationLatency",
+        "integrationStatus": "$context.integrationStatus",
+        "integrationError": "$context.integrationErrorMessage",
+    }
+)
+
+
+@dataclass(frozen=True)
+class TracingProps:
+    """서비스별 OpenTelemetry 트레이싱 설정"""
+
+    # 루트 트레이스 샘플링 비율 (하위 구간은 상위 서비스의 샘플링 결정을 따름)
+    api_sample_rate: float = 0.05
+    search_sample_rate: float = 0.05
+    collector_cpu: int = 64
+    collector_memory_reservation_mib: int = 64
+    collector_memory_limit_mib: int = 256
+    access_log_retention: logs.RetentionDays = logs.RetentionDays.ONE_MONTH
+
+
+def collector_config(memory_limit_mib: int) -> str:
+    """OTLP 수신 -> X-Ray 전송 컬렉터 설정 (JSON은 YAML로도 유효하므로 AOT_CONFIG_CONTENT에 그대로 사용)"""
+    return json.dumps(
+        {
+            "receivers": {
+                "otlp": {
+                    "protocols": {
+                        "grpc": {"endpoint": f"0.0.0.0:{OTLP_GRPC_PORT}"},
+                        "http": {"endpoint": f"0.0.0.0:{OTLP_HTTP_PORT}"},
+                    }
+                }
+            },
+            "processors": {
+                # 컨테이너 메모리 한도 전에 수신을 거부해 OOM 방지
+                "memory_limiter": {
+                    "check_interval": "1s",
+                    "limit_mib": int(memory_limit_mib * 0.8),
+                    "spike_limit_mib": int(memory_limit_mib * 0.2),
+                },
+                "resourcedetection": {"detectors": ["env", "ecs"]},
+                "batch": {"timeout": "1s", "send_batch_size": 256},
+            },
+            "exporters": {"awsxray": {"indexed_attributes": ["http.route"]}},
+            "service": {
+                "pipelines": {
+                    "traces": {
+                        "receivers": ["otlp"],
+                        "processors": ["memory_limiter", "resourcedetection", "batch"],
+                        "exporters": ["awsxray"],
+                    }
+                }
+            },
+        }
+    )
+
+
+def tracing_environment(service_name: str, sample_rate: float) -> Dict[str, str]:
+    """앱 컨테이너의 OpenTelemetry SDK 설정 (같은 태스크의 컬렉터로 전송)"""
+    return {
+        "OTEL_SERVICE_NAME": service_name,
+        "OTEL_EXPORTER_OTLP_ENDPOINT": f"http://localhost:{OTLP_HTTP_PORT}",
+        "OTEL_EXPORTER_OTLP_PROTOCOL": "http/protobuf",
+        # 상위 구간이 있으면 그 결정을 따르고, 루트 트레이스만 비율 샘플링
+        "OTEL_TRACES_SAMPLER": "parentbased_traceidratio",
+        "OTEL_TRACES_SAMPLER_ARG": str(sample_rate),
+        # ALB가 붙이는 X-Amzn-Trace-Id와 W3C traceparent를 모두 전파
+        "OTEL_PROPAGATORS": "tracecontext,baggage,xray",
+    }
+
+
+def add_trace_collector(
+    task_definition: ecs.TaskDefinition, service_name: str, props: TracingProps
+) -> ecs.ContainerDefinition:
+    """태스크 정의에 ADOT 컬렉터 사이드카와 X-Ray 전송 권한 추가"""
+    collector = task_definition.add_container(
+        "TraceCollector",
+        image=ecs.ContainerImage.from_registry(ADOT_COLLECTOR_IMAGE),
+        essential=False,  # 컬렉터 장애로 서비스가 중단되지 않도록 함
+        cpu=props.collector_cpu,
+        memory_reservation_mib=props.collector_memory_reservation_mib,
+        memory_limit_mib=props.collector_memory_limit_mib,
+        environment={
+            "AOT_CONFIG_CONTENT": collector_config(props.collector_memory_limit_mib)
+        },
+        logging=ecs.LogDrivers.aws_logs(
+            stream_prefix=f"{service_name}TraceCollector",
+            log_retention=logs.RetentionDays.ONE_WEEK,
+        ),
+    )
+    task_definition.add_to_task_role_policy(
+        iam.PolicyStatement(
+            actions=[
+                "xray:PutTraceSegments",
+                "xray:PutTelemetryRecords",
+                "xray:GetSamplingRules",
+                "xray:GetSamplingTargets",
+            ],
+            resources=["*"],
+        )
+    )
+    return collector
@@ -0,0 +1,62 @@
+from typing import Dict, Optional
+
+from aws_cdk import aws_ec2 as ec2
+from constructs import Construct
+
+# 프라이빗 서브넷의 태스크가 NAT 없이 호출하는 AWS API
+INTERFACE_ENDPOINT_SERVICES: Dict[str, ec2.InterfaceVpcEndpointAwsService] = {
+    "EcrApi": ec2.InterfaceVpcEndpointAwsService.ECR,
+    "EcrDocker": ec2.InterfaceVpcEndpointAwsService.ECR_DOCKER,
+    "Logs": ec2.InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS,
+    "SecretsManager": ec2.InterfaceVpcEndpointAwsService.SECRETS_MANAGER,
+    "Sts": ec2.InterfaceVpcEndpointAwsService.STS,
+}
+
+
+class PrivateServiceEndpoints(Construct):
+    """ECR 이미지 풀, 로그 전송, 시크릿 조회가 NAT Gateway를 거치지 않도록 하는 VPC 엔드포인트"""
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        vpc: ec2.IVpc,
+        subnets: Optional[ec2.SubnetSelection] = None,
+    ) -> None:
+        super().__init__(scope, id)
+
+        subnets = subnets or ec2.SubnetSelection(
+            subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
+        )
+
+        # ECR 이미지 레이어는 S3에 저장되므로 게이트웨이 엔드포인트(무료)로 처리
+        self.s3_endpoint = vpc.add_gateway_endpoint(
+            "S3",
+            service=ec2.GatewayVpcEndpointAwsService.S3,
+            subnets=[subnets],
+        )
+
+        # 인터페이스 엔드포인트 보안 그룹 (VPC 내부 HTTPS만 허용)
+        self.security_group = ec2.SecurityGroup(
+            self,
+            "SecurityGroup",
+            vpc=vpc,
+            description="Interface VPC endpoints (HTTPS from the VPC)",
+            allow_all_outbound=False,
+        )
+        self.security_group.add_ingress_rule(
+            peer=ec2.Peer.ipv4(vpc.vpc_cidr_block),
+            connection=ec2.Port.tcp(443),
+        )
+
+        self.interface_endpoints = {
+            name: vpc.add_interface_endpoint(
+                name,
+                service=service,
+                subnets=subnets,
+                security_groups=[self.security_group],
+                private_dns_enabled=True,
+            )
+            for name, service in INTERFACE_ENDPOINT_SERVICES.items()
+        }
@@ -0,0 +1,112 @@
+"""부하 테스트에서 재생할 /search, /correlations 요청 목록(corpus)을 읽고 만듭니다.
+
+corpus는 한 줄에 요청 하나인 파일입니다. `/search?query=...` 같은 요청 대상 문자열이나
+`{"path": "/search", "params": {"query": "..."}}` 형식의 JSON을 사용할 수 있으며,
+WAF 요청 로그에서 실제 요청을 추출해 만들 수도 있습니다.
+
+    python -m load_generator.corpus waf.log > search.jsonl
+"""
+
+import argparse
+import json
+import random
+import sys
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Sequence
+from urllib.parse import urlencode
+
+from security.waf_log_analyzer import open_log, path_prefix
+
+ENDPOINTS = ("/search", "/correlations")
+
+
+@dataclass(frozen=True)
+class QueryRequest:
+    target: str  # 경로 + 쿼리 스트링
+
+    @property
+    def endpoint(self) -> str:
+        return path_prefix(self.target)
+
+
+def parse_line(line: str) -> Optional[QueryRequest]:
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if not line.startswith("{"):
+        return QueryRequest(line)
+    entry = json.loads(line)
+    params = entry.get("params")
+    query = f"?{urlencode(params, doseq=True)}" if params else ""
+    return QueryRequest(f"{entry['path']}{query}")
+
+
+class QueryCorpus:
+    def __init__(self, requests: Sequence[QueryRequest]) -> None:
+        if not requests:
+            raise ValueError("Query corpus is empty")
+        self.requests = list(requests)
+
+    @classmethod
+    def load(cls, path: str, endpoints: Sequence[str] = ENDPOINTS) -> "QueryCorpus":
+        with open_log(path) as stream:
+            requests = [parse_line(line) for line in stream]
+        return cls(
+            [
+                request
+                for request in requests
+                if request is not None and request.endpoint in endpoints
+            ]
+        )
+
+    def replay(self, seed: int = 0) -> Iterator[QueryRequest]:
+        """seed가 같으면 같은 순서로 반복하는 요청 스트림 (corpus를 섞어 순환)"""
+        generator = random.Random(seed)
+        order = list(self.requests)
+        while True:
+            generator.shuffle(order)
+            yield from order
+
+    def endpoint_mix(self) -> dict:
+        mix = {}
+        for request in self.requests:
+            mix[request.endpoint] = mix.get(request.endpoint, 0) + 1
+        return {endpoint: count / len(self.requests) for endpoint, count in mix.items()}
+
+
+def requests_from_waf_log(
+    lines: Iterable[str], endpoints: Sequence[str] = ENDPOINTS
+) -> Iterator[QueryRequest]:
+    """WAF 로그의 허용된 GET 요청 (uri + args)"""
+    for line in lines:
+        line = line.strip()
+        if not line.startswith("{"):
+            continue
+        record = json.loads(line)
+        http_request = record.get("httpRequest", {})
+        if record.get("action") != "ALLOW" or http_request.get("httpMethod") != "GET":
+            continue
+        uri = http_request.get("uri", "/")
+        if path_prefix(uri) not in endpoints:
+            continue
+        args = http_request.get("args")
+        yield QueryRequest(f"{uri}?{args}" if args else uri)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract a replayable query corpus from WAF request logs"
+    )
+    parser.add_argument("logs", nargs="+", help="WAF log files (.log / .gz, '-')")
+    parser.add_argument("--endpoint", action="append", dest="endpoints")
+    args = parser.parse_args()
+
+    endpoints: List[str] = args.endpoints or list(ENDPOINTS)
+    for path in args.logs:
+        with open_log(path) as stream:
+            for request in requests_from_waf_log(stream, endpoints):
+                sys.stdout.write(f"{request.target}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,519 @@
+"""/search, /correlations에 open-loop 부하를 걸고 지연 시간 분포를 기록합니다.
+
+요청은 이전 응답을 기다리지 않고 도착 일정(고정 간격 또는 포아송)대로 보내며, 지연 시간은
+예정 시각부터 측정해 연결 대기/큐잉 시간까지 포함합니다(coordinated omission 방지).
+단계(--stage 초당 요청 수:초)를 이어 붙여 한 번의 실행으로 처리량 곡선을 얻을 수 있습니다.
+
+    python -m load_generator.generator run http://<api-alb> --corpus search.jsonl \\
+        --stage 20:60 --stage 40:60 --stage 80:60 --output result.json
+    python -m load_generator.generator report result-*.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import ssl
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from load_generator.corpus import QueryCorpus, QueryRequest
+from load_generator.histogram import REPORT_PERCENTILES, LatencyHistogram
+
+# 예정 시각보다 이만큼 늦게 보낸 요청은 생성기 포화로 보고 별도로 집계
+DISPATCH_LAG_WARNING_SECONDS = 0.01
+
+
+@dataclass(frozen=True)
+class Stage:
+    rate: float  # 초당 요청 수
+    duration: float  # 초
+
+    @classmethod
+    def parse(cls, value: str) -> "Stage":
+        """'50:60' -> 초당 50건, 60초"""
+        rate, duration = value.split(":")
+        return cls(float(rate), float(duration))
+
+
+def arrival_times(
+    stages: Sequence[Stage], process: str = "poisson", seed: int = 0
+) -> List[Tuple[int, float]]:
+    """(단계 번호, 시작 기준 예정 시각 초) 목록"""
+    generator = random.Random(seed)
+    arrivals = []
+    stage_start = 0.0
+    for index, stage in enumerate(stages):
+        now = stage_start
+        end = stage_start + stage.duration
+        while stage.rate > 0:
+            if process == "poisson":
+                now += generator.expovariate(stage.rate)
+            else:
+                now += 1 / stage.rate
+            if now >= end:
+                break
+            arrivals.append((index, now))
+        stage_start = end
+    return arrivals
+
+
+class HttpError(Exception):
+    pass
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class HttpClient:
+    """keep-alive HTTP/1.1 GET 클라이언트 (최대 connections개 연결)"""
+
+    def __init__(self, base_url: str, connections: int = 64, timeout: float = 10.0):
+        url = urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if url.scheme == "https" else None
+        self.host_header = url.netloc
+        self.prefix = url.path.rstrip("/")
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(connections)
+        self._idle: List[_Connection] = []
+
+    async def get(self, target: str) -> Tuple[int, int]:
+        """(상태 코드, 본문 바이트 수)"""
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else None
+            try:
+                if connection is None:
+                    connection = _Connection(
+                        *await asyncio.wait_for(
+                            asyncio.open_connection(self.host, self.port, ssl=self.ssl),
+                            self.timeout,
+                        )
+                    )
+                status, length, keep_alive = await asyncio.wait_for(
+                    self._exchange(connection, target), self.timeout
+                )
+            except BaseException:
+                if connection is not None:
+                    connection.close()
+                raise
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                connection.close()
+            return status, length
+
+    async def _exchange(self, connection: _Connection, target: str):
+        connection.writer.write(
+            (
+                f"GET {self.prefix}{target} HTTP/1.1\r\n"
+                f"Host: {self.host_header}\r\n"
+                "Accept: application/json\r\n"
+                "Accept-Encoding: identity\r\n"
+                "User-Agent: linked-paper-load-generator\r\n"
+                "\r\n"
+            ).encode()
+        )
+        await connection.writer.drain()
+
+        status_line = await connection.reader.readline()
+        if not status_line:
+            raise HttpError("Connection closed before the response")
+        try:
+            status = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            raise HttpError(f"Malformed status line: {status_line[:80]!r}") from None
+        headers = {}
+        while True:
+            line = await connection.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            length = await self._read_chunked(connection.reader)
+        elif "content-length" in headers:
+            length = int(headers["content-length"])
+            await connection.reader.readexactly(length)
+        else:
+            length = len(await connection.reader.read())
+            return status, length, False
+        keep_alive = headers.get("connection", "").lower() != "close"
+        return status, length, keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> int:
+        length = 0
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass  # trailer
+                return length
+            await reader.readexactly(size + 2)
+            length += size
+
+    def close(self) -> None:
+        for connection in self._idle:
+            connection.close()
+        self._idle.clear()
+
+
+@dataclass
+class EndpointResult:
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    statuses: Dict[str, int] = field(default_factory=dict)  # 상태 코드 또는 오류 종류
+    bytes: int = 0
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    @property
+    def successes(self) -> int:
+        return sum(
+            count for status, count in self.statuses.items() if status.startswith("2")
+        )
+
+    def merge(self, other: "EndpointResult") -> None:
+        self.latency.merge(other.latency)
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.bytes += other.bytes
+
+    def to_dict(self) -> dict:
+        return {
+            "latency_us": self.latency.to_dict(),
+            "statuses": self.statuses,
+            "bytes": self.bytes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "EndpointResult":
+        return cls(
+            latency=LatencyHistogram.from_dict(data["latency_us"]),
+            statuses=dict(data["statuses"]),
+            bytes=data["bytes"],
+        )
+
+
+@dataclass
+class StageResult:
+    stage: Stage
+    endpoints: Dict[str, EndpointResult] = field(default_factory=dict)
+    late_dispatches: int = 0  # 예정 시각보다 늦게 보낸 요청 (생성기 포화)
+    max_dispatch_lag_us: int = 0
+
+    def endpoint(self, name: str) -> EndpointResult:
+        return self.endpoints.setdefault(name, EndpointResult())
+
+    def total(self) -> EndpointResult:
+        total = EndpointResult()
+        for result in self.endpoints.values():
+            total.merge(result)
+        return total
+
+    def merge(self, other: "StageResult") -> None:
+        for name, result in other.endpoints.items():
+            self.endpoint(name).merge(result)
+        self.late_dispatches += other.late_dispatches
+        self.max_dispatch_lag_us = max(
+            self.max_dispatch_lag_us, other.max_dispatch_lag_us
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "rate": self.stage.rate,
+            "duration": self.stage.duration,
+            "endpoints": {name: r.to_dict() for name, r in self.endpoints.items()},
+            "late_dispatches": self.late_dispatches,
+            "max_dispatch_lag_us": self.max_dispatch_lag_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StageResult":
+        return cls(
+            stage=Stage(data["rate"], data["duration"]),
+            endpoints={
+                name: EndpointResult.from_dict(result)
+                for name, result in data["endpoints"].items()
+            },
+            late_dispatches=data["late_dispatches"],
+            max_dispatch_lag_us=data["max_dispatch_lag_us"],
+        )
+
+
+@dataclass
+class LoadTestResult:
+    target: str
+    stages: List[StageResult]
+    generators: int = 1  # 합쳐진 생성기(태스크) 수
+    labels: Dict[str, str] = field(default_factory=dict)
+
+    def merge(self, other: "LoadTestResult") -> None:
+        """같은 단계 구성으로 동시에 실행한 다른 생성기의 결과를 합침"""
+        if [s.stage for s in self.stages] != [s.stage for s in other.stages]:
+            raise ValueError("Results with different stages cannot be merged")
+        for stage, other_stage in zip(self.stages, other.stages):
+            stage.merge(other_stage)
+        self.generators += other.generators
+
+    def to_dict(self) -> dict:
+        return {
+            "target": self.target,
+            "generators": self.generators,
+            "labels": self.labels,
+            "stages": [stage.to_dict() for stage in self.stages],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LoadTestResult":
+        return cls(
+            target=data["target"],
+            stages=[StageResult.from_dict(stage) for stage in data["stages"]],
+            generators=data["generators"],
+            labels=dict(data.get("labels", {})),
+        )
+
+
+async def _issue(
+    client: HttpClient,
+    request: QueryRequest,
+    scheduled: float,
+    result: StageResult,
+) -> None:
+    endpoint = result.endpoint(request.endpoint)
+    try:
+        status, length = await client.get(request.target)
+        outcome = str(status)
+        endpoint.bytes += length
+    except asyncio.TimeoutError:
+        outcome = "timeout"
+    except (OSError, HttpError, ValueError, asyncio.IncompleteReadError) as error:
+        outcome = type(error).__name__
+    # 예정 시각 기준 지연 시간 (연결 대기 포함)
+    endpoint.latency.record((time.perf_counter() - scheduled) * 1_000_000)
+    endpoint.statuses[outcome] = endpoint.statuses.get(outcome, 0) + 1
+
+
+async def run_load(
+    base_url: str,
+    corpus: QueryCorpus,
+    stages: Sequence[Stage],
+    *,
+    process: str = "poisson",
+    connections: int = 64,
+    timeout: float = 10.0,
+    seed: int = 0,
+) -> LoadTestResult:
+    results = [StageResult(stage) for stage in stages]
+    requests = corpus.replay(seed)
+    client = HttpClient(base_url, connections=connections, timeout=timeout)
+    in_flight = set()
+    start = time.perf_counter()
+    try:
+        for stage_index, offset in arrival_times(stages, process, seed):
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            lag = time.perf_counter() - scheduled
+            stage_result = results[stage_index]
+            if lag > DISPATCH_LAG_WARNING_SECONDS:
+                stage_result.late_dispatches += 1
+            stage_result.max_dispatch_lag_us = max(
+                stage_result.max_dispatch_lag_us, int(lag * 1_000_000)
+            )
+            task = asyncio.ensure_future(
+                _issue(client, next(requests), scheduled, stage_result)
+            )
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.wait(in_flight)
+    finally:
+        client.close()
+    return LoadTestResult(target=base_url, stages=results)
+
+
+def format_report(result: LoadTestResult) -> str:
+    columns = " ".join(f"{'p' + format(p, 'g'):>9}" for p in REPORT_PERCENTILES)
+    lines = [
+        f"target {result.target} ({result.generators} generator(s))",
+        f"{'stage':<14} {'endpoint':<14} {'offered':>8} {'ok/s':>8} {'errors':>7} "
+        f"{columns} {'max':>9}  (ms)",
+    ]
+    for stage_result in result.stages:
+        stage = stage_result.stage
+        name = f"{stage.rate * result.generators:g}/s x {stage.duration:g}s"
+        rows = sorted(stage_result.endpoints.items())
+        rows.append(("all", stage_result.total()))
+        for endpoint, endpoint_result in rows:
+            requests = endpoint_result.requests
+            errors = 1 - endpoint_result.successes / requests if requests else 0
+            latency = endpoint_result.latency
+            values = " ".join(
+                f"{value / 1000:>9.1f}" for value in latency.percentiles().values()
+            )
+            lines.append(
+                f"{name:<14} {endpoint:<14} {requests / stage.duration:>8.1f} "
+                f"{endpoint_result.successes / stage.duration:>8.1f} {errors:>7.2%} "
+                f"{values} {latency.max / 1000:>9.1f}"
+            )
+        if stage_result.late_dispatches:
+            lines.append(
+                f"{'':<14} generator lagged on {stage_result.late_dispatches} requests "
+                f"(max {stage_result.max_dispatch_lag_us / 1000:.1f} ms); "
+                "add tasks for this rate"
+            )
+    return "\n".join(lines)
+
+
+def load_results(paths: Iterable[str]) -> LoadTestResult:
+    """로컬 파일 또는 s3://bucket/prefix/ 아래 결과 JSON을 모두 합침"""
+    documents = []
+    for path in paths:
+        if path.startswith("s3://"):
+            documents += _read_s3_results(path)
+        else:
+            with open(path, encoding="utf-8") as source:
+                documents.append(json.load(source))
+    if not documents:
+        raise ValueError("No load test results found")
+    merged = LoadTestResult.from_dict(documents[0])
+    for document in documents[1:]:
+        merged.merge(LoadTestResult.from_dict(document))
+    return merged
+
+
+def _read_s3_results(uri: str) -> List[dict]:
+    import boto3
+
+    bucket, _, prefix = uri[len("s3://") :].partition("/")
+    s3 = boto3.client("s3")
+    documents = []
+    for page in s3.get_paginator("list_objects_v2").paginate(
+        Bucket=bucket, Prefix=prefix
+    ):
+        for item in page.get("Contents", []):
+            if item["Key"].endswith(".json"):
+                body = s3.get_object(Bucket=bucket, Key=item["Key"])["Body"]
+                documents.append(json.load(body))
+    return documents
+
+
+def _fetch_corpus(uri: str) -> str:
+    """s3:// corpus는 임시 파일로 내려받아 경로를 반환"""
+    if not uri.startswith("s3://"):
+        return uri
+    import boto3
+
+    bucket, _, key = uri[len("s3://") :].partition("/")
+    path = os.path.join("/tmp", os.path.basename(key))
+    boto3.client("s3").download_file(bucket, key, path)
+    return path
+
+
+def _upload_result(result: LoadTestResult, bucket: str, prefix: str) -> str:
+    import boto3
+
+    key = f"{prefix.strip('/')}/{socket.gethostname()}-{uuid.uuid4().hex[:8]}.json"
+    boto3.client("s3").put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=json.dumps(result.to_dict()).encode(),
+        ContentType="application/json",
+    )
+    return f"s3://{bucket}/{key}"
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    # Fargate 태스크에서는 LoadTestStack이 설정한 환경 변수를 기본값으로 사용
+    run = commands.add_parser("run", help="generate load and record latencies")
+    run.add_argument("target", nargs="?", default=os.environ.get("TARGET_URL"))
+    run.add_argument("--corpus", default=os.environ.get("CORPUS_URI"))
+    run.add_argument(
+        "--stage",
+        action="append",
+        dest="stages",
+        type=Stage.parse,
+        help="requests per second per generator:seconds (repeatable)",
+    )
+    run.add_argument("--process", choices=("poisson", "constant"), default="poisson")
+    run.add_argument("--connections", type=int, default=64)
+    run.add_argument("--timeout", type=float, default=10.0)
+    run.add_argument(
+        "--seed",
+        type=int,
+        default=os.environ.get("SEED"),
+        help="replay the arrival schedule and query order of a previous run",
+    )
+    run.add_argument("--output", help="write the JSON result to this file")
+    run.add_argument("--results-bucket", default=os.environ.get("RESULTS_BUCKET"))
+    run.add_argument(
+        "--results-prefix",
+        default=os.environ.get("RESULTS_PREFIX", time.strftime("results/%Y%m%dT%H%M")),
+    )
+    run.add_argument("--label", action="append", default=[], help="key=value")
+
+    report = commands.add_parser("report", help="merge and print results")
+    report.add_argument(
+        "results", nargs="+", help="result files or s3://bucket/prefix/"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "report":
+        print(format_report(load_results(args.results)))
+        return
+
+    if not args.target or not args.corpus:
+        parser.error("target and --corpus are required")
+    # 시드를 지정하지 않으면 태스크마다 다른 일정을 쓰고, 재현할 수 있도록 결과에 기록
+    seed = (
+        int(args.seed)
+        if args.seed is not None
+        else random.SystemRandom().randrange(2**31)
+    )
+    stages = args.stages or [
+        Stage.parse(stage) for stage in os.environ.get("STAGES", "10:60").split(",")
+    ]
+    result = asyncio.run(
+        run_load(
+            args.target,
+            QueryCorpus.load(_fetch_corpus(args.corpus)),
+            stages,
+            process=args.process,
+            connections=args.connections,
+            timeout=args.timeout,
+            seed=seed,
+        )
+    )
+    result.labels = dict(label.split("=", 1) for label in args.label)
+    result.labels["seed"] = str(seed)
+    print(format_report(result))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as target:
+            json.dump(result.to_dict(), target)
+    if args.results_bucket:
+        print(_upload_result(result, args.results_bucket, args.results_prefix))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,149 @@
+"""HdrHistogram과 같은 방식(유효 숫자 단위 log-linear 버킷)으로 지연 시간을 기록합니다.
+
+값은 마이크로초 정수로 기록하며, 같은 설정의 히스토그램은 버킷 배열을 그대로 더해
+태스크별 결과를 합칠 수 있습니다.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterator, Sequence, Tuple
+
+REPORT_PERCENTILES = (50, 90, 99, 99.9, 99.99)
+
+
+@dataclass(frozen=True)
+class HistogramLayout:
+    lowest: int = 1  # 구분 가능한 최소 값 (us)
+    highest: int = 60_000_000  # 기록 가능한 최대 값 (us, 초과 값은 최대 값으로 기록)
+    significant_digits: int = 3
+
+    @property
+    def unit_magnitude(self) -> int:
+        return int(math.floor(math.log2(self.lowest)))
+
+    @property
+    def sub_bucket_count(self) -> int:
+        # 유효 숫자 3자리 -> 2 * 10^3 이상인 2의 거듭제곱 (2048)
+        return 2 ** int(math.ceil(math.log2(2 * 10**self.significant_digits)))
+
+    @property
+    def sub_bucket_half_count_magnitude(self) -> int:
+        return int(math.log2(self.sub_bucket_count)) - 1
+
+    @property
+    def bucket_count(self) -> int:
+        smallest_untrackable = self.sub_bucket_count << self.unit_magnitude
+        buckets = 1
+        while smallest_untrackable <= self.highest:
+            smallest_untrackable <<= 1
+            buckets += 1
+        return buckets
+
+    @property
+    def counts_length(self) -> int:
+        return (self.bucket_count + 1) * (self.sub_bucket_count // 2)
+
+
+class LatencyHistogram:
+    def __init__(self, layout: HistogramLayout = HistogramLayout()) -> None:
+        self.layout = layout
+        self.counts = [0] * layout.counts_length
+        self.total = 0
+        self.sum = 0
+        self.min = 0
+        self.max = 0
+        self.clamped = 0  # highest를 넘어 최대 값으로 기록된 수
+
+        self._unit = layout.unit_magnitude
+        self._half_magnitude = layout.sub_bucket_half_count_magnitude
+        self._half_count = layout.sub_bucket_count // 2
+        self._mask = (layout.sub_bucket_count - 1) << self._unit
+
+    def _index(self, value: int) -> int:
+        bucket = (value | self._mask).bit_length() - (self._half_magnitude + 1)
+        bucket -= self._unit
+        sub_bucket = value >> (bucket + self._unit)
+        return ((bucket + 1) << self._half_magnitude) + (sub_bucket - self._half_count)
+
+    def _bucket_range(self, index: int) -> Tuple[int, int]:
+        """index 버킷의 (최소 값, 같은 버킷으로 기록되는 최대 값)"""
+        bucket = (index >> self._half_magnitude) - 1
+        sub_bucket = (index & (self._half_count - 1)) + self._half_count
+        if bucket < 0:
+            sub_bucket -= self._half_count
+            bucket = 0
+        low = sub_bucket << (bucket + self._unit)
+        return low, low + (1 << (bucket + self._unit)) - 1
+
+    def record(self, value_us: int, count: int = 1) -> None:
+        value = max(int(value_us), 0)
+        if value > self.layout.highest:
+            value = self.layout.highest
+            self.clamped += count
+        self.counts[self._index(value)] += count
+        if self.total == 0 or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.total += count
+        self.sum += value * count
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.layout != self.layout:
+            raise ValueError("Histograms with different layouts cannot be merged")
+        for index, count in other.nonzero():
+            self.counts[index] += count
+        if other.total:
+            self.min = other.min if not self.total else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.total += other.total
+        self.sum += other.sum
+        self.clamped += other.clamped
+
+    def nonzero(self) -> Iterator[Tuple[int, int]]:
+        return ((index, count) for index, count in enumerate(self.counts) if count)
+
+    def percentile(self, percentile: float) -> int:
+        """percentile 이하 비율의 값이 속한 버킷의 최대 값 (HdrHistogram과 같은 기준)"""
+        if not self.total:
+            return 0
+        target = max(1, int(math.ceil(percentile / 100 * self.total)))
+        seen = 0
+        for index, count in self.nonzero():
+            seen += count
+            if seen >= target:
+                return min(self._bucket_range(index)[1], self.max)
+        return self.max
+
+    def percentiles(
+        self, percentiles: Sequence[float] = REPORT_PERCENTILES
+    ) -> Dict[float, int]:
+        return {p: self.percentile(p) for p in percentiles}
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.total if self.total else 0.0
+
+    def to_dict(self) -> dict:
+        """JSON 직렬화용 (0이 아닌 버킷만)"""
+        return {
+            "layout": [
+                self.layout.lowest,
+                self.layout.highest,
+                self.layout.significant_digits,
+            ],
+            "counts": [[index, count] for index, count in self.nonzero()],
+            "total": self.total,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "clamped": self.clamped,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls(HistogramLayout(*data["layout"]))
+        for index, count in data["counts"]:
+            histogram.counts[index] = count
+        for key in ("total", "sum", "min", "max", "clamped"):
+            setattr(histogram, key, data[key])
+        return histogram
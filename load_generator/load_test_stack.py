@@ -0,0 +1,223 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from aws_cdk import CfnOutput, Duration, IgnoreMode, RemovalPolicy, Stack
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_ecr_assets as ecr_assets
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+from aws_cdk import aws_logs as logs
+from aws_cdk import aws_s3 as s3
+from constructs import Construct
+
+from linked_paper_web_infra.runtime_platform import runtime_platform
+from load_generator.generator import Stage
+from security.waf_stack import (
+    RATE_LIMIT_WINDOW_SECONDS,
+    SEARCH_RATE_LIMIT,
+    PathRateLimit,
+)
+
+# 이미지 빌드 컨텍스트(저장소 루트)에 포함할 파일 (나머지는 제외)
+LOAD_GENERATOR_SOURCES = (
+    "load_generator/Dockerfile",
+    "load_generator/*.py",
+    "security/waf_log_analyzer.py",
+)
+CORPUS_PREFIX = "corpora/"
+RESULTS_PREFIX = "results/"
+RUN_RESULTS_PREFIX = f"{RESULTS_PREFIX}$RUN_ID"  # 출력 명령에서 셸이 치환
+LOAD_TEST_TARGETS = ("edge", "alb")
+
+
+@dataclass(frozen=True)
+class LoadTestProps:
+    """부하 생성기 Fargate 태스크 설정"""
+
+    cpu: int = 1024
+    memory_limit_mib: int = 2048
+    # 태스크 하나의 단계 (초당 요청 수:초, 쉼표로 구분). 전체 부하는 태스크 수를 곱한 값
+    stages: str = "20:120,40:120,80:120"
+    connections: int = 128  # 태스크당 keep-alive 연결 수
+    corpus_key: str = f"{CORPUS_PREFIX}search.jsonl"
+    generators: int = 4  # 출력하는 run-task 명령의 태스크 수
+    results_expiration: Duration = Duration.days(90)
+    log_retention: logs.RetentionDays = logs.RetentionDays.ONE_WEEK
+    # 부하 대상: "edge"는 api.<domain_name> (CloudFront 캐시, Origin Shield, API Gateway 포함),
+    # "alb"는 내부 API ALB. None이면 WAF rate limit에 걸리는 부하일 때만 ALB 사용
+    target: Optional[str] = None
+
+    def peak_requests_per_window(self, window_seconds: int) -> float:
+        """최대 단계에서 모든 태스크가 한 윈도우 동안 보내는 요청 수
+
+        태스크는 같은 NAT Gateway IP로 나가므로 WAF에는 클라이언트 하나로 합산됩니다.
+        """
+        peak = max(Stage.parse(stage).rate for stage in self.stages.split(","))
+        return peak * self.generators * window_seconds
+
+
+def load_test_target(
+    props: LoadTestProps, rate_limit: PathRateLimit = SEARCH_RATE_LIMIT
+) -> str:
+    """props.target (지정하지 않으면 WAF 클라이언트당 한도를 넘는 부하만 내부 ALB로)"""
+    target = props.target
+    if target is None:
+        peak = props.peak_requests_per_window(RATE_LIMIT_WINDOW_SECONDS)
+        target = "alb" if peak > rate_limit.per_client else "edge"
+    if target not in LOAD_TEST_TARGETS:
+        raise ValueError(
+            f"load test target must be one of {', '.join(LOAD_TEST_TARGETS)}: {target}"
+        )
+    return target
+
+
+class LoadTestStack(Stack):
+    """VPC 안의 Fargate 태스크에서 API로 부하를 걸고 결과를 S3에 저장
+
+    api.<domain_name>을 대상으로 하면 CloudFront 캐시 정책 변경 전후를 비교할 수 있고,
+    WAF rate limit에 걸리는 부하는 내부 API ALB로 보내 API/검색 서비스 처리량을 측정합니다.
+    태스크는 서비스 없이 `aws ecs run-task`로 필요할 때만 실행합니다.
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        construct_id: str,
+        *,
+        vpc: ec2.IVpc,
+        target_load_balancer: elbv2.IApplicationLoadBalancer,
+        domain_name: Optional[str] = None,  # "edge" 대상 (api.<domain_name>)
+        rate_limit: PathRateLimit = SEARCH_RATE_LIMIT,  # WafStack의 /search 한도
+        props: LoadTestProps = LoadTestProps(),
+        **kwargs,
+    ) -> None:
+        super().__init__(scope, construct_id, **kwargs)
+
+        target = load_test_target(props, rate_limit)
+        if target == "edge":
+            if not domain_name:
+                raise ValueError("the edge load test target needs domain_name")
+            target_url = f"https://api.{domain_name}"
+        else:
+            target_url = f"http://{target_load_balancer.load_balancer_dns_name}"
+
+        # corpus(corpora/)와 태스크별 결과(results/<실행>/)
+        results_bucket = s3.Bucket(
+            self,
+            "LoadTestResultsBucket",
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            enforce_ssl=True,
+            lifecycle_rules=[
+                s3.LifecycleRule(
+                    prefix=RESULTS_PREFIX, expiration=props.results_expiration
+                )
+            ],
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+        cluster = ecs.Cluster(self, "LoadGeneratorCluster", vpc=vpc)
+
+        task_definition = ecs.FargateTaskDefinition(
+            self,
+            "LoadGeneratorTaskDef",
+            cpu=props.cpu,
+            memory_limit_mib=props.memory_limit_mib,
+            runtime_platform=runtime_platform("ARM64"),
+        )
+        task_definition.add_container(
+            "LoadGenerator",
+            image=ecs.ContainerImage.from_asset(
+                ".",
+                file="load_generator/Dockerfile",
+                platform=ecr_assets.Platform.LINUX_ARM64,
+                ignore_mode=IgnoreMode.DOCKER,
+                exclude=build_context_excludes(LOAD_GENERATOR_SOURCES),
+            ),
+            command=["run", "--connections", str(props.connections)],
+            environment={
+                "TARGET_URL": target_url,
+                "CORPUS_URI": f"s3://{results_bucket.bucket_name}/{props.corpus_key}",
+                "STAGES": props.stages,
+                "RESULTS_BUCKET": results_bucket.bucket_name,
+            },
+            logging=ecs.LogDrivers.aws_logs(
+                stream_prefix="load-generator",
+                log_retention=props.log_retention,
+            ),
+        )
+        results_bucket.grant_read(task_definition.task_role, f"{CORPUS_PREFIX}*")
+        results_bucket.grant_put(task_definition.task_role, f"{RESULTS_PREFIX}*")
+
+        generator_security_group = ec2.SecurityGroup(
+            self,
+            "LoadGeneratorSecurityGroup",
+            vpc=vpc,
+            allow_all_outbound=True,
+        )
+        # 내부 ALB(리스너 80)에 부하 생성기 보안 그룹만 추가로 허용
+        if target == "alb":
+            generator_security_group.connections.allow_to(
+                target_load_balancer, ec2.Port.tcp(80)
+            )
+
+        CfnOutput(
+            self,
+            "LoadTestResultsBucketName",
+            value=results_bucket.bucket_name,
+        )
+
+        # 같은 실행의 태스크가 같은 결과 prefix에 쓰도록 셸 변수 RUN_ID를 지정해 실행
+        subnets = ",".join(
+            vpc.select_subnets(
+                subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
+            ).subnet_ids
+        )
+        network = (
+            f"awsvpcConfiguration={{subnets=[{subnets}],"
+            f"securityGroups=[{generator_security_group.security_group_id}]}}"
+        )
+        overrides = json.dumps(
+            {
+                "containerOverrides": [
+                    {
+                        "name": "LoadGenerator",
+                        "environment": [
+                            {"name": "RESULTS_PREFIX", "value": RUN_RESULTS_PREFIX}
+                        ],
+                    }
+                ]
+            },
+            separators=(",", ":"),
+        ).replace('"', '\\"')
+        CfnOutput(
+            self,
+            "RunLoadTestCommand",
+            value=f"aws ecs run-task --cluster {cluster.cluster_name} "
+            f"--task-definition {task_definition.task_definition_arn} "
+            f"--count {props.generators} --launch-type FARGATE "
+            f"--network-configuration '{network}' --overrides \"{overrides}\"",
+        )
+        CfnOutput(
+            self,
+            "LoadTestReportCommand",
+            value="python -m load_generator.generator report "
+            f"s3://{results_bucket.bucket_name}/{RUN_RESULTS_PREFIX}/",
+        )
+
+
+def build_context_excludes(sources: Sequence[str]) -> list:
+    """.dockerignore 형식의 허용 목록 (모두 제외한 뒤 sources만 다시 포함)
+
+    제외된 디렉터리 안의 파일은 다시 포함할 수 없으므로 상위 디렉터리를 먼저 포함하고
+    그 내용을 제외합니다.
+    """
+    directories = sorted({os.path.dirname(source) for source in sources} - {""})
+    return [
+        "*",
+        *(f"!{directory}" for directory in directories),
+        *(f"{directory}/*" for directory in directories),
+        *(f"!{source}" for source in sources),
+    ]
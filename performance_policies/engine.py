@@ -0,0 +1,279 @@
+"""합성된 CloudFormation 템플릿에 선언형 성능 정책을 적용하는 규칙 엔진입니다.
+
+정책은 리소스 타입과 속성 경로, 허용 범위로 정의하며 aws_cdk.assertions.Template의
+find_resources로 대상 리소스를 찾습니다. 위반 항목은 construct 경로와 함께 보고되고,
+의도된 예외는 사유와 함께 Waiver로 명시합니다.
+"""
+
+import fnmatch
+import glob
+import json
+import os
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import aws_cdk as cdk
+import aws_cdk.assertions as assertions
+
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class Violation:
+    policy: str
+    stack: str
+    path: str  # construct 경로 (알 수 없으면 logical ID)
+    message: str
+
+    def __str__(self) -> str:
+        return f"[{self.policy}] {self.path}: {self.message}"
+
+
+@dataclass(frozen=True)
+class Waiver:
+    """의도된 정책 예외 (construct 경로 glob 패턴)"""
+
+    policy: str
+    path: str
+    reason: str
+
+    def matches(self, violation: Violation) -> bool:
+        return violation.policy == self.policy and fnmatch.fnmatchcase(
+            violation.path, self.path
+        )
+
+
+@dataclass(frozen=True)
+class StackTemplate:
+    name: str
+    template: assertions.Template
+    paths: Dict[str, str]  # logical ID -> construct 경로
+
+    def resources(
+        self, resource_type: str, properties: Optional[dict] = None
+    ) -> Iterator[Tuple[str, str, dict]]:
+        """(construct 경로, logical ID, Properties)"""
+        matcher = {"Properties": properties} if properties else None
+        found = self.template.find_resources(resource_type, matcher)
+        for logical_id, resource in sorted(found.items()):
+            path = self.paths.get(logical_id, logical_id)
+            yield path, logical_id, resource.get("Properties", {})
+
+
+def lookup(properties: dict, path: Sequence[str], default: Any = MISSING) -> Any:
+    value = properties
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+    return value
+
+
+@dataclass(frozen=True)
+class Policy(ABC):
+    name: str
+    resource_type: str
+    description: str = ""
+    where: Optional[dict] = None  # assertions 매칭 조건 (Properties 기준)
+    exclude: Tuple[str, ...] = ()  # 제외할 construct 경로 정규식 (CDK 내부 리소스 등)
+
+    def targets(self, stack: StackTemplate) -> Iterator[Tuple[str, dict]]:
+        for path, _, properties in stack.resources(self.resource_type, self.where):
+            if not any(re.search(pattern, path) for pattern in self.exclude):
+                yield path, properties
+
+    @abstractmethod
+    def check(self, stack: StackTemplate) -> Iterator[Violation]:
+        """스택의 위반 항목"""
+
+
+@dataclass(frozen=True)
+class ResourcePolicy(Policy):
+    """대상 리소스마다 속성을 따로 검사하는 정책"""
+
+    def check(self, stack: StackTemplate) -> Iterator[Violation]:
+        for path, properties in self.targets(stack):
+            message = self.check_resource(properties)
+            if message:
+                yield Violation(self.name, stack.name, path, message)
+
+    @abstractmethod
+    def check_resource(self, properties: dict) -> Optional[str]:
+        """위반이면 메시지, 아니면 None"""
+
+
+@dataclass(frozen=True)
+class PropertyRange(ResourcePolicy):
+    """숫자 속성이 [minimum, maximum] 범위 안에 있어야 함 (속성이 없으면 default 적용)"""
+
+    path: Tuple[str, ...] = ()
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    default: Any = MISSING
+
+    def check_resource(self, properties: dict) -> Optional[str]:
+        key = ".".join(self.path)
+        value = lookup(properties, self.path, self.default)
+        if value is MISSING:
+            return f"{key} is not set"
+        if not isinstance(value, (int, float)):
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                return None  # 배포 시점에만 알 수 있는 값 (Ref 등)
+        if self.minimum is not None and value < self.minimum:
+            return f"{key}={value:g} is below {self.minimum:g}"
+        if self.maximum is not None and value > self.maximum:
+            return f"{key}={value:g} is above {self.maximum:g}"
+        return None
+
+
+@dataclass(frozen=True)
+class PropertyLength(ResourcePolicy):
+    """목록 속성의 항목 수 하한 (예: 서브넷 수 = AZ 수)"""
+
+    path: Tuple[str, ...] = ()
+    minimum: int = 1
+
+    def check_resource(self, properties: dict) -> Optional[str]:
+        key = ".".join(self.path)
+        value = lookup(properties, self.path, [])
+        if isinstance(value, list) and len(value) < self.minimum:
+            return f"{key} has {len(value)} item(s), expected at least {self.minimum}"
+        return None
+
+
+@dataclass(frozen=True)
+class PropertyEquals(ResourcePolicy):
+    path: Tuple[str, ...] = ()
+    expected: Any = None
+    default: Any = MISSING
+
+    def check_resource(self, properties: dict) -> Optional[str]:
+        key = ".".join(self.path)
+        value = lookup(properties, self.path, self.default)
+        if value != self.expected:
+            shown = "unset" if value is MISSING else json.dumps(value)
+            return f"{key} is {shown}, expected {json.dumps(self.expected)}"
+        return None
+
+
+@dataclass(frozen=True)
+class RequiredResources(Policy):
+    """resource_type 리소스가 있는 스택에는 required의 각 (타입, 속성) 리소스가 있어야 함"""
+
+    required: Tuple[Tuple[str, str, dict], ...] = ()  # (이름, 타입, 속성 매칭 조건)
+
+    def check(self, stack: StackTemplate) -> Iterator[Violation]:
+        for path, _ in self.targets(stack):
+            for name, resource_type, properties in self.required:
+                if not any(True for _ in stack.resources(resource_type, properties)):
+                    yield Violation(
+                        self.name,
+                        stack.name,
+                        path,
+                        f"{name} ({resource_type}) is missing",
+                    )
+
+
+@dataclass(frozen=True)
+class CachedBehavior(ResourcePolicy):
+    """CloudFront 배포에 캐시를 사용하는 압축 동작이 하나 이상 있어야 함"""
+
+    disabled_cache_policy_id: str = ""
+
+    def check_resource(self, properties: dict) -> Optional[str]:
+        config = properties.get("DistributionConfig", {})
+        behaviors = [config.get("DefaultCacheBehavior", {})]
+        behaviors += config.get("CacheBehaviors", [])
+        cached = [
+            behavior
+            for behavior in behaviors
+            if behavior.get("CachePolicyId") != self.disabled_cache_policy_id
+        ]
+        if not cached:
+            return "every cache behavior uses CachingDisabled"
+        uncompressed = [
+            behavior.get("PathPattern", "default")
+            for behavior in cached
+            if behavior.get("Compress") is not True
+        ]
+        if uncompressed:
+            return f"cached behaviors without compression: {', '.join(uncompressed)}"
+        return None
+
+
+@dataclass
+class PolicyReport:
+    violations: List[Violation] = field(default_factory=list)
+    waived: List[Tuple[Violation, Waiver]] = field(default_factory=list)
+
+    def format(self) -> str:
+        lines = [str(violation) for violation in self.violations]
+        lines += [
+            f"(waived) {violation} -- {waiver.reason}"
+            for violation, waiver in self.waived
+        ]
+        return "\n".join(lines)
+
+
+def construct_paths(stack: cdk.Stack) -> Dict[str, str]:
+    paths = {}
+    for child in stack.node.find_all():
+        if (
+            isinstance(child, cdk.CfnElement)
+            and child.stack.node.path == stack.node.path
+        ):
+            paths[stack.resolve(child.logical_id)] = child.node.path
+    return paths
+
+
+def stack_templates(app: cdk.App) -> List[StackTemplate]:
+    return [
+        StackTemplate(
+            name=stack.stack_name,
+            template=assertions.Template.from_stack(stack),
+            paths=construct_paths(stack),
+        )
+        for stack in app.node.find_all()
+        if isinstance(stack, cdk.Stack)
+    ]
+
+
+def assembly_templates(assembly_dir: str) -> List[StackTemplate]:
+    """cdk synth 결과(cdk.out)의 템플릿 (construct 경로는 aws:cdk:path 메타데이터)"""
+    stacks = []
+    for path in sorted(glob.glob(os.path.join(assembly_dir, "*.template.json"))):
+        with open(path, encoding="utf-8") as source:
+            template = json.load(source)
+        paths = {
+            logical_id: resource.get("Metadata", {}).get("aws:cdk:path", logical_id)
+            for logical_id, resource in template.get("Resources", {}).items()
+        }
+        stacks.append(
+            StackTemplate(
+                name=os.path.basename(path)[: -len(".template.json")],
+                template=assertions.Template.from_json(template),
+                paths=paths,
+            )
+        )
+    return stacks
+
+
+def evaluate(
+    stacks: Iterable[StackTemplate],
+    policies: Sequence[Policy],
+    waivers: Sequence[Waiver] = (),
+) -> PolicyReport:
+    report = PolicyReport()
+    for stack in stacks:
+        for policy in policies:
+            for violation in policy.check(stack):
+                waiver = next((w for w in waivers if w.matches(violation)), None)
+                if waiver:
+                    report.waived.append((violation, waiver))
+                else:
+                    report.violations.append(violation)
+    return report
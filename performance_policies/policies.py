@@ -0,0 +1,201 @@
+"""app.py의 모든 스택에 적용하는 성능 정책과 의도된 예외 목록입니다.
+
+    cdk synth -o cdk.out
+    python -m performance_policies.policies cdk.out
+"""
+
+import argparse
+import sys
+
+import aws_cdk.assertions as assertions
+
+from performance_policies.engine import (
+    CachedBehavior,
+    PropertyEquals,
+    PropertyLength,
+    PropertyRange,
+    RequiredResources,
+    Waiver,
+    assembly_templates,
+    evaluate,
+)
+
+# CDK가 생성하는 커스텀 리소스 Lambda (AwsCustomResource, 리전 간 참조 등)
+CDK_MANAGED_FUNCTIONS = (
+    r"/AWS679f53fac002430cb0da5b7982bd2287/",
+    r"/Custom::\w+CustomResourceProvider/",
+    r"/LogRetention[0-9a-f]{32}/",
+)
+# CloudFront 관리형 CachingDisabled 캐시 정책 ID
+CACHING_DISABLED_POLICY_ID = "4135ea2d-6df8-44a3-9df3-4b5a84be39ad"
+
+PERFORMANCE_POLICIES = [
+    # 스케일링 목표
+    PropertyRange(
+        name="cpu-target-tracking",
+        resource_type="AWS::ApplicationAutoScaling::ScalingPolicy",
+        description="CPU target tracking must leave headroom before saturation",
+        where={
+            "TargetTrackingScalingPolicyConfiguration": {
+                "PredefinedMetricSpecification": {
+                    "PredefinedMetricType": "ECSServiceAverageCPUUtilization"
+                }
+            }
+        },
+        path=("TargetTrackingScalingPolicyConfiguration", "TargetValue"),
+        minimum=40,
+        maximum=75,
+    ),
+    PropertyRange(
+        name="scalable-target-max-capacity",
+        resource_type="AWS::ApplicationAutoScaling::ScalableTarget",
+        description="Services must be able to scale out beyond a single task",
+        path=("MaxCapacity",),
+        minimum=2,
+    ),
+    PropertyRange(
+        name="capacity-provider-target",
+        resource_type="AWS::ECS::CapacityProvider",
+        description="Managed scaling must keep spare capacity for new tasks",
+        path=("AutoScalingGroupProvider", "ManagedScaling", "TargetCapacity"),
+        maximum=90,
+        default=100,
+    ),
+    # 알람 단위 (CPUUtilization/MemoryUtilization은 0~100)
+    PropertyRange(
+        name="utilization-alarm-threshold",
+        resource_type="AWS::CloudWatch::Alarm",
+        description="Utilization alarms use percent thresholds, not fractions",
+        where={
+            "MetricName": assertions.Match.string_like_regexp(
+                "^(CPU|Memory)Utilization$"
+            )
+        },
+        path=("Threshold",),
+        minimum=50,
+        maximum=100,
+    ),
+    # 헬스 체크
+    PropertyRange(
+        name="target-group-health-check-interval",
+        resource_type="AWS::ElasticLoadBalancingV2::TargetGroup",
+        description="Unhealthy targets must be detected within a minute",
+        path=("HealthCheckIntervalSeconds",),
+        maximum=15,
+        default=30,
+    ),
+    # 가용 영역
+    PropertyLength(
+        name="multi-az-service",
+        resource_type="AWS::ECS::Service",
+        description="Services must spread tasks across availability zones",
+        path=("NetworkConfiguration", "AwsvpcConfiguration", "Subnets"),
+        minimum=2,
+    ),
+    PropertyLength(
+        name="multi-az-auto-scaling-group",
+        resource_type="AWS::AutoScaling::AutoScalingGroup",
+        path=("VPCZoneIdentifier",),
+        minimum=2,
+    ),
+    PropertyLength(
+        name="multi-az-vpc-link",
+        resource_type="AWS::ApiGatewayV2::VpcLink",
+        path=("SubnetIds",),
+        minimum=2,
+    ),
+    # 로그 보존 기간
+    PropertyRange(
+        name="log-retention",
+        resource_type="AWS::Logs::LogGroup",
+        description="Log groups must expire data",
+        path=("RetentionInDays",),
+        minimum=1,
+        maximum=365,
+    ),
+    # Lambda
+    PropertyEquals(
+        name="lambda-architecture",
+        resource_type="AWS::Lambda::Function",
+        description="Functions run on Graviton (arm64)",
+        exclude=CDK_MANAGED_FUNCTIONS,
+        path=("Architectures",),
+        expected=["arm64"],
+        default=["x86_64"],
+    ),
+    PropertyRange(
+        name="lambda-memory",
+        resource_type="AWS::Lambda::Function",
+        exclude=CDK_MANAGED_FUNCTIONS,
+        path=("MemorySize",),
+        minimum=128,
+        maximum=1024,
+        default=128,
+    ),
+    # VPC 엔드포인트 (NAT Gateway를 거치지 않는 AWS API 호출)
+    RequiredResources(
+        name="vpc-endpoints",
+        resource_type="AWS::EC2::VPC",
+        description="VPCs reach ECR, S3 and CloudWatch Logs through endpoints",
+        required=(
+            (
+                "S3 gateway endpoint",
+                "AWS::EC2::VPCEndpoint",
+                {"VpcEndpointType": "Gateway"},
+            ),
+            *(
+                (
+                    f"{service} interface endpoint",
+                    "AWS::EC2::VPCEndpoint",
+                    {
+                        "ServiceName": assertions.Match.string_like_regexp(
+                            rf"\.{service}$"
+                        ),
+                        "PrivateDnsEnabled": True,
+                    },
+                )
+                for service in ("ecr.api", "ecr.dkr", "logs")
+            ),
+        ),
+    ),
+    # CDN 캐시
+    CachedBehavior(
+        name="cdn-caching",
+        resource_type="AWS::CloudFront::Distribution",
+        description="Distributions cache and compress at least one behavior",
+        disabled_cache_policy_id=CACHING_DISABLED_POLICY_ID,
+    ),
+]
+
+WAIVERS = [
+    Waiver(
+        policy="multi-az-service",
+        path="*BackendInfraStack/SearchServiceEC2Service/*",
+        reason="search tasks run on the single-AZ GPU ASG",
+    ),
+    Waiver(
+        policy="multi-az-auto-scaling-group",
+        path="*BackendInfraStack/GPUAutoScalingGroup/*",
+        reason="g4dn.xlarge capacity is reserved in one AZ",
+    ),
+    Waiver(
+        policy="capacity-provider-target",
+        path="*BackendInfraStack/AsgCapacityProvider/*",
+        reason="a spare g4dn.xlarge costs more than waiting for a GPU instance",
+    ),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("assembly", nargs="?", default="cdk.out")
+    args = parser.parse_args()
+
+    report = evaluate(assembly_templates(args.assembly), PERFORMANCE_POLICIES, WAIVERS)
+    if report.violations or report.waived:
+        print(report.format())
+    sys.exit(1 if report.violations else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""WAF 요청 로그(JSON lines)에서 경로/클라이언트/규칙별 요청률을 시간 윈도우 단위로 집계합니다.
+
+WafStack의 로그 그룹(aws-waf-logs-linked-paper-api)을 내보낸 파일(.log / .gz)을 한 줄씩
+스트리밍하며, /search 등의 rate limit과 캐시 정책을 조정할 때 사용합니다.
+
+클라이언트는 WAF가 관측한 clientIp로 식별합니다. CLOUDFRONT 범위에서 X-Forwarded-For는
+뷰어가 보낸 값 그대로라 바꿔 가며 보낼 수 있으므로 별도 차원(forwarded_for)으로만 집계합니다.
+
+    aws logs tail aws-waf-logs-linked-paper-api --since 1d --format short \\
+        | cut -d' ' -f2- > waf.log
+    python -m security.waf_log_analyzer waf.log --window 60 --top 10
+"""
+
+import argparse
+import gzip
+import json
+import math
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+DIMENSIONS = ("path", "client", "forwarded_for", "rule")
+
+
+@dataclass(frozen=True)
+class WafRequest:
+    timestamp: float  # epoch seconds
+    path: str
+    client: str  # clientIp
+    rule: str  # 종료 규칙 (Default_Action 포함)
+    action: str
+    forwarded_for: Optional[str] = (
+        None  # X-Forwarded-For 첫 번째 주소 (헤더가 있을 때만)
+    )
+
+
+def open_log(path: str) -> TextIO:
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def path_prefix(uri: str) -> str:
+    """/search/papers?x=1 -> /search"""
+    segment = uri.split("?", 1)[0].strip("/").split("/", 1)[0]
+    return f"/{segment}"
+
+
+def forwarded_address(http_request: dict) -> Optional[str]:
+    # 뷰어가 임의로 보낼 수 있는 값이므로 클라이언트 식별에는 사용하지 않음
+    for header in http_request.get("headers", []):
+        if header.get("name", "").lower() == "x-forwarded-for":
+            return header.get("value", "").split(",")[0].strip() or None
+    return None
+
+
+def parse_record(line: str) -> Optional[WafRequest]:
+    line = line.strip()
+    if not line.startswith("{"):
+        return None
+    record = json.loads(line)
+    http_request = record.get("httpRequest", {})
+    return WafRequest(
+        timestamp=record["timestamp"] / 1000,
+        path=path_prefix(http_request.get("uri", "/")),
+        client=http_request.get("clientIp", "-"),
+        rule=record.get("terminatingRuleId", "-"),
+        action=record.get("action", "-"),
+        forwarded_for=forwarded_address(http_request),
+    )
+
+
+def read_requests(paths: Iterable[str]) -> Iterator[WafRequest]:
+    for path in paths:
+        with open_log(path) as stream:
+            for line in stream:
+                request = parse_record(line)
+                if request is not None:
+                    yield request
+
+
+def percentile(values: List[int], q: float) -> int:
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+@dataclass
+class WindowedRequestCounts:
+    """(윈도우 시작 시각, 차원 값)별 요청 수"""
+
+    window_seconds: int = 60
+    counts: Dict[str, Counter] = field(
+        default_factory=lambda: {dimension: Counter() for dimension in DIMENSIONS}
+    )
+    # (경로, 클라이언트)별 윈도우 요청 수: 클라이언트 단위 rate limit 산정용
+    path_client_counts: Counter = field(default_factory=Counter)
+    actions: Counter = field(default_factory=Counter)
+
+    def add(self, request: WafRequest) -> None:
+        window = int(request.timestamp // self.window_seconds) * self.window_seconds
+        self.counts["path"][(window, request.path)] += 1
+        self.counts["client"][(window, request.client)] += 1
+        self.counts["rule"][(window, request.rule)] += 1
+        if request.forwarded_for is not None:
+            self.counts["forwarded_for"][(window, request.forwarded_for)] += 1
+        self.path_client_counts[(window, request.path, request.client)] += 1
+        self.actions[(request.path, request.action)] += 1
+
+    def totals(self, dimension: str) -> Counter:
+        totals = Counter()
+        for (_, value), count in self.counts[dimension].items():
+            totals[value] += count
+        return totals
+
+    def peaks(self, dimension: str) -> Dict[str, Tuple[int, int]]:
+        """값별 최대 윈도우 요청 수와 해당 윈도우 시작 시각"""
+        peaks = {}
+        for (window, value), count in self.counts[dimension].items():
+            if value not in peaks or count > peaks[value][1]:
+                peaks[value] = (window, count)
+        return peaks
+
+    def client_rate_percentiles(
+        self, quantiles: Iterable[float] = (50, 99, 100)
+    ) -> Dict[str, Dict[float, int]]:
+        """경로별 '클라이언트 1명이 한 윈도우에 보낸 요청 수'의 분위수"""
+        per_path = defaultdict(list)
+        for (_, path, _), count in self.path_client_counts.items():
+            per_path[path].append(count)
+        return {
+            path: {q: percentile(counts, q) for q in quantiles}
+            for path, counts in per_path.items()
+        }
+
+
+def analyze(paths: Iterable[str], window_seconds: int = 60) -> WindowedRequestCounts:
+    counts = WindowedRequestCounts(window_seconds=window_seconds)
+    for request in read_requests(paths):
+        counts.add(request)
+    return counts
+
+
+def format_report(counts: WindowedRequestCounts, top: int = 10) -> str:
+    lines = []
+    for dimension in DIMENSIONS:
+        totals = counts.totals(dimension)
+        if not totals:
+            continue  # X-Forwarded-For 헤더가 없는 로그
+        peaks = counts.peaks(dimension)
+        lines.append(
+            f"[{dimension}] requests / peak per {counts.window_seconds}s window"
+        )
+        for value, total in totals.most_common(top):
+            window, peak = peaks[value]
+            lines.append(f"  {value:<40} {total:>10,} {peak:>8,} @ {window}")
+
+    lines.append(f"[client rate per {counts.window_seconds}s window] p50 / p99 / max")
+    for path, rates in sorted(counts.client_rate_percentiles().items()):
+        lines.append(f"  {path:<40} {rates[50]:>6} {rates[99]:>6} {rates[100]:>6}")
+
+    lines.append("[action] requests")
+    for (path, action), total in sorted(counts.actions.items()):
+        lines.append(f"  {path:<32} {action:<7} {total:>10,}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="WAF 로그 파일 (.log/.gz, - 는 stdin)")
+    parser.add_argument("--window", type=int, default=60, help="집계 윈도우 (초)")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    print(format_report(analyze(args.paths, args.window), args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,136 @@
-from aws_cdk import CfnOutput, Stack
+import json
+from dataclasses import dataclass
+from typing import List
+
+from aws_cdk import ArnFormat, CfnOutput, RemovalPolicy, Stack
+from aws_cdk import aws_logs as logs
 from aws_cdk import aws_wafv2 as wafv2
 from constructs import Construct
 
+RATE_LIMIT_WINDOW_SECONDS = 60  # WAF 평가 윈도우 (60/120/300/600초)
+RATE_LIMITED_RESPONSE_KEY = "RateLimited"
+
+# WAF 로그 대상 로그 그룹 이름은 aws-waf-logs- 로 시작해야 함
+WAF_LOG_GROUP_NAME = "aws-waf-logs-linked-paper-api"
+# 로그에서 값을 가리는 요청 헤더
+REDACTED_HEADERS = ("authorization", "cookie")
+
+
+@dataclass(frozen=True)
+class PathRateLimit:
+    """경로별 클라이언트당 요청 한도 (RATE_LIMIT_WINDOW_SECONDS 동안의 요청 수)
+
+    엣지 WAF는 CloudFront 캐시 히트까지 세므로 경로 전체 한도는 두지 않습니다. 검색 서비스
+    처리량은 캐시 미스만 도달하는 API Gateway 스테이지 스로틀(CapacityProfile.origin)로 제한합니다.
+    """
+
+    per_client: int  # 클라이언트 IP / X-Forwarded-For IP 당 한도
+
+
+SEARCH_RATE_LIMIT = PathRateLimit(per_client=60)
+CORRELATIONS_RATE_LIMIT = PathRateLimit(per_client=120)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    name: str
+    path: str
+    aggregate_key_type: str  # IP, FORWARDED_IP
+    limit: int
+
+
+def rate_limit_table(
+    search: PathRateLimit, correlations: PathRateLimit
+) -> List[RateLimitRule]:
+    """경로 x 집계 기준별 rate-based 규칙 설정 테이블"""
+    table = []
+    for path, limits in (("/search", search), ("/correlations", correlations)):
+        prefix = path.strip("/").capitalize()
+        table += [
+            RateLimitRule(f"{prefix}RateLimitPerIp", path, "IP", limits.per_client),
+            RateLimitRule(
+                f"{prefix}RateLimitPerForwardedIp",
+                path,
+                "FORWARDED_IP",
+                limits.per_client,
+            ),
+        ]
+    return table
+
+
+def visibility_config(metric_name: str) -> wafv2.CfnWebACL.VisibilityConfigProperty:
+    return wafv2.CfnWebACL.VisibilityConfigProperty(
+        cloud_watch_metrics_enabled=True,
+        metric_name=metric_name,
+        sampled_requests_enabled=True,
+    )
+
+
+def path_prefix_statement(path: str) -> wafv2.CfnWebACL.StatementProperty:
+    return wafv2.CfnWebACL.StatementProperty(
+        byte_match_statement=wafv2.CfnWebACL.ByteMatchStatementProperty(
+            field_to_match=wafv2.CfnWebACL.FieldToMatchProperty(uri_path={}),
+            positional_constraint="STARTS_WITH",
+            search_string=path,  # Directly pass the string
+            text_transformations=[
+                wafv2.CfnWebACL.TextTransformationProperty(priority=0, type="NONE")
+            ],
+        )
+    )
+
+
+def rate_limit_rule(rule: RateLimitRule, priority: int) -> wafv2.CfnWebACL.RuleProperty:
+    forwarded_ip_config = None
+    if rule.aggregate_key_type == "FORWARDED_IP":
+        forwarded_ip_config = wafv2.CfnWebACL.ForwardedIPConfigurationProperty(
+            header_name="X-Forwarded-For",
+            fallback_behavior="NO_MATCH",  # 헤더가 없으면 IP 규칙에서 처리
+        )
+
+    return wafv2.CfnWebACL.RuleProperty(
+        name=rule.name,
+        priority=priority,
+        # WAF에서 바로 429 응답 (ALB/API까지 전달되지 않음)
+        action=wafv2.CfnWebACL.RuleActionProperty(
+            block=wafv2.CfnWebACL.BlockActionProperty(
+                custom_response=wafv2.CfnWebACL.CustomResponseProperty(
+                    response_code=429,
+                    custom_response_body_key=RATE_LIMITED_RESPONSE_KEY,
+                    response_headers=[
+                        wafv2.CfnWebACL.CustomHTTPHeaderProperty(
+                            name="Retry-After",
+                            value=str(RATE_LIMIT_WINDOW_SECONDS),
+                        )
+                    ],
+                )
+            )
+        ),
+        statement=wafv2.CfnWebACL.StatementProperty(
+            rate_based_statement=wafv2.CfnWebACL.RateBasedStatementProperty(
+                aggregate_key_type=rule.aggregate_key_type,
+                limit=rule.limit,
+                evaluation_window_sec=RATE_LIMIT_WINDOW_SECONDS,
+                forwarded_ip_config=forwarded_ip_config,
+                scope_down_statement=path_prefix_statement(rule.path),
+            )
+        ),
+        visibility_config=visibility_config(rule.name),
+    )
+
 
 class WafStack(Stack):
-    def __init__(self, scope: Construct, id: str, **kwargs) -> None:
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        waf_scope: str = "REGIONAL",
+        *,
+        search_rate_limit: PathRateLimit = SEARCH_RATE_LIMIT,
+        correlations_rate_limit: PathRateLimit = CORRELATIONS_RATE_LIMIT,
+        log_group_name: str = WAF_LOG_GROUP_NAME,  # 'aws-waf-logs-' 접두사 필수
+        export_prefix: str = "",
+        **kwargs,
+    ) -> None:
         super().__init__(scope, id, **kwargs)
 
         # Define the allowed paths
@@ -13,6 +139,14 @@ class WafStack(Stack):
             "/correlations",
         ]  # No need for wildcards in the array
 
+        # GPU 검색 서비스 보호용 rate-based 규칙 (허용 규칙보다 먼저 평가)
+        rate_limit_rules = [
+            rate_limit_rule(rule, priority)
+            for priority, rule in enumerate(
+                rate_limit_table(search_rate_limit, correlations_rate_limit), start=1
+            )
+        ]
+
         # Create the WAF Web ACL
         waf_acl = wafv2.CfnWebACL(
             self,
@@ -20,48 +154,66 @@ class WafStack(Stack):
             default_action=wafv2.CfnWebACL.DefaultActionProperty(
                 block={}
             ),  # Default action is to block
-            scope="REGIONAL",  # This is for Load Balancer (REGIONAL type)
-            visibility_config=wafv2.CfnWebACL.VisibilityConfigProperty(
-                cloud_watch_metrics_enabled=False,
-                metric_name="ApiLoadBalancerWafAcl",
-                sampled_requests_enabled=False,
-            ),
+            scope=waf_scope,  # REGIONAL (ALB) or CLOUDFRONT (must be deployed in us-east-1)
+            visibility_config=visibility_config("ApiLoadBalancerWafAcl"),
+            custom_response_bodies={
+                RATE_LIMITED_RESPONSE_KEY: wafv2.CfnWebACL.CustomResponseBodyProperty(
+                    content_type="APPLICATION_JSON",
+                    content=json.dumps(
+                        {"message": "Too many requests, please retry later"}
+                    ),
+                )
+            },
             rules=[
+                *rate_limit_rules,
                 # Allow paths that start with /search or /correlations
                 wafv2.CfnWebACL.RuleProperty(
                     name="AllowSpecificPaths",
-                    priority=1,
+                    priority=len(rate_limit_rules) + 1,
                     action=wafv2.CfnWebACL.RuleActionProperty(
                         allow={}
                     ),  # Allow these paths
                     statement=wafv2.CfnWebACL.StatementProperty(
                         or_statement=wafv2.CfnWebACL.OrStatementProperty(
                             statements=[
-                                wafv2.CfnWebACL.StatementProperty(
-                                    byte_match_statement=wafv2.CfnWebACL.ByteMatchStatementProperty(
-                                        field_to_match=wafv2.CfnWebACL.FieldToMatchProperty(
-                                            uri_path={}
-                                        ),
-                                        positional_constraint="STARTS_WITH",
-                                        search_string=path,  # Directly pass the string
-                                        text_transformations=[
-                                            wafv2.CfnWebACL.TextTransformationProperty(
-                                                priority=0, type="NONE"
-                                            )
-                                        ],
-                                    )
-                                )
-                                for path in allowed_paths
+                                path_prefix_statement(path) for path in allowed_paths
                             ]
                         )
                     ),
-                    visibility_config=wafv2.CfnWebACL.VisibilityConfigProperty(
-                        cloud_watch_metrics_enabled=False,
-                        metric_name="AllowSpecificPaths",
-                        sampled_requests_enabled=False,
-                    ),
+                    visibility_config=visibility_config("AllowSpecificPaths"),
+                ),
+            ],
+        )
+
+        self.web_acl_arn = waf_acl.attr_arn
+
+        # WAF 요청 로그 (security/waf_log_analyzer.py로 분석)
+        waf_log_group = logs.LogGroup(
+            self,
+            "WafLogGroup",
+            log_group_name=log_group_name,
+            retention=logs.RetentionDays.ONE_MONTH,
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+        wafv2.CfnLoggingConfiguration(
+            self,
+            "WafLoggingConfiguration",
+            resource_arn=waf_acl.attr_arn,
+            # WAF는 ':*' 접미사가 없는 로그 그룹 ARN을 요구함
+            log_destination_configs=[
+                self.format_arn(
+                    service="logs",
+                    resource="log-group",
+                    resource_name=waf_log_group.log_group_name,
+                    arn_format=ArnFormat.COLON_RESOURCE_NAME,
                 )
             ],
+            redacted_fields=[
+                wafv2.CfnLoggingConfiguration.FieldToMatchProperty(
+                    single_header={"Name": header}
+                )
+                for header in REDACTED_HEADERS
+            ],
         )
 
         # Export the Web ACL ARN so other stacks can reference it
@@ -69,5 +221,12 @@ class WafStack(Stack):
             self,
             "WafAclArn",
             value=waf_acl.attr_arn,
-            export_name="WafAclArn",  # This name will be used for importing
+            export_name=f"{export_prefix}WafAclArn",  # This name will be used for importing
+        )
+
+        CfnOutput(
+            self,
+            "WafLogGroupName",
+            value=waf_log_group.log_group_name,
+            description="WAF request logs (waf_log_analyzer input)",
         )
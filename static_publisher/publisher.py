@@ -0,0 +1,323 @@
+"""정적 빌드 결과를 CDN 버킷(LinkedPaperStaticFilesBucket)에 증분 배포합니다.
+
+로컬 빌드 디렉터리의 content hash를 버킷의 매니페스트와 비교해 변경된 파일만
+병렬로 업로드하고, 변경/삭제된 HTML 경로만 CloudFront에서 무효화합니다.
+
+빌드에서 빠진 파일은 이전 HTML(브라우저/CloudFront 캐시)이 계속 참조할 수 있으므로
+바로 지우지 않고 매니페스트에 removed_at으로 남겨 두었다가, 보존 기간이 지난 뒤의
+배포에서 압축본과 함께 삭제합니다.
+
+    python -m static_publisher.publisher --build-dir out \\
+        --bucket <StaticFilesBucketName output> \\
+        --distribution-id <CdnDistributionId output>
+"""
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import mimetypes
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import boto3
+import brotli
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+MANIFEST_KEY = ".publish-manifest.json"
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+HTML_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+
+# edge_functions/select_precompressed.js 와 동일한 확장자 목록 유지
+COMPRESSIBLE_EXTENSIONS = {
+    ".html",
+    ".css",
+    ".js",
+    ".mjs",
+    ".json",
+    ".svg",
+    ".txt",
+    ".xml",
+    ".map",
+    ".webmanifest",
+}
+PRECOMPRESSED_ENCODINGS = {".br": "br", ".gz": "gzip"}
+
+# Next.js 빌드 산출물 또는 파일명에 content hash가 포함된 파일
+HASHED_NAME = re.compile(r"(^|/)_next/static/|[.-][0-9a-f]{8,}\.[A-Za-z0-9]+$")
+
+# 빌드에서 빠진 파일을 삭제하기 전까지 유지하는 기간 (이전 HTML이 참조하는 청크 보호)
+REMOVED_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+HASH_CHUNK_SIZE = 1024 * 1024
+DELETE_BATCH_SIZE = 1000
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
+
+@dataclass(frozen=True)
+class Asset:
+    key: str
+    path: str
+    digest: str
+
+    @property
+    def is_html(self) -> bool:
+        return self.key.endswith(".html")
+
+    @property
+    def is_compressible(self) -> bool:
+        return os.path.splitext(self.key)[1] in COMPRESSIBLE_EXTENSIONS
+
+    @property
+    def content_type(self) -> str:
+        return mimetypes.guess_type(self.key)[0] or "application/octet-stream"
+
+    @property
+    def cache_control(self) -> str:
+        if self.is_html:
+            return HTML_CACHE_CONTROL
+        if HASHED_NAME.search(self.key):
+            return IMMUTABLE_CACHE_CONTROL
+        return DEFAULT_CACHE_CONTROL
+
+
+@dataclass
+class PublishResult:
+    uploaded: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)  # 이번 빌드에서 빠진 파일 (보존)
+    deleted: List[str] = field(default_factory=list)  # 보존 기간이 지나 삭제한 파일
+    invalidated: List[str] = field(default_factory=list)
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_build_directory(build_dir: str, workers: int = 8) -> Dict[str, Asset]:
+    paths = {}
+    for root, _, files in os.walk(build_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            key = os.path.relpath(path, build_dir).replace(os.sep, "/")
+            paths[key] = path
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(hash_file, paths.values())
+        return {
+            key: Asset(key=key, path=path, digest=digest)
+            for (key, path), digest in zip(paths.items(), digests)
+        }
+
+
+def load_remote_manifest(s3_client, bucket: str) -> Dict[str, dict]:
+    """{key: {"digest": ..., "removed_at": 빌드에서 빠진 시각 (epoch 초, 보존 중인 파일만)}}"""
+    try:
+        response = s3_client.get_object(Bucket=bucket, Key=MANIFEST_KEY)
+    except ClientError as error:
+        if error.response["Error"]["Code"] in ("NoSuchKey", "404"):
+            return {}
+        raise
+    manifest = json.loads(response["Body"].read())
+    # 이전 형식 {key: digest}
+    return {
+        key: entry if isinstance(entry, dict) else {"digest": entry}
+        for key, entry in manifest.items()
+    }
+
+
+def invalidation_paths(keys: List[str]) -> List[str]:
+    """변경/삭제된 HTML 객체의 무효화 경로
+
+    select_precompressed.js가 캐시 조회 전에 URI에 .br/.gz를 붙이므로 캐시에는
+    압축본 경로로 저장됩니다. 와일드카드로 원본과 압축본을 함께 무효화합니다.
+    (디렉터리 인덱스 재작성이 없으므로 /papers/ 같은 경로는 제공되지 않음)
+    """
+    return sorted(f"/{key}*" for key in keys if key.endswith(".html"))
+
+
+def upload_asset(s3_client, bucket: str, asset: Asset) -> None:
+    extra_args = {
+        "ContentType": asset.content_type,
+        "CacheControl": asset.cache_control,
+    }
+
+    with open(asset.path, "rb") as f:
+        s3_client.upload_fileobj(
+            f, bucket, asset.key, ExtraArgs=extra_args, Config=TRANSFER_CONFIG
+        )
+
+    if not asset.is_compressible:
+        return
+
+    # 뷰어의 Accept-Encoding에 따라 CloudFront Function이 선택하는 압축본
+    with open(asset.path, "rb") as f:
+        body = f.read()
+    variants = {
+        ".br": brotli.compress(body, quality=11),
+        ".gz": gzip.compress(body, compresslevel=9, mtime=0),
+    }
+    for suffix, compressed in variants.items():
+        s3_client.upload_fileobj(
+            io.BytesIO(compressed),
+            bucket,
+            asset.key + suffix,
+            ExtraArgs={
+                **extra_args,
+                "ContentEncoding": PRECOMPRESSED_ENCODINGS[suffix],
+            },
+            Config=TRANSFER_CONFIG,
+        )
+
+
+def delete_objects(s3_client, bucket: str, keys: List[str]) -> None:
+    """보존 기간이 지난 파일과 그 압축본 삭제 (요청당 최대 1000개)"""
+    objects = [
+        {"Key": key + suffix}
+        for key in keys
+        for suffix in ("", *PRECOMPRESSED_ENCODINGS)
+    ]
+    for start in range(0, len(objects), DELETE_BATCH_SIZE):
+        s3_client.delete_objects(
+            Bucket=bucket,
+            Delete={
+                "Objects": objects[start : start + DELETE_BATCH_SIZE],
+                "Quiet": True,
+            },
+        )
+
+
+def publish(
+    build_dir: str,
+    bucket: str,
+    s3_client,
+    cloudfront_client=None,
+    distribution_id: str = None,
+    workers: int = 8,
+    removed_retention: Optional[
+        float
+    ] = REMOVED_RETENTION_SECONDS,  # None이면 삭제 안 함
+    now: Optional[float] = None,
+) -> PublishResult:
+    now = time.time() if now is None else now
+    local_assets = scan_build_directory(build_dir, workers=workers)
+    remote_manifest = load_remote_manifest(s3_client, bucket)
+
+    result = PublishResult()
+    changed = []
+    for key, asset in sorted(local_assets.items()):
+        if remote_manifest.get(key, {}).get("digest") == asset.digest:
+            result.unchanged.append(key)
+        else:
+            changed.append(asset)
+
+    manifest = {key: {"digest": asset.digest} for key, asset in local_assets.items()}
+    for key in sorted(set(remote_manifest) - set(local_assets)):
+        entry = remote_manifest[key]
+        if "removed_at" not in entry:
+            result.removed.append(key)
+        removed_at = entry.get("removed_at", now)
+        if removed_retention is not None and now - removed_at >= removed_retention:
+            result.deleted.append(key)
+        else:
+            manifest[key] = {"digest": entry["digest"], "removed_at": removed_at}
+
+    # 새 HTML이 아직 없는 청크를 참조하지 않도록 HTML은 마지막에 업로드
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch in (
+            [asset for asset in changed if not asset.is_html],
+            [asset for asset in changed if asset.is_html],
+        ):
+            list(
+                executor.map(
+                    lambda asset: upload_asset(s3_client, bucket, asset), batch
+                )
+            )
+    result.uploaded = [asset.key for asset in changed]
+
+    # 새 HTML 업로드 뒤에 삭제하고, 삭제가 끝난 키만 매니페스트에서 제외
+    if result.deleted:
+        delete_objects(s3_client, bucket, result.deleted)
+
+    s3_client.put_object(
+        Bucket=bucket,
+        Key=MANIFEST_KEY,
+        Body=json.dumps(manifest, sort_keys=True).encode(),
+        ContentType="application/json",
+        CacheControl="no-store",
+    )
+
+    result.invalidated = invalidation_paths(result.uploaded + result.deleted)
+    if distribution_id and result.invalidated:
+        cloudfront_client = cloudfront_client or boto3.client("cloudfront")
+        cloudfront_client.create_invalidation(
+            DistributionId=distribution_id,
+            InvalidationBatch={
+                "Paths": {
+                    "Quantity": len(result.invalidated),
+                    "Items": result.invalidated,
+                },
+                "CallerReference": f"static-publisher-{time.time_ns()}",
+            },
+        )
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--build-dir", required=True)
+    parser.add_argument("--bucket", required=True)
+    parser.add_argument("--distribution-id")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument(
+        "--removed-retention-days",
+        type=float,
+        default=REMOVED_RETENTION_SECONDS / 86400,
+        help="delete objects that have been out of the build for this long",
+    )
+    parser.add_argument(
+        "--keep-removed",
+        action="store_true",
+        help="never delete objects that are no longer in the build",
+    )
+    args = parser.parse_args()
+
+    result = publish(
+        args.build_dir,
+        args.bucket,
+        s3_client=boto3.client("s3"),
+        cloudfront_client=boto3.client("cloudfront"),
+        distribution_id=args.distribution_id,
+        workers=args.workers,
+        removed_retention=(
+            None if args.keep_removed else args.removed_retention_days * 86400
+        ),
+    )
+    print(
+        f"uploaded={len(result.uploaded)} unchanged={len(result.unchanged)} "
+        f"removed={len(result.removed)} deleted={len(result.deleted)} "
+        f"invalidated={len(result.invalidated)}"
+    )
+    for path in result.invalidated:
+        print(f"  invalidated {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,467 @@
+import json
+
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+import pytest
+
+from linked_paper_web_infra.backend_stack import BackendInfraStack
+from linked_paper_web_infra.result_cache import ResultCacheProps
+from linked_paper_web_infra.scaling import CAPACITY_PROFILES
+from linked_paper_web_infra.search_domain import SearchDomainMigration
+
+TEST_ENV = core.Environment(account="123456789012", region="ap-northeast-2")
+EDGE_WEB_ACL_ARN = (
+    "arn:aws:wafv2:us-east-1:123456789012:global/webacl/ApiEdgeAcl/a1b2c3d4"
+)
+
+
+@pytest.fixture(scope="module")
+def template():
+    app = core.App()
+    stack = BackendInfraStack(
+        app, "backend-infra", edge_web_acl_arn=EDGE_WEB_ACL_ARN, env=TEST_ENV
+    )
+    return assertions.Template.from_stack(stack)
+
+
+def container_environment(template, container_name):
+    for task_definition in template.find_resources("AWS::ECS::TaskDefinition").values():
+        for container in task_definition["Properties"]["ContainerDefinitions"]:
+            if container["Name"] == container_name:
+                return {e["Name"]: e["Value"] for e in container.get("Environment", [])}
+    raise AssertionError(f"container {container_name} not found")
+
+
+def test_api_load_balancer_is_internal(template):
+    template.has_resource_properties(
+        "AWS::ElasticLoadBalancingV2::LoadBalancer",
+        {"Scheme": "internal"},
+    )
+    template.resource_properties_count_is(
+        "AWS::ElasticLoadBalancingV2::LoadBalancer",
+        {"Scheme": "internet-facing"},
+        0,
+    )
+
+
+def test_api_gateway_uses_vpc_link_integration(template):
+    template.resource_count_is("AWS::ApiGatewayV2::VpcLink", 1)
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::Integration",
+        {
+            "IntegrationType": "HTTP_PROXY",
+            "ConnectionType": "VPC_LINK",
+            "ConnectionId": {"Ref": assertions.Match.string_like_regexp("ApiVpcLink")},
+            "IntegrationUri": {
+                "Ref": assertions.Match.string_like_regexp("ApiServiceFargateService")
+            },
+        },
+    )
+
+
+def test_api_route_and_domain_mapping_are_unchanged(template):
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::Route", {"RouteKey": "ANY /{proxy+}"}
+    )
+    template.has_resource_properties(
+        "AWS::ApiGatewayV2::DomainName", {"DomainName": "api.linked-paper.com"}
+    )
+    template.resource_count_is("AWS::ApiGatewayV2::ApiMapping", 1)
+
+
+def test_search_responses_are_cached_at_the_edge(template):
+    template.has_resource_properties(
+        "AWS::CloudFront::CachePolicy",
+        {
+            "CachePolicyConfig": {
+                "DefaultTTL": 60,
+                "MinTTL": 0,
+                "ParametersInCacheKeyAndForwardedToOrigin": {
+                    "QueryStringsConfig": {"QueryStringBehavior": "all"},
+                    "HeadersConfig": {"HeaderBehavior": "none"},
+                    "CookiesConfig": {"CookieBehavior": "none"},
+                },
+            }
+        },
+    )
+
+    # Cache-Control은 검색 GET 라우트의 통합에만 설정 (프록시 통합의 POST 등은 제외)
+    integrations = template.find_resources("AWS::ApiGatewayV2::Integration")
+    routes = template.find_resources("AWS::ApiGatewayV2::Route").values()
+    targets = {
+        route["Properties"]["RouteKey"]: route["Properties"]["Target"]["Fn::Join"][1][
+            1
+        ]["Ref"]
+        for route in routes
+    }
+    assert targets["GET /search"] == targets["GET /correlations"]
+    cached = integrations[targets["GET /search"]]["Properties"]
+    assert "stale-while-revalidate=300" in (
+        cached["ResponseParameters"]["200"]["overwrite:header.Cache-Control"]
+    )
+    assert "ResponseParameters" not in (
+        integrations[targets["ANY /{proxy+}"]]["Properties"]
+    )
+
+
+def test_api_distribution_is_the_entry_point(template):
+    distribution = template.find_resources("AWS::CloudFront::Distribution")
+    (config,) = [r["Properties"]["DistributionConfig"] for r in distribution.values()]
+
+    assert config["Aliases"] == ["api.linked-paper.com"]
+    assert config["WebACLId"] == EDGE_WEB_ACL_ARN
+    assert config["Origins"][0]["OriginShield"] == {
+        "Enabled": True,
+        "OriginShieldRegion": "ap-northeast-2",
+    }
+
+    behaviors = {b["PathPattern"]: b for b in config["CacheBehaviors"]}
+    assert set(behaviors) == {"/search", "/correlations"}
+    for behavior in behaviors.values():
+        assert "POST" in behavior["AllowedMethods"]
+        assert behavior["CachedMethods"] == ["GET", "HEAD"]
+        assert behavior["FunctionAssociations"][0]["EventType"] == "viewer-request"
+
+    template.has_resource_properties(
+        "AWS::Route53::RecordSet",
+        {
+            "Name": "api.linked-paper.com.",
+            "AliasTarget": {
+                "DNSName": {
+                    "Fn::GetAtt": [
+                        assertions.Match.string_like_regexp("ApiDistribution"),
+                        "DomainName",
+                    ]
+                }
+            },
+        },
+    )
+    template.resource_count_is("AWS::WAFv2::WebACLAssociation", 0)
+
+
+def test_result_cache_is_optional(template):
+    template.resource_count_is("AWS::ElastiCache::ReplicationGroup", 0)
+
+
+def test_result_cache_is_sized_from_props():
+    app = core.App()
+    stack = BackendInfraStack(
+        app,
+        "backend-infra-cache",
+        edge_web_acl_arn=EDGE_WEB_ACL_ARN,
+        result_cache=ResultCacheProps(
+            node_type="cache.r7g.large", replicas=2, max_memory_policy="volatile-lfu"
+        ),
+        env=TEST_ENV,
+    )
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties(
+        "AWS::ElastiCache::ReplicationGroup",
+        {
+            "Engine": "valkey",
+            "CacheNodeType": "cache.r7g.large",
+            "NumCacheClusters": 3,
+            "AutomaticFailoverEnabled": True,
+            "TransitEncryptionEnabled": True,
+        },
+    )
+    template.has_resource_properties(
+        "AWS::ElastiCache::ParameterGroup",
+        {
+            "CacheParameterGroupFamily": "valkey7",
+            "Properties": {
+                "maxmemory-policy": "volatile-lfu",
+                "reserved-memory-percent": "25",
+            },
+        },
+    )
+    template.has_resource_properties(
+        "AWS::EC2::SecurityGroupIngress",
+        {
+            "FromPort": 6379,
+            "ToPort": 6379,
+            "SourceSecurityGroupId": {
+                "Fn::GetAtt": [
+                    assertions.Match.string_like_regexp("ApiSecurityGroup"),
+                    "GroupId",
+                ]
+            },
+        },
+    )
+    environment = container_environment(template, "ApiServiceContainer")
+    assert environment["RESULT_CACHE_TTL_SECONDS"] == "600"
+    assert "RESULT_CACHE_URL" in environment
+
+
+def test_search_domain_is_tuned_for_knn(template):
+    template.has_resource_properties(
+        "AWS::OpenSearchService::Domain",
+        {
+            "EngineVersion": "OpenSearch_2.13",
+            "ClusterConfig": {
+                "DedicatedMasterEnabled": True,
+                "DedicatedMasterCount": 3,
+                "DedicatedMasterType": "m6g.large.search",
+                "InstanceCount": 2,
+                "InstanceType": "r6g.large.search",
+                "ZoneAwarenessEnabled": True,
+                "ZoneAwarenessConfig": {"AvailabilityZoneCount": 2},
+                "MultiAZWithStandbyEnabled": False,
+            },
+            "LogPublishingOptions": {
+                "SEARCH_SLOW_LOGS": {"Enabled": True},
+                "INDEX_SLOW_LOGS": {"Enabled": True},
+                "ES_APPLICATION_LOGS": {"Enabled": True},
+            },
+            "VPCOptions": assertions.Match.object_like(
+                {"SubnetIds": assertions.Match.any_value()}
+            ),
+            "NodeToNodeEncryptionOptions": {"Enabled": True},
+        },
+    )
+
+    environment = container_environment(template, "SearchServiceContainer")
+    index_settings = json.loads(environment["OPENSEARCH_INDEX_SETTINGS"])
+    vector_mapping = json.loads(environment["OPENSEARCH_VECTOR_MAPPING"])
+    assert index_settings["index.knn"] is True
+    assert index_settings["index.knn.algo_param.ef_search"] == 100
+    assert vector_mapping["method"]["name"] == "hnsw"
+    assert vector_mapping["method"]["parameters"] == {"m": 16, "ef_construction": 256}
+
+
+EXISTING_SEARCH_ENDPOINT = (
+    "vpc-linked-paper-search-abc123.ap-northeast-2.es.amazonaws.com"
+)
+
+
+def search_service_access(migration):
+    stack = BackendInfraStack(
+        core.App(),
+        "backend-infra",
+        edge_web_acl_arn=EDGE_WEB_ACL_ARN,
+        search_domain_migration=migration,
+        env=TEST_ENV,
+    )
+    template = assertions.Template.from_stack(stack)
+    (search_role,) = [
+        role
+        for logical_id, role in template.find_resources("AWS::IAM::Role").items()
+        if "SearchServiceTaskRole" in logical_id
+    ]
+    managed_policies = json.dumps(search_role["Properties"].get("ManagedPolicyArns"))
+    es_resources = json.dumps(
+        [
+            statement["Resource"]
+            for policy in template.find_resources("AWS::IAM::Policy").values()
+            if "SearchServiceTaskRole" in json.dumps(policy["Properties"]["Roles"])
+            for statement in policy["Properties"]["PolicyDocument"]["Statement"]
+            if "es:ESHttpGet" in statement["Action"]
+        ]
+    )
+    environment = container_environment(template, "SearchServiceContainer")
+    return managed_policies, es_resources, environment
+
+
+def test_search_service_keeps_current_domain_until_data_is_migrated(template):
+    managed_policies, es_resources, environment = search_service_access(
+        SearchDomainMigration(migrated=False)
+    )
+
+    # 기존 엔드포인트를 모르면 서비스 설정의 엔드포인트와 기존 권한 유지
+    assert "AmazonOpenSearchServiceFullAccess" in managed_policies
+    assert "OPENSEARCH_ENDPOINT" not in environment
+    # 새 도메인은 이전 대상으로 생성되고 Search Service Task Role만 접근
+    assert "SearchDomain" in es_resources
+    template.has_output("SearchDomainEndpoint", {})
+
+
+def test_search_service_uses_imported_domain_before_cutover():
+    managed_policies, es_resources, environment = search_service_access(
+        SearchDomainMigration(
+            migrated=False, existing_endpoint=EXISTING_SEARCH_ENDPOINT
+        )
+    )
+
+    assert "AmazonOpenSearchServiceFullAccess" not in managed_policies
+    assert environment["OPENSEARCH_ENDPOINT"] == f"https://{EXISTING_SEARCH_ENDPOINT}"
+    assert ":domain/linked-paper-search" in es_resources
+
+
+def test_search_service_uses_managed_domain_after_cutover():
+    managed_policies, es_resources, environment = search_service_access(
+        SearchDomainMigration()
+    )
+
+    assert "AmazonOpenSearchServiceFullAccess" not in managed_policies
+    assert "SearchDomain" in json.dumps(environment["OPENSEARCH_ENDPOINT"])
+    assert ":domain/linked-paper-search" not in es_resources
+
+
+def test_search_target_group_waits_for_model_readiness(template):
+    template.has_resource_properties(
+        "AWS::ElasticLoadBalancingV2::TargetGroup",
+        {
+            "Port": 8000,
+            "HealthCheckPath": "/health/ready",
+            "HealthCheckIntervalSeconds": 10,
+            "HealthCheckTimeoutSeconds": 5,
+            "HealthyThresholdCount": 2,
+            "UnhealthyThresholdCount": 3,
+            "Matcher": {"HttpCode": "200"},
+            "TargetGroupAttributes": assertions.Match.array_with(
+                [
+                    {"Key": "deregistration_delay.timeout_seconds", "Value": "30"},
+                    {"Key": "slow_start.duration_seconds", "Value": "60"},
+                ]
+            ),
+        },
+    )
+
+
+def test_search_service_rolls_out_with_circuit_breaker(template):
+    template.has_resource_properties(
+        "AWS::ECS::Service",
+        {
+            "LaunchType": "EC2",
+            "HealthCheckGracePeriodSeconds": 180,
+            "DeploymentConfiguration": {
+                "MinimumHealthyPercent": 100,
+                "MaximumPercent": 200,
+                "DeploymentCircuitBreaker": {"Enable": True, "Rollback": True},
+            },
+        },
+    )
+
+
+def test_api_service_uses_capacity_profile():
+    app = core.App()
+    stack = BackendInfraStack(
+        app,
+        "backend-infra-staging",
+        edge_web_acl_arn=EDGE_WEB_ACL_ARN,
+        capacity=CAPACITY_PROFILES["staging"],
+        env=TEST_ENV,
+    )
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties(
+        "AWS::ApplicationAutoScaling::ScalableTarget",
+        {
+            "MinCapacity": 1,
+            "MaxCapacity": 2,
+            "ScheduledActions": assertions.Match.absent(),
+        },
+    )
+    template.resource_properties_count_is(
+        "AWS::ApplicationAutoScaling::ScalingPolicy",
+        {"PolicyType": "TargetTrackingScaling"},
+        2,
+    )
+    template.resource_properties_count_is(
+        "AWS::ApplicationAutoScaling::ScalingPolicy",
+        {"PolicyType": "StepScaling"},
+        1,
+    )
+
+
+def test_backend_vpc_endpoints_are_opt_in(template):
+    template.resource_count_is("AWS::EC2::VPCEndpoint", 0)
+
+    app = core.App()
+    stack = BackendInfraStack(
+        app,
+        "backend-infra-endpoints",
+        edge_web_acl_arn=EDGE_WEB_ACL_ARN,
+        private_endpoints=True,
+        env=TEST_ENV,
+    )
+    endpoints_template = assertions.Template.from_stack(stack)
+
+    endpoints_template.resource_count_is("AWS::EC2::VPCEndpoint", 6)
+
+
+def test_services_ship_logs_through_firelens(template):
+    for task_definition in template.find_resources("AWS::ECS::TaskDefinition").values():
+        names = [
+            c["Name"] for c in task_definition["Properties"]["ContainerDefinitions"]
+        ]
+        app = task_definition["Properties"]["ContainerDefinitions"][0]
+        # 앱 컨테이너가 기본 컨테이너(첫 번째)로 남아 있어야 함
+        assert names[0] != "LogRouter" and "LogRouter" in names
+        assert app["LogConfiguration"]["LogDriver"] == "awsfirelens"
+
+
+def test_search_task_fits_gpu_instance(template):
+    # g4dn.xlarge가 ECS에 등록하는 CPU는 4096 유닛
+    search = next(
+        task_definition
+        for task_definition in template.find_resources(
+            "AWS::ECS::TaskDefinition"
+        ).values()
+        if "EC2" in task_definition["Properties"]["RequiresCompatibilities"]
+    )
+    containers = search["Properties"]["ContainerDefinitions"]
+    assert sum(container.get("Cpu", 0) for container in containers) <= 4096
+
+
+def test_services_run_trace_collector_sidecar(template):
+    sample_rates = {}
+    for task_definition in template.find_resources("AWS::ECS::TaskDefinition").values():
+        containers = task_definition["Properties"]["ContainerDefinitions"]
+        names = [c["Name"] for c in containers]
+        assert "TraceCollector" in names
+        collector = containers[names.index("TraceCollector")]
+        assert collector["Essential"] is False
+        assert "AOT_CONFIG_CONTENT" in {e["Name"] for e in collector["Environment"]}
+
+        environment = {e["Name"]: e["Value"] for e in containers[0]["Environment"]}
+        sample_rates[environment["OTEL_SERVICE_NAME"]] = environment[
+            "OTEL_TRACES_SAMPLER_ARG"
+        ]
+    assert sample_rates == {"api-service": "0.05", "search-service": "0.05"}
+
+    template.has_resource_properties(
+        "AWS::IAM::Policy",
+        {
+            "PolicyDocument": {
+                "Statement": assertions.Match.array_with(
+                    [
+                        assertions.Match.object_like(
+                            {
+                                "Action": assertions.Match.array_with(
+                                    ["xray:PutTraceSegments"]
+                                )
+                            }
+                        )
+                    ]
+                )
+            }
+        },
+    )
+
+
+def test_api_gateway_logs_integration_latency(template):
+    (stage,) = template.find_resources("AWS::ApiGatewayV2::Stage").values()
+    access_log = stage["Properties"]["AccessLogSettings"]
+    assert "$context.integrationLatency" in access_log["Format"]
+    assert access_log["DestinationArn"]["Fn::GetAtt"][0].startswith(
+        "ApiGatewayAccessLogGroup"
+    )
+
+
+def test_api_gateway_caps_origin_throughput(template):
+    (stage,) = template.find_resources("AWS::ApiGatewayV2::Stage").values()
+    properties = stage["Properties"]
+    # 엣지 WAF 대신 캐시 미스만 도달하는 API Gateway에서 검색 서비스 처리량 제한
+    assert properties["RouteSettings"] == {
+        "GET /search": {"ThrottlingRateLimit": 20, "ThrottlingBurstLimit": 40}
+    }
+    assert properties["DefaultRouteSettings"] == {
+        "ThrottlingRateLimit": 40,
+        "ThrottlingBurstLimit": 80,
+    }
+    routes = template.find_resources(
+        "AWS::ApiGatewayV2::Route", {"Properties": {"RouteKey": "GET /search"}}
+    )
+    assert set(routes) <= set(stage["DependsOn"])
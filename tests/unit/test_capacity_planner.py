@@ -0,0 +1,204 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from capacity_planner.planner import (
+    SERVICES,
+    UsageModel,
+    current_sizes,
+    load_metrics,
+    plan,
+    recommend,
+    size_diff,
+)
+from capacity_planner.stack_sizes import hard_coded_sizes, profile_sizes
+
+MINUTES = 60 * 24 * 30
+
+
+def synthetic_metrics(cpu_per_request, allocated_cpu, gpu_per_request=None, seed=0):
+    """하루 주기 부하에 비례하는 CPU/GPU 사용률과 일정한 메모리 사용률"""
+    rng = np.random.default_rng(seed)
+    minutes = np.arange(MINUTES)
+    requests = 300 * (np.sin(2 * np.pi * minutes / 1440) + 1.2)
+    tasks = np.ceil(requests / 250)
+    load = requests / tasks
+    metrics = {
+        "timestamp": minutes * 60.0,
+        "requests": requests,
+        "tasks": tasks,
+        "cpu": (50 + cpu_per_request * load) / allocated_cpu * 100
+        + rng.normal(0, 0.5, MINUTES),
+        "memory": np.full(MINUTES, 30.0),
+    }
+    if gpu_per_request is not None:
+        metrics["gpu"] = 5 + gpu_per_request * load
+    return metrics
+
+
+def test_hard_coded_sizes_resolve_sidecar_expressions():
+    values = {
+        (value.construct, value.field): value
+        for value in hard_coded_sizes("linked_paper_web_infra/backend_stack.py")
+    }
+    api_cpu = values[("ApiServiceContainer", "cpu")]
+    assert api_cpu.expression == "1024 - sidecar_cpu"
+    # FireLens 라우터 + 트레이스 컬렉터 기본값
+    assert api_cpu.value == 1024 - 64 - 64
+    assert values[("ApiServiceContainer", "memory_limit_mib")].value == 2048 - 192 - 256
+    assert values[("SearchServiceContainer", "memory_limit_mib")].value == 8192
+    assert values[("GPUAutoScalingGroup", "max_capacity")].value == 3
+    assert values[("create_api_task_definition", "cpu")].value == 1024
+
+
+def test_profile_sizes_point_at_capacity_profile_entries():
+    values = {
+        (value.construct, value.field): value
+        for value in profile_sizes("linked_paper_web_infra/scaling.py", "staging")
+    }
+    max_capacity = values[("capacity.web", "max_capacity")]
+    assert max_capacity.value == 2
+    # 프로파일에서 생략한 필드는 데이터클래스 기본값 위치
+    requests_per_target = values[("capacity.web", "requests_per_target")]
+    assert requests_per_target.value == 100
+    assert requests_per_target.line < max_capacity.line
+
+
+def test_usage_model_recovers_linear_fit():
+    load = np.linspace(0, 100, 1000)
+    model = UsageModel.fit(load, 20 + 3 * load, quantile=99)
+    assert model.intercept == pytest.approx(20)
+    assert model.slope == pytest.approx(3)
+    assert model.capacity(320)[()] == pytest.approx(100)
+
+    flat = UsageModel.fit(load, np.full_like(load, 500.0), quantile=99)
+    assert flat.slope == 0
+    assert np.isinf(flat.capacity(600))
+    assert flat.capacity(400) == 0
+
+
+def test_fargate_recommendation_keeps_headroom_and_sidecar_share():
+    spec = SERVICES["api"]
+    current = current_sizes(spec)
+    metrics = synthetic_metrics(cpu_per_request=4, allocated_cpu=1024)
+
+    recommendation = recommend("api", spec, metrics, current, headroom=0.3)
+
+    # p99 CPU 사용량이 선택한 크기의 70% 이하
+    assert recommendation.models["cpu"].at(recommendation.capacity) <= (
+        recommendation.cpu * 0.7 + 1e-6
+    )
+    assert recommendation.max_tasks >= np.ceil(
+        metrics["requests"].max() / recommendation.capacity
+    )
+    container_cpu = recommendation.values[("ApiServiceContainer", "cpu")]
+    assert recommendation.cpu - container_cpu == 1024 - 896
+
+    # 태스크 수와 스케일링 목표는 오토스케일링 프로파일과 비교 (desired_count는 제외)
+    values = recommendation.values
+    assert values[("capacity.api", "max_capacity")] == recommendation.max_tasks
+    assert (
+        values[("capacity.api", "requests_per_target")]
+        == recommendation.requests_per_target
+    )
+    assert not any(field == "desired_count" for _, field in values)
+    diff = size_diff(recommendation, current)
+    assert any(
+        line.startswith("- linked_paper_web_infra/scaling.py:")
+        and "capacity.api requests_per_target=150" in line
+        for line in diff
+    )
+
+
+def test_fargate_recommendation_with_load_independent_usage_caps_capacity():
+    metrics = synthetic_metrics(cpu_per_request=0, allocated_cpu=512)
+    metrics["cpu"] = np.full(MINUTES, 20.0)
+    spec = SERVICES["web"]
+
+    recommendation = recommend("web", spec, metrics, current_sizes(spec))
+
+    # CPU/메모리 모두 부하와 무관하면 관측된 최대 부하를 태스크 하나가 처리
+    assert recommendation.capacity == pytest.approx(metrics["requests"].max())
+    assert recommendation.requests_per_target == int(metrics["requests"].max())
+    assert recommendation.min_tasks == recommendation.max_tasks == 1
+
+
+def test_gpu_recommendation_sets_asg_bounds_and_diff(tmp_path):
+    header = "timestamp,requests,tasks,cpu,memory,gpu"
+    metrics = synthetic_metrics(
+        cpu_per_request=1, allocated_cpu=3968, gpu_per_request=0.5
+    )
+    path = tmp_path / "search.csv"
+    np.savetxt(
+        path,
+        np.column_stack([metrics[name] for name in header.split(",")]),
+        delimiter=",",
+        header=header,
+        comments="",
+    )
+    assert set(load_metrics(str(path))) == set(header.split(","))
+
+    ((recommendation, current),) = plan([("search", str(path))], headroom=0.3)
+    values = recommendation.values
+    assert values[("capacity.search", "max_instances")] == recommendation.max_tasks + 1
+    assert values[("capacity.search", "min_instances")] == recommendation.min_tasks
+    assert values[("capacity.search", "desired_tasks")] == recommendation.min_tasks
+    # GPU 70% 기준: (100 * 0.7 - 5) / 0.5 = 130 req/min/task
+    assert recommendation.capacity == pytest.approx(130)
+
+    diff = size_diff(recommendation, current)
+    assert "- linked_paper_web_infra/backend_stack.py:" in diff[0]
+    assert any("memory_limit_mib=1024 * 8" in line for line in diff)
+    # 인스턴스 수는 backend_stack.py의 capacity.search.* 참조식이 아니라 프로파일 항목을 가리킴
+    instance_lines = [line for line in diff if "_instances=" in line]
+    assert instance_lines
+    assert all("linked_paper_web_infra/scaling.py:" in line for line in instance_lines)
+    assert not any("capacity.search.max_instances" in line for line in diff)
+
+
+def test_load_metrics_requires_columns(tmp_path):
+    path = tmp_path / "web.csv"
+    path.write_text("timestamp,requests,cpu\n0,1,2\n")
+    with pytest.raises(ValueError, match="memory, tasks"):
+        load_metrics(str(path))
+
+
+def test_load_metrics_parses_iso_timestamps_and_ignores_other_columns(tmp_path):
+    path = tmp_path / "web.csv"
+    path.write_text(
+        "timestamp,service,requests,tasks,cpu,memory\n"
+        "2024-05-01T00:00:00+00:00,web,10,1,20,30\n"
+        "2024-05-01T00:01:00+00:00,web,12,2,,30\n"
+        "2024-05-01T00:02:00+00:00,web,14,0,20,30\n"
+    )
+
+    metrics = load_metrics(str(path))
+
+    assert set(metrics) == {"timestamp", "requests", "tasks", "cpu", "memory"}
+    # 빈 값이 있는 행과 태스크가 0인 행은 제외
+    assert metrics["requests"].tolist() == [10.0]
+    assert metrics["timestamp"].tolist() == [1714521600.0]
+
+
+def test_load_metrics_reports_malformed_rows(tmp_path):
+    path = tmp_path / "web.csv"
+    path.write_text("requests,tasks,cpu,memory\n1,1,20,30\n1,one,20,30\n")
+    with pytest.raises(ValueError, match=r"web\.csv:3: malformed row"):
+        load_metrics(str(path))
+
+
+def test_fargate_recommendation_leaves_room_for_the_app_container():
+    spec = SERVICES["api"]
+    current = current_sizes(spec)
+    container = current[("ApiServiceContainer", "cpu")]
+    current[("ApiServiceContainer", "cpu")] = dataclasses.replace(container, value=768)
+    # 부하가 작아 가장 작은 크기(256 CPU)가 가장 싸지만 사이드카 몫(256)을 빼면 앱이 들어가지 않음
+    metrics = synthetic_metrics(cpu_per_request=0.01, allocated_cpu=1024)
+    metrics["memory"] = np.full(MINUTES, 1.0)
+
+    recommendation = recommend("api", spec, metrics, current, headroom=0.3)
+
+    assert recommendation.cpu == 512
+    assert recommendation.values[("ApiServiceContainer", "cpu")] == 256
+    assert recommendation.values[("ApiServiceContainer", "memory_limit_mib")] >= 256
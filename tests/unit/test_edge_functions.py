@@ -0,0 +1,44 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("node") is None, reason="CloudFront Functions run on Node.js"
+)
+
+
+def run_viewer_request(path, request):
+    with open(path, encoding="utf-8") as source:
+        code = source.read()
+    script = f"{code}\nconsole.log(JSON.stringify(handler({{request: {json.dumps(request)}}})));"
+    output = subprocess.run(
+        ["node", "-e", script], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def test_query_normalization_only_sorts_keys_and_drops_empty_values():
+    request = run_viewer_request(
+        "edge_functions/normalize_query_string.js",
+        {
+            "uri": "/correlations",
+            "querystring": {
+                "paperId": {"value": "42"},
+                "limit": {"value": ""},
+                "Query": {"value": " Graph  Neural "},
+                "query": {
+                    "value": "a",
+                    "multiValue": [{"value": "a"}, {"value": ""}, {"value": "b"}],
+                },
+            },
+        },
+    )
+
+    querystring = request["querystring"]
+    # 키 대소문자와 값은 오리진에 그대로 전달
+    assert list(querystring) == ["Query", "paperId", "query"]
+    assert querystring["paperId"] == {"value": "42"}
+    assert querystring["Query"] == {"value": " Graph  Neural "}
+    assert querystring["query"]["multiValue"] == [{"value": "a"}, {"value": "b"}]
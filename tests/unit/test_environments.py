@@ -0,0 +1,219 @@
+import json
+import os
+
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+import pytest
+
+from app import build_app, load_context, synth_environments
+from linked_paper_web_infra.environments import ENVIRONMENTS
+
+ACCOUNT = "123456789012"
+REGION = "ap-northeast-2"
+
+
+@pytest.fixture(scope="module")
+def loadtest_app():
+    config = ENVIRONMENTS["loadtest"].resolve(ACCOUNT, REGION)
+    return build_app(core.App(context=load_context()), config)
+
+
+@pytest.fixture(scope="module")
+def prod_app():
+    return build_app(
+        core.App(context=load_context()), ENVIRONMENTS["prod"].resolve(ACCOUNT, REGION)
+    )
+
+
+def template(app, stack_id):
+    return assertions.Template.from_stack(app.node.find_child(stack_id))
+
+
+def test_environment_stacks_are_prefixed(loadtest_app):
+    stack_ids = {child.node.id for child in loadtest_app.node.children}
+    assert "LoadTestBackendInfraStack" in stack_ids
+    assert all(stack_id.startswith("LoadTest") for stack_id in stack_ids)
+
+
+def test_only_loadtest_environment_deploys_load_generator(loadtest_app):
+    generator = template(loadtest_app, "LoadTestLoadGeneratorStack")
+    generator.has_resource_properties(
+        "AWS::EC2::SecurityGroupIngress",
+        {
+            "FromPort": 80,
+            "GroupId": {
+                "Fn::ImportValue": assertions.Match.string_like_regexp(
+                    "LoadTestBackendInfraStack:.*ApiServiceFargateServiceLBSecurityGroup"
+                )
+            },
+        },
+    )
+    assert not any(
+        config.load_test
+        for config in ENVIRONMENTS.values()
+        if config.name != "loadtest"
+    )
+
+
+def test_backend_exports_and_imports_use_environment_prefix(loadtest_app):
+    backend = template(loadtest_app, "LoadTestBackendInfraStack").to_json()
+    exports = {
+        output["Export"]["Name"]
+        for output in backend["Outputs"].values()
+        if "Export" in output
+    }
+    assert {"LoadTestApiClusterName", "LoadTestApiServiceName"} <= exports
+
+    monitor = template(loadtest_app, "LoadTestApiServerHealthMonitor")
+    monitor.has_resource_properties(
+        "AWS::CloudWatch::Alarm",
+        {
+            "Dimensions": assertions.Match.array_with(
+                [
+                    {
+                        "Name": "ClusterName",
+                        "Value": {"Fn::ImportValue": "LoadTestApiClusterName"},
+                    }
+                ]
+            )
+        },
+    )
+
+
+def test_backend_reads_capacity_domain_and_certificate_from_config(loadtest_app):
+    backend = template(loadtest_app, "LoadTestBackendInfraStack")
+    search = ENVIRONMENTS["loadtest"].capacity.search
+
+    backend.has_resource_properties(
+        "AWS::AutoScaling::AutoScalingGroup",
+        {
+            "MinSize": str(search.min_instances),
+            "MaxSize": str(search.max_instances),
+            "DesiredCapacity": str(search.desired_instances),
+        },
+    )
+    backend.has_resource_properties(
+        "AWS::CloudFront::Distribution",
+        {
+            "DistributionConfig": assertions.Match.object_like(
+                {"Aliases": ["api.loadtest.linked-paper.com"]}
+            )
+        },
+    )
+
+
+def test_environment_without_certificate_arn_issues_us_east_1_certificate(
+    loadtest_app, prod_app
+):
+    certificate_stack = loadtest_app.node.find_child("LoadTestEdgeCertificateStack")
+    assert certificate_stack.region == "us-east-1"
+    template(loadtest_app, "LoadTestEdgeCertificateStack").has_resource_properties(
+        "AWS::CertificateManager::Certificate",
+        {
+            "DomainName": "*.loadtest.linked-paper.com",
+            "SubjectAlternativeNames": ["loadtest.linked-paper.com"],
+            "ValidationMethod": "DNS",
+        },
+    )
+    # 배포 스택의 CloudFront는 리전 간 참조로 같은 인증서를 사용
+    for stack_id in ("LoadTestBackendInfraStack", "LoadTestLinkedPaperWebInfraStack"):
+        distributions = template(loadtest_app, stack_id).find_resources(
+            "AWS::CloudFront::Distribution"
+        )
+        for distribution in distributions.values():
+            config = distribution["Properties"]["DistributionConfig"]
+            reader, export = config["ViewerCertificate"]["AcmCertificateArn"][
+                "Fn::GetAtt"
+            ]
+            assert reader.startswith("ExportsReader")
+            assert "LoadTestEdgeCertificateStack" in export
+
+    assert prod_app.node.try_find_child("EdgeCertificateStack") is None
+
+
+def test_api_server_alarms_invoke_notifier_with_separate_permissions(prod_app):
+    # cdk.json의 changeLambdaPermissionLogicalIdForLambdaAction 플래그로 알람마다 권한 ID 분리
+    monitor = template(prod_app, "ApiServerHealthMonitor")
+    permissions = monitor.find_resources(
+        "AWS::Lambda::Permission",
+        {"Properties": {"Principal": "lambda.alarms.cloudwatch.amazonaws.com"}},
+    )
+    alarms = monitor.find_resources("AWS::CloudWatch::Alarm")
+
+    assert len(permissions) == len(alarms) == 2
+    for alarm in alarms.values():
+        (action,) = alarm["Properties"]["AlarmActions"]
+        assert action["Fn::GetAtt"][0].startswith("SlackNotifierLambda")
+
+
+def test_monitors_use_environment_slack_secret(loadtest_app):
+    for stack_id in (
+        "LoadTestApiServerHealthMonitor",
+        "LoadTestEcsDeploymentNotifierStack",
+        "LoadTestBatchFailureAlertStack",
+        "LoadTestNatGatewayMonitoringStack",
+    ):
+        template(loadtest_app, stack_id).has_resource_properties(
+            "AWS::Lambda::Function",
+            {
+                "Environment": {
+                    "Variables": assertions.Match.object_like(
+                        {"SECRET_NAME": "LoadTestSlackWebhookURL"}
+                    )
+                }
+            },
+        )
+
+
+def test_prod_monitors_nat_gateways_of_front_and_backend_vpcs(prod_app):
+    alarms = template(prod_app, "NatGatewayMonitoringStack").find_resources(
+        "AWS::CloudWatch::Alarm", {"Properties": {"MetricName": "ErrorPortAllocation"}}
+    )
+    nat_gateways = [
+        alarm["Properties"]["Dimensions"][0]["Value"] for alarm in alarms.values()
+    ]
+
+    # 조회한 백엔드 VPC의 NAT Gateway와 프론트 VPC에서 찾은 NAT Gateway
+    assert "nat-05c30695a91f4edcb" in nat_gateways
+    assert any("Fn::ImportValue" in value for value in nat_gateways)
+
+
+def test_every_vpc_gets_private_endpoints_once(prod_app, loadtest_app):
+    # 백엔드가 별도 VPC(vpc_id)를 조회하는 환경만 백엔드 스택에서 엔드포인트 생성
+    for config in ENVIRONMENTS.values():
+        assert config.private_endpoints == (config.vpc_id is not None), config.name
+
+    for app, prefix in ((prod_app, ""), (loadtest_app, "LoadTest")):
+        backend = template(app, f"{prefix}BackendInfraStack")
+        front = template(app, f"{prefix}LinkedPaperWebInfraStack")
+        front.resource_count_is("AWS::EC2::VPCEndpoint", 6)
+        backend.resource_count_is("AWS::EC2::VPCEndpoint", 6 if not prefix else 0)
+    # 운영 백엔드 엔드포인트는 프론트 VPC 참조가 아니라 조회한 VPC ID에 생성
+    endpoints = template(prod_app, "BackendInfraStack").find_resources(
+        "AWS::EC2::VPCEndpoint"
+    )
+    assert all(
+        isinstance(endpoint["Properties"]["VpcId"], str)
+        for endpoint in endpoints.values()
+    )
+
+
+def test_waf_log_group_is_unique_per_environment(loadtest_app):
+    template(loadtest_app, "LoadTestWafStack").has_resource_properties(
+        "AWS::Logs::LogGroup",
+        {"LogGroupName": "aws-waf-logs-linked-paper-api-loadtest"},
+    )
+
+
+def test_environments_synthesize_into_separate_assemblies(tmp_path):
+    results = synth_environments(
+        ["prod", "loadtest"], ACCOUNT, REGION, str(tmp_path), load_context()
+    )
+
+    assert [name for name, _, _ in results] == ["prod", "loadtest"]
+    for name, directory, _ in results:
+        assert directory == os.path.join(str(tmp_path), name)
+        with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as f:
+            artifacts = json.load(f)["artifacts"]
+        prefix = ENVIRONMENTS[name].stack_prefix
+        assert f"{prefix}BackendInfraStack" in artifacts
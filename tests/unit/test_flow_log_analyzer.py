@@ -0,0 +1,162 @@
+import gzip
+import io
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from traffic_monitor.flow_log_analyzer import (
+    TrafficAggregator,
+    analyze,
+    ecs_task_endpoints,
+    read_chunks,
+)
+from traffic_monitor.nat_gateway import NAT_FLOW_LOG_FIELDS
+
+NAT_ENI = "eni-0nat"
+NAT_IP = "10.0.0.220"
+API_TASK_IP = "10.0.1.5"
+WEB_TASK_IP = "10.0.2.7"
+HUGGINGFACE = "203.0.113.5"
+SLACK = "198.51.100.9"
+
+
+def record(direction, srcaddr, dstaddr, pkt_src, pkt_dst, bytes_, status="OK"):
+    values = {
+        "version": "5",
+        "interface-id": NAT_ENI,
+        "flow-direction": direction,
+        "srcaddr": srcaddr,
+        "dstaddr": dstaddr,
+        "pkt-srcaddr": pkt_src,
+        "pkt-dstaddr": pkt_dst,
+        "dstport": "443",
+        "protocol": "6",
+        "packets": "10",
+        "bytes": str(bytes_),
+        "start": "1729000000",
+        "end": "1729000060",
+        "action": "ACCEPT",
+        "log-status": status,
+    }
+    return " ".join(values[field] for field in NAT_FLOW_LOG_FIELDS)
+
+
+def nat_flow(task_ip, remote_ip, upload, download):
+    """태스크 <-> 외부 통신 한 건이 NAT ENI에 남기는 4개 레코드"""
+    return [
+        # 태스크 -> NAT (업로드)
+        record("ingress", task_ip, NAT_IP, task_ip, remote_ip, upload),
+        # NAT -> 외부 (업로드, 주소 변환 후)
+        record("egress", NAT_IP, remote_ip, NAT_IP, remote_ip, upload),
+        # 외부 -> NAT (다운로드)
+        record("ingress", remote_ip, NAT_IP, remote_ip, NAT_IP, download),
+        # NAT -> 태스크 (다운로드)
+        record("egress", NAT_IP, task_ip, remote_ip, task_ip, download),
+    ]
+
+
+@pytest.fixture
+def flow_log_dir(tmp_path):
+    hour = tmp_path / "2024" / "10" / "15" / "14"
+    hour.mkdir(parents=True)
+    files = {
+        "a.log.gz": nat_flow(API_TASK_IP, HUGGINGFACE, 2_000, 5_000_000)
+        + nat_flow(WEB_TASK_IP, SLACK, 1_000, 3_000),
+        "b.log.gz": nat_flow(API_TASK_IP, HUGGINGFACE, 1_000, 4_000_000)
+        + [record("-", "-", "-", "-", "-", "-", status="NODATA")],
+    }
+    for name, lines in files.items():
+        with gzip.open(hour / name, "wt") as f:
+            f.write(" ".join(NAT_FLOW_LOG_FIELDS) + "\n")
+            f.write("\n".join(lines) + "\n")
+    return tmp_path
+
+
+def test_top_talkers_count_each_nat_byte_once(flow_log_dir):
+    aggregator = analyze([str(flow_log_dir)], vpc_cidrs=["10.0.0.0/16"], chunk_lines=3)
+
+    assert aggregator.total_bytes == 9_003_000 + 4_000
+    (first, second) = aggregator.top(5)
+    assert (first.source, first.destination) == (API_TASK_IP, HUGGINGFACE)
+    assert first.bytes == 9_003_000
+    assert first.share == pytest.approx(9_003_000 / 9_007_000)
+    assert (second.source, second.destination, second.bytes) == (
+        WEB_TASK_IP,
+        SLACK,
+        4_000,
+    )
+    assert aggregator.bytes_by_source() == {
+        API_TASK_IP: 9_003_000,
+        WEB_TASK_IP: 4_000,
+    }
+
+
+def test_chunk_size_does_not_change_totals(flow_log_dir):
+    small = analyze([str(flow_log_dir)], chunk_lines=1)
+    large = analyze([str(flow_log_dir)], chunk_lines=10_000)
+
+    assert small.bytes_by_source() == large.bytes_by_source()
+
+
+def test_read_chunks_requires_packet_address_fields(tmp_path):
+    path = tmp_path / "default-format.log"
+    path.write_text("version account-id interface-id srcaddr dstaddr bytes\n")
+
+    with open(path) as stream, pytest.raises(ValueError, match="pkt-srcaddr"):
+        list(read_chunks(stream))
+
+
+def test_talkers_are_mapped_to_ecs_services(flow_log_dir):
+    client = boto3.client(
+        "ecs",
+        region_name="ap-northeast-2",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+    task_arn = "arn:aws:ecs:ap-northeast-2:123456789012:task/ApiCluster/abc"
+    stubber = Stubber(client)
+    stubber.add_response(
+        "list_tasks", {"taskArns": [task_arn]}, {"cluster": "ApiCluster"}
+    )
+    stubber.add_response(
+        "describe_tasks",
+        {
+            "tasks": [
+                {
+                    "taskArn": task_arn,
+                    "group": "service:ApiService",
+                    "attachments": [
+                        {
+                            "type": "ElasticNetworkInterface",
+                            "details": [
+                                {"name": "networkInterfaceId", "value": "eni-0api"},
+                                {"name": "privateIPv4Address", "value": API_TASK_IP},
+                            ],
+                        }
+                    ],
+                }
+            ]
+        },
+        {"cluster": "ApiCluster", "tasks": [task_arn]},
+    )
+    stubber.activate()
+
+    endpoints = ecs_task_endpoints(client, ["ApiCluster"])
+    (api, web) = analyze([str(flow_log_dir)]).top(2, endpoints)
+
+    assert api.endpoint.service == "ApiService"
+    assert api.endpoint.eni_id == "eni-0api"
+    assert web.endpoint is None
+    stubber.assert_no_pending_responses()
+
+
+def test_aggregator_ignores_traffic_that_stays_in_the_vpc():
+    aggregator = TrafficAggregator(["10.0.0.0/16"])
+    lines = [record("ingress", API_TASK_IP, NAT_IP, API_TASK_IP, "10.0.3.3", 500)]
+    header = " ".join(NAT_FLOW_LOG_FIELDS)
+
+    for columns in read_chunks(io.StringIO("\n".join([header, *lines]))):
+        aggregator.add(columns)
+
+    assert aggregator.total_bytes == 0
@@ -0,0 +1,337 @@
+import json
+
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+import pytest
+from aws_cdk import aws_cloudfront as cloudfront
+
+from linked_paper_web_infra.front_stack import LinkedPaperWebInfraStack
+
+TEST_ENV = core.Environment(account="123456789012", region="ap-northeast-2")
+
+
+@pytest.fixture(scope="module")
+def template():
+    app = core.App()
+    stack = LinkedPaperWebInfraStack(app, "linked-paper-web-infra", env=TEST_ENV)
+    return assertions.Template.from_stack(stack)
+
+
+def scaling_policies(template):
+    return {
+        policy["Properties"]["PolicyName"]: policy["Properties"]
+        for policy in template.find_resources(
+            "AWS::ApplicationAutoScaling::ScalingPolicy"
+        ).values()
+    }
+
+
+def test_web_service_scales_on_requests_latency_and_cpu(template):
+    template.has_resource_properties(
+        "AWS::ApplicationAutoScaling::ScalableTarget",
+        {"MinCapacity": 1, "MaxCapacity": 6},
+    )
+
+    policies = scaling_policies(template)
+    request_policy = next(p for n, p in policies.items() if "RequestCount" in n)
+    cpu_policy = next(p for n, p in policies.items() if "CpuScaling" in n)
+    latency_policy = next(p for n, p in policies.items() if "LatencyStepScaling" in n)
+
+    request_config = request_policy["TargetTrackingScalingPolicyConfiguration"]
+    assert request_config["TargetValue"] == 300
+    assert (
+        request_config["PredefinedMetricSpecification"]["PredefinedMetricType"]
+        == "ALBRequestCountPerTarget"
+    )
+
+    cpu_config = cpu_policy["TargetTrackingScalingPolicyConfiguration"]
+    assert cpu_config["TargetValue"] == 60
+
+    step_config = latency_policy["StepScalingPolicyConfiguration"]
+    assert step_config["AdjustmentType"] == "ChangeInCapacity"
+    assert [s["ScalingAdjustment"] for s in step_config["StepAdjustments"]] == [1, 2]
+
+    template.has_resource_properties(
+        "AWS::CloudWatch::Alarm",
+        {
+            "MetricName": "TargetResponseTime",
+            "ExtendedStatistic": "p99",
+            "Threshold": 0.5,
+            "ComparisonOperator": "GreaterThanOrEqualToThreshold",
+        },
+    )
+
+
+def test_web_service_prewarms_before_weekday_peak(template):
+    template.has_resource_properties(
+        "AWS::ApplicationAutoScaling::ScalableTarget",
+        {
+            "ScheduledActions": [
+                {
+                    "ScheduledActionName": assertions.Match.string_like_regexp(
+                        "WeekdayMorningPrewarm"
+                    ),
+                    "Schedule": "cron(40 8 ? * MON-FRI *)",
+                    "ScalableTargetAction": {"MinCapacity": 2},
+                    "Timezone": "Asia/Seoul",
+                },
+                {
+                    "ScheduledActionName": assertions.Match.string_like_regexp(
+                        "WeekdayMorningCooldown"
+                    ),
+                    "Schedule": "cron(0 19 ? * MON-FRI *)",
+                    "ScalableTargetAction": {"MinCapacity": 1},
+                    "Timezone": "Asia/Seoul",
+                },
+            ]
+        },
+    )
+
+
+def web_distribution_config(template):
+    for distribution in template.find_resources(
+        "AWS::CloudFront::Distribution"
+    ).values():
+        config = distribution["Properties"]["DistributionConfig"]
+        if config["Aliases"] == ["linked-paper.com"]:
+            return config
+    raise AssertionError("linked-paper.com distribution not found")
+
+
+def test_web_distribution_fronts_the_alb(template):
+    config = web_distribution_config(template)
+
+    assert config["HttpVersion"] == "http2and3"
+    (origin,) = config["Origins"]
+    assert origin["DomainName"] == "origin.linked-paper.com"
+    assert origin["CustomOriginConfig"]["OriginProtocolPolicy"] == "https-only"
+    assert config["DefaultCacheBehavior"]["Compress"] is True
+    assert "POST" in config["DefaultCacheBehavior"]["AllowedMethods"]
+
+    behaviors = {b["PathPattern"]: b for b in config["CacheBehaviors"]}
+    assert set(behaviors) == {"/_next/static/*", "/_next/image*"}
+    # Managed-CachingOptimized
+    assert (
+        behaviors["/_next/static/*"]["CachePolicyId"]
+        == "658327ea-f89d-4fab-a63d-7e88639e58f6"
+    )
+    assert all(behavior["Compress"] for behavior in behaviors.values())
+
+    template.has_resource_properties(
+        "AWS::Route53::RecordSet",
+        {
+            "Name": "linked-paper.com.",
+            "AliasTarget": {
+                "DNSName": {
+                    "Fn::GetAtt": [
+                        assertions.Match.string_like_regexp(
+                            "LinkedPaperWebDistribution"
+                        ),
+                        "DomainName",
+                    ]
+                }
+            },
+        },
+    )
+
+
+def test_page_and_image_cache_policies(template):
+    template.has_resource_properties(
+        "AWS::CloudFront::CachePolicy",
+        {
+            "CachePolicyConfig": {
+                "DefaultTTL": 0,
+                "ParametersInCacheKeyAndForwardedToOrigin": {
+                    "EnableAcceptEncodingBrotli": True,
+                    "EnableAcceptEncodingGzip": True,
+                    "HeadersConfig": {
+                        "HeaderBehavior": "whitelist",
+                        "Headers": assertions.Match.array_with(["RSC", "Next-Url"]),
+                    },
+                    "QueryStringsConfig": {"QueryStringBehavior": "all"},
+                },
+            }
+        },
+    )
+    template.has_resource_properties(
+        "AWS::CloudFront::CachePolicy",
+        {
+            "CachePolicyConfig": {
+                "ParametersInCacheKeyAndForwardedToOrigin": {
+                    "HeadersConfig": {
+                        "HeaderBehavior": "whitelist",
+                        "Headers": ["Accept"],
+                    },
+                    "QueryStringsConfig": {
+                        "QueryStringBehavior": "whitelist",
+                        "QueryStrings": ["url", "w", "q"],
+                    },
+                },
+            }
+        },
+    )
+
+
+def cdn_distribution_config(template):
+    for distribution in template.find_resources(
+        "AWS::CloudFront::Distribution"
+    ).values():
+        config = distribution["Properties"]["DistributionConfig"]
+        if config["Aliases"] == ["cdn.linked-paper.com"]:
+            return config
+    raise AssertionError("cdn.linked-paper.com distribution not found")
+
+
+def test_cdn_reads_bucket_through_origin_access_control(template):
+    config = cdn_distribution_config(template)
+
+    (origin,) = config["Origins"]
+    assert "CustomOriginConfig" not in origin
+    assert origin["S3OriginConfig"] == {"OriginAccessIdentity": ""}
+    logical_id, attribute = origin["OriginAccessControlId"]["Fn::GetAtt"]
+    assert logical_id.startswith("CdnOriginAccessControl")
+    assert attribute == "Id"
+    assert origin["OriginShield"] == {
+        "Enabled": True,
+        "OriginShieldRegion": "ap-northeast-2",
+    }
+
+    template.has_resource_properties(
+        "AWS::CloudFront::OriginAccessControl",
+        {
+            "OriginAccessControlConfig": {
+                "OriginAccessControlOriginType": "s3",
+                "SigningBehavior": "always",
+                "SigningProtocol": "sigv4",
+            }
+        },
+    )
+    template.resource_count_is("AWS::CloudFront::CloudFrontOriginAccessIdentity", 0)
+    template.has_resource_properties(
+        "AWS::S3::BucketPolicy",
+        {
+            "PolicyDocument": {
+                "Statement": assertions.Match.array_with(
+                    [
+                        assertions.Match.object_like(
+                            {
+                                "Action": "s3:GetObject",
+                                "Principal": {"Service": "cloudfront.amazonaws.com"},
+                                "Condition": {
+                                    "StringEquals": {
+                                        "AWS:SourceArn": assertions.Match.any_value()
+                                    }
+                                },
+                            }
+                        )
+                    ]
+                )
+            }
+        },
+    )
+
+
+def test_cdn_caching_protocol_and_price_class(template):
+    config = cdn_distribution_config(template)
+
+    assert config["HttpVersion"] == "http2and3"
+    assert config["PriceClass"] == "PriceClass_200"
+    behavior = config["DefaultCacheBehavior"]
+    assert behavior["Compress"] is True
+    assert "ResponseHeadersPolicyId" in behavior
+    assert behavior["CachePolicyId"]["Ref"].startswith("CdnStaticCachePolicy")
+
+    template.has_resource_properties(
+        "AWS::CloudFront::CachePolicy",
+        {
+            "CachePolicyConfig": {
+                "Comment": "cdn.linked-paper.com static assets",
+                "ParametersInCacheKeyAndForwardedToOrigin": {
+                    "EnableAcceptEncodingBrotli": True,
+                    "EnableAcceptEncodingGzip": True,
+                    "QueryStringsConfig": {"QueryStringBehavior": "none"},
+                },
+            }
+        },
+    )
+    template.has_resource_properties(
+        "AWS::CloudFront::ResponseHeadersPolicy",
+        {
+            "ResponseHeadersPolicyConfig": {
+                "ServerTimingHeadersConfig": {"Enabled": True, "SamplingRate": 10},
+            }
+        },
+    )
+
+
+def test_cdn_logs_and_cache_hit_metrics(template):
+    config = cdn_distribution_config(template)
+
+    assert config["Logging"]["Prefix"] == "cdn/"
+    template.has_resource_properties(
+        "AWS::CloudFront::MonitoringSubscription",
+        {
+            "MonitoringSubscription": {
+                "RealtimeMetricsSubscriptionConfig": {
+                    "RealtimeMetricsSubscriptionStatus": "Enabled"
+                }
+            }
+        },
+    )
+    template.has_resource_properties(
+        "AWS::S3::Bucket",
+        {"OwnershipControls": {"Rules": [{"ObjectOwnership": "ObjectWriter"}]}},
+    )
+
+    (dashboard,) = template.find_resources("AWS::CloudWatch::Dashboard").values()
+    body = json.dumps(dashboard["Properties"]["DashboardBody"])
+    assert "CacheHitRate" in body
+    assert "us-east-1" in body
+
+
+def test_cdn_price_class_is_configurable():
+    app = core.App()
+    stack = LinkedPaperWebInfraStack(
+        app,
+        "linked-paper-web-infra-all-edges",
+        cdn_price_class=cloudfront.PriceClass.PRICE_CLASS_ALL,
+        env=TEST_ENV,
+    )
+    template = assertions.Template.from_stack(stack)
+
+    assert cdn_distribution_config(template)["PriceClass"] == "PriceClass_All"
+
+
+def test_private_subnets_reach_aws_apis_through_vpc_endpoints(template):
+    template.has_resource_properties(
+        "AWS::EC2::VPCEndpoint",
+        {
+            "VpcEndpointType": "Gateway",
+            "ServiceName": {
+                "Fn::Join": ["", ["com.amazonaws.", {"Ref": "AWS::Region"}, ".s3"]]
+            },
+        },
+    )
+
+    interface_services = sorted(
+        endpoint["Properties"]["ServiceName"]
+        for endpoint in template.find_resources(
+            "AWS::EC2::VPCEndpoint", {"Properties": {"VpcEndpointType": "Interface"}}
+        ).values()
+    )
+    assert interface_services == [
+        "com.amazonaws.ap-northeast-2.ecr.api",
+        "com.amazonaws.ap-northeast-2.ecr.dkr",
+        "com.amazonaws.ap-northeast-2.logs",
+        "com.amazonaws.ap-northeast-2.secretsmanager",
+        "com.amazonaws.ap-northeast-2.sts",
+    ]
+    template.has_resource_properties(
+        "AWS::EC2::SecurityGroup",
+        {
+            "GroupDescription": "Interface VPC endpoints (HTTPS from the VPC)",
+            "SecurityGroupIngress": [
+                assertions.Match.object_like({"FromPort": 443, "ToPort": 443})
+            ],
+        },
+    )
@@ -1,17 +1,120 @@
 import aws_cdk as core
-import aws_cdk.assertions as assertions
+import pytest
+from aws_cdk import Duration
+from aws_cdk import aws_cloudwatch as cloudwatch
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_ecs as ecs
+from aws_cdk import aws_elasticloadbalancingv2 as elbv2
 
-from linked_paper_web_infra.front_stack import LinkedPaperWebInfraStack
+from app import build_app, load_context
+from linked_paper_web_infra.environments import ENVIRONMENTS
+from performance_policies.engine import Waiver, evaluate, stack_templates
+from performance_policies.policies import PERFORMANCE_POLICIES, WAIVERS
 
 
-# example tests. To run these tests, uncomment this file along with the example
-# resource in linked_paper_web_infra/linked_paper_web_infra_stack.py
-def test_sqs_queue_created():
+def environment_stacks(name):
+    config = ENVIRONMENTS[name].resolve("123456789012", "ap-northeast-2")
+    return stack_templates(build_app(core.App(context=load_context()), config))
+
+
+@pytest.fixture(scope="module")
+def app_stacks():
+    return environment_stacks("prod")
+
+
+def test_every_stack_meets_performance_policies(app_stacks):
+    report = evaluate(app_stacks, PERFORMANCE_POLICIES, WAIVERS)
+
+    assert report.violations == [], report.format()
+    assert {stack.name for stack in app_stacks} >= {
+        "LinkedPaperWebInfraStack",
+        "BackendInfraStack",
+        "ApiServerHealthMonitor",
+    }
+
+
+@pytest.mark.parametrize("name", ["staging", "loadtest"])
+def test_other_environments_meet_performance_policies(name):
+    report = evaluate(environment_stacks(name), PERFORMANCE_POLICIES, WAIVERS)
+
+    assert report.violations == [], report.format()
+
+
+def test_waivers_are_still_needed(app_stacks):
+    report = evaluate(app_stacks, PERFORMANCE_POLICIES, WAIVERS)
+
+    # 구성이 바뀌어 더 이상 쓰이지 않는 예외는 정리
+    used = {waiver for _, waiver in report.waived}
+    assert [waiver for waiver in WAIVERS if waiver not in used] == []
+
+
+def regressed_stack():
+    app = core.App()
+    stack = core.Stack(app, "RegressedStack")
+    vpc = ec2.Vpc(stack, "Vpc", max_azs=1, nat_gateways=0)
+    elbv2.ApplicationTargetGroup(
+        stack,
+        "TargetGroup",
+        vpc=vpc,
+        port=80,
+        health_check=elbv2.HealthCheck(interval=Duration.seconds(30)),
+    )
+    cloudwatch.Alarm(
+        stack,
+        "CpuAlarm",
+        metric=cloudwatch.Metric(namespace="AWS/ECS", metric_name="CPUUtilization"),
+        threshold=0.8,
+        evaluation_periods=1,
+    )
+    return app
+
+
+def test_policies_report_regressions_with_construct_paths():
+    report = evaluate(stack_templates(regressed_stack()), PERFORMANCE_POLICIES)
+    found = {(violation.policy, violation.path) for violation in report.violations}
+
+    assert ("utilization-alarm-threshold", "RegressedStack/CpuAlarm/Resource") in found
+    assert (
+        "target-group-health-check-interval",
+        "RegressedStack/TargetGroup/Resource",
+    ) in found
+    assert ("vpc-endpoints", "RegressedStack/Vpc/Resource") in found
+    assert "Threshold=0.8 is below 50" in report.format()
+
+
+def test_waiver_moves_violation_out_of_report():
+    waiver = Waiver(
+        policy="utilization-alarm-threshold",
+        path="RegressedStack/CpuAlarm/*",
+        reason="fraction threshold kept for the test",
+    )
+    report = evaluate(
+        stack_templates(regressed_stack()), PERFORMANCE_POLICIES, [waiver]
+    )
+
+    assert "utilization-alarm-threshold" not in {v.policy for v in report.violations}
+    assert [w for _, w in report.waived] == [waiver]
+
+
+def test_single_az_waiver_covers_only_search_service():
     app = core.App()
-    stack = LinkedPaperWebInfraStack(app, "linked-paper-web-infra")
-    template = assertions.Template.from_stack(stack)
+    stack = core.Stack(app, "RegressedBackendInfraStack")
+    vpc = ec2.Vpc(stack, "Vpc", max_azs=1, nat_gateways=0)
+    task_definition = ecs.FargateTaskDefinition(stack, "TaskDef")
+    task_definition.add_container(
+        "App", image=ecs.ContainerImage.from_registry("nginx")
+    )
+    ecs.FargateService(
+        stack,
+        "NewService",
+        cluster=ecs.Cluster(stack, "Cluster", vpc=vpc),
+        task_definition=task_definition,
+    )
 
+    report = evaluate(stack_templates(app), PERFORMANCE_POLICIES, WAIVERS)
 
-#     template.has_resource_properties("AWS::SQS::Queue", {
-#         "VisibilityTimeout": 300
-#     })
+    # GPU 제약이 없는 백엔드 서비스의 단일 AZ 배치는 예외로 가려지지 않음
+    assert (
+        "multi-az-service",
+        "RegressedBackendInfraStack/NewService/Service",
+    ) in {(violation.policy, violation.path) for violation in report.violations}
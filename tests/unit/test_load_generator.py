@@ -0,0 +1,277 @@
+import asyncio
+import json
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from load_generator.corpus import QueryCorpus, parse_line, requests_from_waf_log
+from load_generator.generator import (
+    LoadTestResult,
+    Stage,
+    arrival_times,
+    format_report,
+    load_results,
+    main,
+    run_load,
+)
+from load_generator.histogram import LatencyHistogram
+
+
+class StubSearchApi(BaseHTTPRequestHandler):
+    """검색 API 대역: /search, /correlations에 delay초 뒤 JSON 응답 (keep-alive)"""
+
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+    received = []
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.received.append((url.path, parse_qs(url.query)))
+        time.sleep(self.delay)
+        if url.path not in ("/search", "/correlations"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"results": [], "path": url.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api():
+    StubSearchApi.received = []
+    StubSearchApi.delay = 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubSearchApi)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", StubSearchApi
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def corpus_file(tmp_path):
+    path = tmp_path / "corpus.jsonl"
+    path.write_text(
+        "\n".join(
+            [
+                "# /search, /correlations 혼합",
+                "/search?query=graph+neural+networks",
+                json.dumps({"path": "/search", "params": {"query": "diffusion"}}),
+                json.dumps({"path": "/correlations", "params": {"doc_id": "42"}}),
+                "/admin",
+            ]
+        )
+    )
+    return str(path)
+
+
+def test_histogram_percentiles_stay_within_significant_digits():
+    histogram = LatencyHistogram()
+    values = [value * 37 for value in range(1, 10001)]
+    for value in values:
+        histogram.record(value)
+
+    for percentile in (50, 99, 99.9):
+        exact = values[int(percentile / 100 * len(values)) - 1]
+        assert abs(histogram.percentile(percentile) - exact) <= exact / 1000
+    assert histogram.max == values[-1]
+    assert histogram.min == values[0]
+
+
+def test_histograms_merge_through_json():
+    first, second = LatencyHistogram(), LatencyHistogram()
+    for value in range(1000, 2000):
+        first.record(value)
+    second.record(90_000_000)  # highest(60초) 초과
+
+    merged = LatencyHistogram.from_dict(json.loads(json.dumps(first.to_dict())))
+    assert merged.percentiles() == first.percentiles()
+    merged.merge(second)
+
+    assert merged.total == 1001
+    assert merged.min == 1000
+    assert merged.max == merged.percentile(100) == 60_000_000
+    assert merged.clamped == 1
+
+
+def test_corpus_replays_in_the_same_order_for_a_seed(corpus_file):
+    corpus = QueryCorpus.load(corpus_file)
+    assert [r.endpoint for r in corpus.requests] == [
+        "/search",
+        "/search",
+        "/correlations",
+    ]
+    assert corpus.requests[1].target == "/search?query=diffusion"
+
+    def first(seed, count=9):
+        stream = corpus.replay(seed)
+        return [next(stream).target for _ in range(count)]
+
+    assert first(7) == first(7)
+    assert sorted(first(7, 3)) == sorted(r.target for r in corpus.requests)
+
+
+def test_corpus_from_waf_log_keeps_allowed_search_gets():
+    def record(uri, args="", action="ALLOW", method="GET"):
+        http_request = {"uri": uri, "args": args, "httpMethod": method}
+        return json.dumps({"action": action, "httpRequest": http_request})
+
+    lines = [
+        record("/search", "query=llm"),
+        record("/search", "query=spam", action="BLOCK"),
+        record("/correlations", "doc_id=1"),
+        record("/search", method="POST"),
+        record("/papers/1"),
+    ]
+
+    assert [r.target for r in requests_from_waf_log(lines)] == [
+        "/search?query=llm",
+        "/correlations?doc_id=1",
+    ]
+    assert parse_line("/search?query=llm") == next(requests_from_waf_log(lines))
+
+
+def test_arrival_schedule_is_open_loop_and_reproducible():
+    stages = [Stage(100, 2), Stage(300, 1)]
+    arrivals = arrival_times(stages, "poisson", seed=3)
+
+    assert arrivals == arrival_times(stages, "poisson", seed=3)
+    first = [t for stage, t in arrivals if stage == 0]
+    second = [t for stage, t in arrivals if stage == 1]
+    assert 150 < len(first) < 250 and 220 < len(second) < 380
+    assert max(first) < 2 <= min(second) and max(second) < 3
+    assert len(arrival_times([Stage(50, 2)], "constant")) == 99
+
+
+def test_load_against_stub_server(stub_api, corpus_file):
+    url, api = stub_api
+    result = asyncio.run(
+        run_load(
+            url,
+            QueryCorpus.load(corpus_file),
+            [Stage(100, 0.5), Stage(200, 0.5)],
+            process="constant",
+            connections=8,
+            seed=1,
+        )
+    )
+
+    totals = [stage.total() for stage in result.stages]
+    assert [total.requests for total in totals] == [49, 99]
+    assert all(total.successes == total.requests for total in totals)
+    assert len(api.received) == 148
+    assert {path for path, _ in api.received} == {"/search", "/correlations"}
+    assert set(result.stages[1].endpoints) == {"/search", "/correlations"}
+    assert "200/s x 0.5s" in format_report(result)
+
+
+def test_latency_includes_queueing_when_connections_saturate(stub_api, corpus_file):
+    url, api = stub_api
+    api.delay = 0.05  # 연결 1개로는 초당 20건까지만 처리
+
+    result = asyncio.run(
+        run_load(
+            url,
+            QueryCorpus.load(corpus_file),
+            [Stage(40, 1)],
+            process="constant",
+            connections=1,
+        )
+    )
+
+    latency = result.stages[0].total().latency
+    # 예정 시각 기준으로 측정하므로 뒤쪽 요청은 앞선 요청을 기다린 시간까지 포함
+    assert latency.total == 39
+    assert latency.percentile(50) > 0.3 * 1_000_000
+    assert latency.max > 0.9 * 1_000_000
+
+
+def test_connection_errors_are_counted(corpus_file):
+    result = asyncio.run(
+        run_load(
+            "http://127.0.0.1:9",
+            QueryCorpus.load(corpus_file),
+            [Stage(20, 0.5)],
+            timeout=1,
+        )
+    )
+
+    statuses = result.stages[0].total().statuses
+    assert sum(statuses.values()) == result.stages[0].total().requests > 0
+    assert not any(status.startswith("2") for status in statuses)
+
+
+class MalformedStatusLine(socketserver.StreamRequestHandler):
+    """상태 줄 대신 임의의 한 줄로 응답하고 연결을 닫는 서버"""
+
+    def handle(self):
+        self.rfile.readline()
+        self.wfile.write(b"garbage\r\n\r\n")
+
+
+def test_malformed_status_line_is_counted_as_http_error(corpus_file):
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), MalformedStatusLine)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        result = asyncio.run(
+            run_load(
+                f"http://127.0.0.1:{server.server_address[1]}",
+                QueryCorpus.load(corpus_file),
+                [Stage(20, 0.5)],
+                timeout=1,
+            )
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    total = result.stages[0].total()
+    assert total.requests > 0
+    assert total.statuses == {"HttpError": total.requests}
+
+
+def test_run_writes_result_that_report_merges(stub_api, corpus_file, tmp_path, capsys):
+    url, _ = stub_api
+    outputs = []
+    for seed in (1, 2):
+        output = str(tmp_path / f"result-{seed}.json")
+        main(
+            [
+                "run",
+                url,
+                "--corpus",
+                corpus_file,
+                "--stage",
+                "40:0.5",
+                "--seed",
+                str(seed),
+                "--output",
+                output,
+            ]
+        )
+        outputs.append(output)
+
+    merged = load_results(outputs)
+    assert isinstance(merged, LoadTestResult)
+    assert merged.generators == 2
+    assert merged.stages[0].total().requests == sum(
+        LoadTestResult.from_dict(json.load(open(path))).stages[0].total().requests
+        for path in outputs
+    )
+
+    main(["report", *outputs])
+    assert "80/s x 0.5s" in capsys.readouterr().out
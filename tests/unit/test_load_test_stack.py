@@ -0,0 +1,224 @@
+import json
+import os
+
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+import pytest
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_elasticloadbalancingv2 as elbv2
+
+from load_generator.load_test_stack import (
+    LoadTestProps,
+    LoadTestStack,
+    load_test_target,
+)
+from security.waf_stack import PathRateLimit
+
+TEST_ENV = core.Environment(account="123456789012", region="ap-northeast-2")
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    app = core.App(outdir=str(tmp_path_factory.mktemp("cdk.out")))
+    network = core.Stack(app, "network", env=TEST_ENV)
+    vpc = ec2.Vpc(network, "LinkedPaperVpc", max_azs=2, nat_gateways=1)
+    load_balancer = elbv2.ApplicationLoadBalancer(network, "ApiAlb", vpc=vpc)
+    LoadTestStack(
+        app,
+        "load-test",
+        vpc=vpc,
+        target_load_balancer=load_balancer,
+        props=LoadTestProps(stages="10:30,20:30", connections=32),
+        env=TEST_ENV,
+    )
+    return app
+
+
+@pytest.fixture(scope="module")
+def template(app):
+    return assertions.Template.from_stack(app.node.find_child("load-test"))
+
+
+def test_generator_runs_on_arm64_fargate_against_internal_alb(template):
+    # 태스크 4개 x 초당 20건이 WAF 클라이언트당 한도를 넘으므로 내부 ALB 대상
+    template.has_resource_properties(
+        "AWS::ECS::TaskDefinition",
+        {
+            "RequiresCompatibilities": ["FARGATE"],
+            "RuntimePlatform": {
+                "CpuArchitecture": "ARM64",
+                "OperatingSystemFamily": "LINUX",
+            },
+            "ContainerDefinitions": [
+                assertions.Match.object_like(
+                    {
+                        "Command": ["run", "--connections", "32"],
+                        "Environment": assertions.Match.array_with(
+                            [
+                                {
+                                    "Name": "TARGET_URL",
+                                    "Value": {
+                                        "Fn::Join": [
+                                            "",
+                                            [
+                                                "http://",
+                                                {
+                                                    "Fn::ImportValue": assertions.Match.string_like_regexp(
+                                                        "ApiAlb.*DNSName"
+                                                    )
+                                                },
+                                            ],
+                                        ]
+                                    },
+                                },
+                                {"Name": "STAGES", "Value": "10:30,20:30"},
+                            ]
+                        ),
+                    }
+                )
+            ],
+        },
+    )
+    # 태스크는 run-task로만 실행 (상시 서비스 없음)
+    template.resource_count_is("AWS::ECS::Service", 0)
+    template.has_resource_properties("AWS::Logs::LogGroup", {"RetentionInDays": 7})
+
+
+def test_generator_security_group_is_allowed_into_alb(template):
+    template.has_resource_properties(
+        "AWS::EC2::SecurityGroupIngress",
+        {
+            "IpProtocol": "tcp",
+            "FromPort": 80,
+            "ToPort": 80,
+            "GroupId": {
+                "Fn::ImportValue": assertions.Match.string_like_regexp(
+                    "ApiAlbSecurityGroup"
+                )
+            },
+            "SourceSecurityGroupId": {
+                "Fn::GetAtt": [
+                    assertions.Match.string_like_regexp("LoadGeneratorSecurityGroup"),
+                    "GroupId",
+                ]
+            },
+        },
+    )
+
+
+def test_results_bucket_expires_results_and_scopes_task_access(template):
+    template.has_resource_properties(
+        "AWS::S3::Bucket",
+        {
+            "LifecycleConfiguration": {
+                "Rules": [
+                    {"Prefix": "results/", "ExpirationInDays": 90, "Status": "Enabled"}
+                ]
+            }
+        },
+    )
+    template.has_resource(
+        "AWS::S3::Bucket",
+        {"DeletionPolicy": "Retain", "UpdateReplacePolicy": "Retain"},
+    )
+
+    statements = next(iter(template.find_resources("AWS::IAM::Policy").values()))[
+        "Properties"
+    ]["PolicyDocument"]["Statement"]
+    resources = [str(statement["Resource"]) for statement in statements]
+    assert any("/corpora/*" in resource for resource in resources)
+    assert any("/results/*" in resource for resource in resources)
+
+
+def test_run_task_output_shares_results_prefix_per_run(template):
+    value = template.find_outputs("RunLoadTestCommand")["RunLoadTestCommand"]["Value"]
+    command = "".join(part for part in value["Fn::Join"][1] if isinstance(part, str))
+    assert "--count 4 --launch-type FARGATE" in command
+    # 큰따옴표 안의 $RUN_ID를 셸이 치환해 같은 실행의 태스크가 같은 prefix에 기록
+    assert '--overrides "{\\"containerOverrides\\"' in command
+    assert '\\"value\\":\\"results/$RUN_ID\\"' in command
+
+
+def test_image_build_context_contains_only_generator_sources(app):
+    directory = app.synth().directory
+    with open(os.path.join(directory, "load-test.assets.json"), encoding="utf-8") as f:
+        images = [image["source"] for image in json.load(f)["dockerImages"].values()]
+
+    assert [image["platform"] for image in images] == ["linux/arm64"]
+    context = os.path.join(directory, images[0]["directory"])
+    files = {
+        os.path.relpath(os.path.join(root, name), context)
+        for root, _, names in os.walk(context)
+        for name in names
+    }
+    assert {
+        "load_generator/Dockerfile",
+        "load_generator/generator.py",
+        "load_generator/histogram.py",
+        "load_generator/corpus.py",
+        "security/waf_log_analyzer.py",
+    } <= files
+    assert {os.path.dirname(path) for path in files} == {"load_generator", "security"}
+    assert "security/waf_stack.py" not in files
+
+
+def test_target_defaults_to_alb_only_when_waf_rate_limit_interferes():
+    limit = PathRateLimit(per_client=60)
+
+    # 태스크 2개 x 초당 0.5건 x 60초 = 윈도우당 60건 (한도 이내)
+    light = LoadTestProps(stages="0.25:60,0.5:60", generators=2)
+    assert light.peak_requests_per_window(60) == 60
+    assert load_test_target(light, limit) == "edge"
+    assert load_test_target(LoadTestProps(stages="1:60"), limit) == "alb"
+    assert load_test_target(LoadTestProps(target="edge"), limit) == "edge"
+    with pytest.raises(ValueError, match="edge, alb"):
+        load_test_target(LoadTestProps(target="cloudfront"), limit)
+
+
+def test_edge_target_goes_through_api_domain(tmp_path):
+    app = core.App(outdir=str(tmp_path))
+    network = core.Stack(app, "network", env=TEST_ENV)
+    vpc = ec2.Vpc(network, "LinkedPaperVpc", max_azs=2, nat_gateways=1)
+    load_balancer = elbv2.ApplicationLoadBalancer(network, "ApiAlb", vpc=vpc)
+    stack = LoadTestStack(
+        app,
+        "load-test",
+        vpc=vpc,
+        target_load_balancer=load_balancer,
+        domain_name="loadtest.linked-paper.com",
+        props=LoadTestProps(target="edge"),
+        env=TEST_ENV,
+    )
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties(
+        "AWS::ECS::TaskDefinition",
+        {
+            "ContainerDefinitions": [
+                assertions.Match.object_like(
+                    {
+                        "Environment": assertions.Match.array_with(
+                            [
+                                {
+                                    "Name": "TARGET_URL",
+                                    "Value": "https://api.loadtest.linked-paper.com",
+                                }
+                            ]
+                        )
+                    }
+                )
+            ]
+        },
+    )
+    # CloudFront를 거치므로 내부 ALB 보안 그룹은 열지 않음
+    template.resource_count_is("AWS::EC2::SecurityGroupIngress", 0)
+
+    with pytest.raises(ValueError, match="domain_name"):
+        LoadTestStack(
+            app,
+            "load-test-without-domain",
+            vpc=vpc,
+            target_load_balancer=load_balancer,
+            props=LoadTestProps(target="edge"),
+            env=TEST_ENV,
+        )
@@ -0,0 +1,85 @@
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+import pytest
+from aws_cdk import aws_ecs as ecs
+
+from linked_paper_web_infra.log_pipeline import (
+    FLUENT_BIT_INIT_IMAGE,
+    LogPipelineProps,
+    ServiceLogPipeline,
+)
+
+TEST_ENV = core.Environment(account="123456789012", region="ap-northeast-2")
+PROPS = LogPipelineProps(driver_buffer_limit=1024 * 1024, debug_sample_rate=0.05)
+
+
+@pytest.fixture(scope="module")
+def template():
+    app = core.App()
+    stack = core.Stack(app, "log-pipeline", env=TEST_ENV)
+    pipeline = ServiceLogPipeline(stack, "LogPipeline", props=PROPS)
+    task_definition = ecs.FargateTaskDefinition(
+        stack, "AppTaskDef", cpu=512, memory_limit_mib=1024
+    )
+    task_definition.add_container(
+        "App",
+        image=ecs.ContainerImage.from_registry("nginx"),
+        logging=pipeline.log_driver(),
+        port_mappings=[ecs.PortMapping(container_port=80)],
+    )
+    pipeline.add_router(task_definition, "App")
+    return assertions.Template.from_stack(stack)
+
+
+def containers(template):
+    (task_definition,) = template.find_resources("AWS::ECS::TaskDefinition").values()
+    return {
+        container["Name"]: container
+        for container in task_definition["Properties"]["ContainerDefinitions"]
+    }
+
+
+def test_app_container_logs_through_firelens(template):
+    app = containers(template)["App"]
+    assert app["LogConfiguration"] == {
+        "LogDriver": "awsfirelens",
+        "Options": {"log-driver-buffer-limit": "1048576"},
+    }
+
+
+def test_router_loads_config_from_s3_with_bounded_memory(template):
+    router = containers(template)["LogRouter"]
+    assert router["Image"] == FLUENT_BIT_INIT_IMAGE
+    assert router["FirelensConfiguration"]["Type"] == "fluentbit"
+    assert router["MemoryReservation"] == PROPS.router_memory_reservation_mib
+    assert router["Memory"] == PROPS.router_memory_limit_mib
+
+    environment = {e["Name"]: e["Value"] for e in router["Environment"]}
+    assert {"aws_fluent_bit_init_s3_1", "aws_fluent_bit_init_s3_2"} <= set(environment)
+    assert environment["SERVICE_NAME"] == "App"
+    assert environment["DEBUG_SAMPLE_RATE"] == "0.05"
+    assert environment["LUA_SCRIPT"].startswith("/init/fluent-bit-init-s3-files/")
+
+
+def test_error_logs_and_archive_retention(template):
+    template.has_resource_properties("AWS::Logs::LogGroup", {"RetentionInDays": 30})
+    template.has_resource_properties(
+        "AWS::S3::Bucket",
+        {
+            "LifecycleConfiguration": {
+                "Rules": [
+                    assertions.Match.object_like(
+                        {
+                            "ExpirationInDays": 365,
+                            "Transitions": [
+                                {
+                                    "StorageClass": "STANDARD_IA",
+                                    "TransitionInDays": 30,
+                                }
+                            ],
+                        }
+                    )
+                ]
+            }
+        },
+    )
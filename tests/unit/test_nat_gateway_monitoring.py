@@ -0,0 +1,163 @@
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+import pytest
+from aws_cdk import aws_ec2 as ec2
+
+from traffic_monitor.nat_gateway import NatGatewayMonitoringStack
+
+TEST_ENV = core.Environment(account="123456789012", region="ap-northeast-2")
+
+
+@pytest.fixture(scope="module")
+def template():
+    app = core.App()
+    network = core.Stack(app, "network", env=TEST_ENV)
+    vpc = ec2.Vpc(network, "LinkedPaperVpc", max_azs=2, nat_gateways=2)
+    stack = NatGatewayMonitoringStack(
+        app, "nat-gateway-monitoring", vpcs=[vpc], env=TEST_ENV
+    )
+    return assertions.Template.from_stack(stack)
+
+
+def test_nat_eni_flow_logs_are_delivered_to_s3(template):
+    template.resource_count_is("AWS::EC2::FlowLog", 2)
+    template.has_resource_properties(
+        "AWS::EC2::FlowLog",
+        {
+            "ResourceType": "NetworkInterface",
+            "ResourceId": {
+                "Fn::GetAtt": [
+                    assertions.Match.string_like_regexp("NatEniLookup"),
+                    "NatGateways.0.NatGatewayAddresses.0.NetworkInterfaceId",
+                ]
+            },
+            "LogDestinationType": "s3",
+            "MaxAggregationInterval": 60,
+            "LogFormat": assertions.Match.string_like_regexp(
+                r"\$\{pkt-srcaddr\} \$\{pkt-dstaddr\}"
+            ),
+            "DestinationOptions": {
+                "fileFormat": "plain-text",
+                "perHourPartition": True,
+                "hiveCompatiblePartitions": False,
+            },
+        },
+    )
+    template.has_resource_properties(
+        "AWS::S3::Bucket",
+        {
+            "LifecycleConfiguration": {
+                "Rules": [{"ExpirationInDays": 30, "Status": "Enabled"}]
+            }
+        },
+    )
+
+
+def test_every_discovered_nat_gateway_gets_one_minute_alarms(template):
+    alarms = template.find_resources("AWS::CloudWatch::Alarm")
+    by_metric = {}
+    for alarm in alarms.values():
+        properties = alarm["Properties"]
+        if "MetricName" in properties:
+            assert properties["Period"] == 60
+            by_metric.setdefault(properties["MetricName"], []).append(properties)
+
+    assert {name: len(found) for name, found in by_metric.items()} == {
+        "BytesOutToDestination": 2,
+        "PacketsDropCount": 2,
+        "ErrorPortAllocation": 2,
+    }
+    nat_gateway_ids = {
+        properties["Dimensions"][0]["Value"]["Fn::ImportValue"]
+        for properties in by_metric["ErrorPortAllocation"]
+    }
+    assert len(nat_gateway_ids) == 2
+    assert all("NATGateway" in export for export in nat_gateway_ids)
+    assert by_metric["ErrorPortAllocation"][0]["Threshold"] == 0
+    for alarm in alarms.values():
+        (action,) = alarm["Properties"]["AlarmActions"]
+        assert action["Ref"].startswith("SlackNotificationTopic")
+
+
+def test_bytes_out_threshold_is_200_mb_per_minute(template):
+    template.has_resource_properties(
+        "AWS::CloudWatch::Alarm",
+        {
+            "MetricName": "BytesOutToDestination",
+            "Threshold": 200_000_000,
+            "AlarmDescription": assertions.Match.string_like_regexp(
+                r"200 MB \(200,000,000 bytes\) in 1 minute"
+            ),
+        },
+    )
+
+
+def test_bytes_out_uses_anomaly_detection_band(template):
+    template.resource_properties_count_is(
+        "AWS::CloudWatch::Alarm",
+        {
+            "ComparisonOperator": "GreaterThanUpperThreshold",
+            "ThresholdMetricId": "expected",
+            "Metrics": assertions.Match.array_with(
+                [
+                    assertions.Match.object_like(
+                        {"Expression": "ANOMALY_DETECTION_BAND(bytes, 3)"}
+                    )
+                ]
+            ),
+        },
+        2,
+    )
+
+
+def test_alarms_are_delivered_to_slack(template):
+    template.has_resource_properties(
+        "AWS::SNS::Subscription",
+        {"Protocol": "lambda"},
+    )
+    template.has_resource_properties(
+        "AWS::Lambda::Function",
+        {
+            "Handler": "nat_alarm_notifier.lambda_handler",
+            "Environment": {"Variables": {"SECRET_NAME": "GlueSlackWebhookURL"}},
+        },
+    )
+
+
+def test_imported_vpc_without_nat_gateways_is_reported():
+    app = core.App()
+    network = core.Stack(app, "imported-network", env=TEST_ENV)
+    vpc = ec2.Vpc.from_lookup(network, "ExistingVpc", vpc_id="vpc-058b5208a767d5d1c")
+    stack = NatGatewayMonitoringStack(
+        app, "nat-gateway-monitoring-imported", vpcs=[vpc], env=TEST_ENV
+    )
+
+    annotations = assertions.Annotations.from_stack(stack)
+    annotations.has_warning("*", assertions.Match.string_like_regexp("No NAT gateways"))
+    assertions.Template.from_stack(stack).resource_count_is("AWS::CloudWatch::Alarm", 0)
+
+
+def test_looked_up_vpc_nat_gateways_are_monitored_by_id():
+    app = core.App()
+    network = core.Stack(app, "imported-network", env=TEST_ENV)
+    vpc = ec2.Vpc.from_lookup(network, "ExistingVpc", vpc_id="vpc-058b5208a767d5d1c")
+    stack = NatGatewayMonitoringStack(
+        app,
+        "nat-gateway-monitoring-by-id",
+        vpcs=[vpc],
+        nat_gateway_ids=["nat-05c30695a91f4edcb"],
+        env=TEST_ENV,
+    )
+
+    assertions.Annotations.from_stack(stack).has_no_warning(
+        "*", assertions.Match.string_like_regexp("No NAT gateways")
+    )
+    template = assertions.Template.from_stack(stack)
+    template.resource_count_is("AWS::EC2::FlowLog", 1)
+    template.has_resource_properties(
+        "AWS::CloudWatch::Alarm",
+        {
+            "MetricName": "ErrorPortAllocation",
+            "Dimensions": [{"Name": "NatGatewayId", "Value": "nat-05c30695a91f4edcb"}],
+        },
+    )
@@ -0,0 +1,122 @@
+import io
+import json
+
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from linked_paper_web_infra.front_stack import LinkedPaperWebInfraStack
+from linked_paper_web_infra.runtime_platform import (
+    MANIFEST_MEDIA_TYPES,
+    RuntimeOptions,
+    image_architectures,
+    verify_image_architecture,
+)
+
+TEST_ENV = core.Environment(account="123456789012", region="ap-northeast-2")
+CONFIG_DIGEST = "sha256:" + "c" * 64
+
+
+def stubbed_ecr(manifest, config_digest=None):
+    client = boto3.client(
+        "ecr",
+        region_name="ap-northeast-2",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+    stubber = Stubber(client)
+    stubber.add_response(
+        "batch_get_image",
+        {"images": [{"imageManifest": json.dumps(manifest)}], "failures": []},
+        {
+            "repositoryName": "next_production_image",
+            "imageIds": [{"imageTag": "latest"}],
+            "acceptedMediaTypes": MANIFEST_MEDIA_TYPES,
+        },
+    )
+    if config_digest:
+        stubber.add_response(
+            "get_download_url_for_layer",
+            {
+                "downloadUrl": "https://layers.example/config",
+                "layerDigest": config_digest,
+            },
+            {"repositoryName": "next_production_image", "layerDigest": config_digest},
+        )
+    stubber.activate()
+    return client
+
+
+def test_multi_architecture_index_lists_platforms():
+    client = stubbed_ecr(
+        {
+            "manifests": [
+                {"platform": {"architecture": "amd64", "os": "linux"}},
+                {"platform": {"architecture": "arm64", "os": "linux"}},
+            ]
+        }
+    )
+
+    architectures = image_architectures(
+        "next_production_image", "latest", ecr_client=client
+    )
+
+    assert architectures == {"amd64", "arm64"}
+
+
+def test_single_architecture_image_reads_config_blob():
+    client = stubbed_ecr({"config": {"digest": CONFIG_DIGEST}}, CONFIG_DIGEST)
+
+    def urlopen(url):
+        assert url == "https://layers.example/config"
+        return io.BytesIO(json.dumps({"architecture": "amd64"}).encode())
+
+    with pytest.raises(ValueError, match="does not support ARM64"):
+        verify_image_architecture(
+            "next_production_image",
+            "latest",
+            "ARM64",
+            ecr_client=client,
+            urlopen=urlopen,
+        )
+
+
+def test_runtime_options_reject_unknown_architecture():
+    with pytest.raises(ValueError):
+        RuntimeOptions(architecture="RISCV64")
+
+
+def test_web_service_runs_on_graviton_with_x86_comparison():
+    app = core.App()
+    stack = LinkedPaperWebInfraStack(
+        app,
+        "linked-paper-web-infra-arm",
+        web_runtime=RuntimeOptions(
+            architecture="ARM64",
+            comparison_architecture="X86_64",
+            comparison_weight=20,
+        ),
+        env=TEST_ENV,
+    )
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties(
+        "AWS::ECS::TaskDefinition",
+        {"RuntimePlatform": {"CpuArchitecture": "ARM64"}},
+    )
+    template.has_resource_properties(
+        "AWS::ECS::TaskDefinition",
+        {"RuntimePlatform": {"CpuArchitecture": "X86_64"}},
+    )
+    template.resource_count_is("AWS::ECS::Service", 2)
+
+    rules = template.find_resources("AWS::ElasticLoadBalancingV2::ListenerRule")
+    assert len(rules) == 2  # HTTP + HTTPS listener
+    for rule in rules.values():
+        (action,) = rule["Properties"]["Actions"]
+        weights = sorted(
+            group["Weight"] for group in action["ForwardConfig"]["TargetGroups"]
+        )
+        assert weights == [20, 80]
@@ -0,0 +1,206 @@
+import gzip
+import io
+import json
+import threading
+
+import brotli
+import pytest
+from botocore.exceptions import ClientError
+
+from static_publisher import publisher
+from static_publisher.publisher import (
+    HTML_CACHE_CONTROL,
+    IMMUTABLE_CACHE_CONTROL,
+    MANIFEST_KEY,
+    REMOVED_RETENTION_SECONDS,
+    publish,
+)
+
+
+class LocalS3:
+    """publisher가 사용하는 S3 API만 구현한 로컬 버킷"""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = []
+        self._lock = threading.Lock()
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+        body, _ = self.objects[(Bucket, Key)]
+        return {"Body": io.BytesIO(body)}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        with self._lock:
+            self.objects[(Bucket, Key)] = (Body, kwargs)
+
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs=None, Config=None):
+        assert Config.multipart_threshold > 0
+        with self._lock:
+            self.objects[(Bucket, Key)] = (Fileobj.read(), ExtraArgs or {})
+            self.uploads.append(Key)
+
+    def delete_objects(self, Bucket, Delete):
+        assert len(Delete["Objects"]) <= 1000
+        with self._lock:
+            for item in Delete["Objects"]:
+                self.objects.pop((Bucket, item["Key"]), None)
+
+    def metadata(self, key):
+        return self.objects[("cdn-bucket", key)][1]
+
+    def body(self, key):
+        return self.objects[("cdn-bucket", key)][0]
+
+
+class LocalCloudFront:
+    def __init__(self):
+        self.invalidations = []
+
+    def create_invalidation(self, DistributionId, InvalidationBatch):
+        self.invalidations.append(InvalidationBatch["Paths"]["Items"])
+
+
+@pytest.fixture
+def build_dir(tmp_path):
+    files = {
+        "index.html": "<html>home</html>",
+        "papers/index.html": "<html>papers</html>",
+        "_next/static/chunks/main-3f2a9c1d.js": "console.log('main')" * 50,
+        "favicon.ico": "icon",
+    }
+    for key, content in files.items():
+        path = tmp_path / key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+def test_first_publish_uploads_everything_with_cache_headers(build_dir):
+    s3 = LocalS3()
+    cloudfront = LocalCloudFront()
+
+    result = publish(str(build_dir), "cdn-bucket", s3, cloudfront, "E123")
+
+    assert len(result.uploaded) == 4
+    chunk = "_next/static/chunks/main-3f2a9c1d.js"
+    assert s3.metadata(chunk)["CacheControl"] == IMMUTABLE_CACHE_CONTROL
+    assert s3.metadata(chunk)["ContentType"].endswith("javascript")
+    assert s3.metadata("index.html")["CacheControl"] == HTML_CACHE_CONTROL
+
+    original = s3.body(chunk)
+    assert brotli.decompress(s3.body(chunk + ".br")) == original
+    assert gzip.decompress(s3.body(chunk + ".gz")) == original
+    assert s3.metadata(chunk + ".br")["ContentEncoding"] == "br"
+    assert "favicon.ico.br" not in s3.uploads
+
+    manifest = json.loads(s3.body(MANIFEST_KEY))
+    assert set(manifest) == set(result.uploaded)
+    # 압축본(.br/.gz) 캐시까지 무효화
+    assert cloudfront.invalidations == [["/index.html*", "/papers/index.html*"]]
+
+
+def test_republish_uploads_only_changed_files(build_dir):
+    s3 = LocalS3()
+    cloudfront = LocalCloudFront()
+    publish(str(build_dir), "cdn-bucket", s3, cloudfront, "E123")
+    s3.uploads.clear()
+
+    (build_dir / "papers" / "index.html").write_text("<html>papers v2</html>")
+    (build_dir / "favicon.ico").unlink()
+    result = publish(str(build_dir), "cdn-bucket", s3, cloudfront, "E123")
+
+    assert result.uploaded == ["papers/index.html"]
+    assert result.removed == ["favicon.ico"]
+    assert len(result.unchanged) == 2
+    assert sorted(s3.uploads) == [
+        "papers/index.html",
+        "papers/index.html.br",
+        "papers/index.html.gz",
+    ]
+    assert cloudfront.invalidations[-1] == ["/papers/index.html*"]
+    # 이전 HTML이 참조할 수 있으므로 빠진 파일은 바로 지우지 않음
+    assert result.deleted == []
+    assert ("cdn-bucket", "favicon.ico") in s3.objects
+
+
+def test_unchanged_build_skips_invalidation(build_dir):
+    s3 = LocalS3()
+    cloudfront = LocalCloudFront()
+    publish(str(build_dir), "cdn-bucket", s3, cloudfront, "E123")
+
+    result = publish(str(build_dir), "cdn-bucket", s3, cloudfront, "E123")
+
+    assert result.uploaded == []
+    assert len(cloudfront.invalidations) == 1
+
+
+def test_removed_files_are_deleted_after_retention(build_dir):
+    s3 = LocalS3()
+    cloudfront = LocalCloudFront()
+    publish(str(build_dir), "cdn-bucket", s3, cloudfront, "E123", now=0)
+
+    (build_dir / "papers" / "index.html").unlink()
+    result = publish(str(build_dir), "cdn-bucket", s3, cloudfront, "E123", now=10)
+    assert result.removed == ["papers/index.html"]
+    assert result.deleted == []
+    assert ("cdn-bucket", "papers/index.html.br") in s3.objects
+    manifest = json.loads(s3.body(MANIFEST_KEY))
+    assert manifest["papers/index.html"]["removed_at"] == 10
+
+    # 보존 기간 안의 다음 배포에서도 유지되고 빠진 시각은 처음 값 그대로
+    publish(str(build_dir), "cdn-bucket", s3, cloudfront, "E123", now=20)
+    assert json.loads(s3.body(MANIFEST_KEY))["papers/index.html"]["removed_at"] == 10
+
+    later = 10 + REMOVED_RETENTION_SECONDS
+    result = publish(str(build_dir), "cdn-bucket", s3, cloudfront, "E123", now=later)
+    assert result.removed == []
+    assert result.deleted == ["papers/index.html"]
+    assert not any(key.startswith("papers/") for _, key in s3.objects)
+    assert "papers/index.html" not in json.loads(s3.body(MANIFEST_KEY))
+    assert cloudfront.invalidations[-1] == ["/papers/index.html*"]
+
+
+def test_kept_removed_files_stay_tracked(build_dir):
+    s3 = LocalS3()
+    publish(str(build_dir), "cdn-bucket", s3, now=0)
+
+    (build_dir / "favicon.ico").unlink()
+    publish(str(build_dir), "cdn-bucket", s3, removed_retention=None, now=10)
+    result = publish(
+        str(build_dir), "cdn-bucket", s3, removed_retention=None, now=10**9
+    )
+
+    assert result.deleted == []
+    assert ("cdn-bucket", "favicon.ico") in s3.objects
+    # 매니페스트에 남아 있어 이후 보존 기간을 적용한 배포에서 정리됨
+    assert json.loads(s3.body(MANIFEST_KEY))["favicon.ico"]["removed_at"] == 10
+    result = publish(str(build_dir), "cdn-bucket", s3, now=10**9)
+    assert result.deleted == ["favicon.ico"]
+
+
+def test_previous_manifest_format_is_read(build_dir):
+    s3 = LocalS3()
+    publish(str(build_dir), "cdn-bucket", s3)
+    manifest = json.loads(s3.body(MANIFEST_KEY))
+    s3.put_object(
+        Bucket="cdn-bucket",
+        Key=MANIFEST_KEY,
+        Body=json.dumps(
+            {key: entry["digest"] for key, entry in manifest.items()}
+        ).encode(),
+    )
+
+    result = publish(str(build_dir), "cdn-bucket", s3)
+
+    assert result.uploaded == []
+
+
+def test_cloudfront_client_is_created_when_not_given(build_dir, monkeypatch):
+    cloudfront = LocalCloudFront()
+    monkeypatch.setattr(publisher.boto3, "client", lambda service: cloudfront)
+
+    publish(str(build_dir), "cdn-bucket", LocalS3(), distribution_id="E123")
+
+    assert cloudfront.invalidations == [["/index.html*", "/papers/index.html*"]]
@@ -0,0 +1,99 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from linked_paper_web_infra.tracing import collector_config, tracing_environment
+from trace_probe.probe import SEARCH_PATH_HOPS, new_trace_id, send_probe_trace
+
+
+class StandInCollector(BaseHTTPRequestHandler):
+    """OTLP/HTTP /v1/traces 요청만 기록하는 로컬 컬렉터"""
+
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.received.append(
+            (self.path, self.headers["Content-Type"], json.loads(body))
+        )
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def collector():
+    StandInCollector.received = []
+    server = HTTPServer(("127.0.0.1", 0), StandInCollector)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", StandInCollector.received
+    server.shutdown()
+    server.server_close()
+
+
+def test_probe_trace_reaches_collector(collector):
+    endpoint, received = collector
+    trace_id = send_probe_trace(endpoint)
+
+    ((path, content_type, payload),) = received
+    assert path == "/v1/traces"
+    assert content_type == "application/json"
+
+    spans = {}
+    for resource_spans in payload["resourceSpans"]:
+        (attribute,) = resource_spans["resource"]["attributes"]
+        service = attribute["value"]["stringValue"]
+        for span in resource_spans["scopeSpans"][0]["spans"]:
+            assert span["traceId"] == trace_id
+            spans[span["spanId"]] = (service, span)
+
+    assert len(spans) == len(SEARCH_PATH_HOPS)
+    # 루트를 제외한 모든 span은 자신을 감싸는 상위 span을 가짐
+    roots = [span for _, span in spans.values() if "parentSpanId" not in span]
+    assert len(roots) == 1
+    for _, span in spans.values():
+        if span is roots[0]:
+            continue
+        parent = spans[span["parentSpanId"]][1]
+        assert int(parent["startTimeUnixNano"]) < int(span["startTimeUnixNano"])
+        assert int(span["endTimeUnixNano"]) < int(parent["endTimeUnixNano"])
+    assert {service for service, _ in spans.values()} == {
+        service for service, _, _ in SEARCH_PATH_HOPS
+    }
+
+
+def test_probe_uses_task_environment_endpoint(collector, monkeypatch):
+    endpoint, received = collector
+    environment = tracing_environment("api-service", 0.1)
+    assert environment["OTEL_EXPORTER_OTLP_ENDPOINT"] == "http://localhost:4318"
+    assert environment["OTEL_TRACES_SAMPLER_ARG"] == "0.1"
+
+    monkeypatch.setenv("OTEL_EXPORTER_OTLP_ENDPOINT", endpoint)
+    monkeypatch.setattr("sys.argv", ["probe"])
+    from trace_probe import probe
+
+    probe.main()
+    assert len(received) == 1
+
+
+def test_trace_id_is_xray_compatible():
+    now = time.time()
+    trace_id = new_trace_id(now)
+    assert len(trace_id) == 32
+    assert int(trace_id[:8], 16) == int(now)
+
+
+def test_collector_config_exports_to_xray():
+    config = json.loads(collector_config(memory_limit_mib=256))
+    pipeline = config["service"]["pipelines"]["traces"]
+    assert pipeline["receivers"] == ["otlp"]
+    assert pipeline["processors"][0] == "memory_limiter"
+    assert pipeline["exporters"] == ["awsxray"]
+    assert config["processors"]["memory_limiter"]["limit_mib"] < 256
@@ -0,0 +1,118 @@
+import gzip
+import json
+
+import pytest
+
+from security.waf_log_analyzer import analyze, format_report, parse_record
+
+BASE_MS = 1_729_000_020_000  # 윈도우 경계(60초)에서 20초 지난 시각
+
+
+def waf_record(offset_seconds, uri, client_ip, forwarded_for=None, rule=None):
+    headers = [{"name": "Host", "value": "api.linked-paper.com"}]
+    if forwarded_for:
+        headers.append({"name": "X-Forwarded-For", "value": forwarded_for})
+    blocked = rule is not None
+    return json.dumps(
+        {
+            "timestamp": BASE_MS + offset_seconds * 1000,
+            "action": "BLOCK" if blocked else "ALLOW",
+            "terminatingRuleId": rule or "AllowSpecificPaths",
+            "httpRequest": {
+                "clientIp": client_ip,
+                "uri": uri,
+                "headers": headers,
+                "httpMethod": "GET",
+            },
+        }
+    )
+
+
+@pytest.fixture
+def waf_logs(tmp_path):
+    heavy = [waf_record(i, "/search", "198.51.100.1") for i in range(30)]
+    blocked = [
+        waf_record(30 + i, "/search", "198.51.100.1", rule="SearchRateLimitPerIp")
+        for i in range(5)
+    ]
+    proxied = [
+        waf_record(i, "/correlations/123", "203.0.113.9", "192.0.2.7, 203.0.113.9")
+        for i in range(0, 120, 20)
+    ]
+    light = [waf_record(70, "/search?query=bert", "198.51.100.2")]
+
+    first = tmp_path / "waf-1.log.gz"
+    with gzip.open(first, "wt") as f:
+        f.write("\n".join(heavy + blocked) + "\n")
+    second = tmp_path / "waf-2.log"
+    second.write_text("\n".join(proxied + light + ["", "not a json line"]) + "\n")
+    return [str(first), str(second)]
+
+
+def test_requests_are_counted_per_path_client_and_rule(waf_logs):
+    counts = analyze(waf_logs, window_seconds=60)
+
+    assert counts.totals("path") == {"/search": 36, "/correlations": 6}
+    assert counts.totals("client")["203.0.113.9"] == 6
+    assert counts.totals("forwarded_for") == {"192.0.2.7": 6}
+    assert counts.totals("rule")["SearchRateLimitPerIp"] == 5
+    assert counts.actions[("/search", "BLOCK")] == 5
+
+
+def test_peaks_use_time_windows(waf_logs):
+    counts = analyze(waf_logs, window_seconds=60)
+
+    window, peak = counts.peaks("client")["198.51.100.1"]
+    # 0~34초 요청 35건이 모두 첫 윈도우(20~59초)에 속함
+    assert peak == 35
+    assert window == (BASE_MS // 1000) // 60 * 60
+    # 20초 간격 6건: 윈도우별 2 / 3 / 1건
+    assert counts.peaks("path")["/correlations"][1] == 3
+
+
+def test_client_rate_percentiles_per_path(waf_logs):
+    rates = analyze(waf_logs, window_seconds=60).client_rate_percentiles()
+
+    assert rates["/search"][100] == 35
+    assert rates["/search"][50] == 1
+    assert rates["/correlations"][100] == 3
+
+
+def test_parse_record_identifies_client_by_client_ip():
+    request = parse_record(
+        waf_record(0, "/correlations/abc", "203.0.113.9", "192.0.2.7, 10.0.0.1")
+    )
+
+    assert request.path == "/correlations"
+    # 뷰어가 보낸 X-Forwarded-For는 별도 차원으로만 기록
+    assert request.client == "203.0.113.9"
+    assert request.forwarded_for == "192.0.2.7"
+    assert parse_record(waf_record(0, "/search", "198.51.100.1")).forwarded_for is None
+    assert parse_record("2024-10-15 INFO not json") is None
+
+
+def test_rotating_forwarded_for_does_not_split_client(tmp_path):
+    path = tmp_path / "waf.log"
+    path.write_text(
+        "\n".join(
+            waf_record(i, "/search", "198.51.100.1", f"192.0.2.{i}") for i in range(20)
+        )
+    )
+    counts = analyze([str(path)])
+
+    assert counts.client_rate_percentiles()["/search"][100] == 20
+    assert len(counts.totals("forwarded_for")) == 20
+
+
+def test_report_lists_each_dimension(waf_logs):
+    report = format_report(analyze(waf_logs), top=3)
+
+    for section in (
+        "[path]",
+        "[client]",
+        "[forwarded_for]",
+        "[rule]",
+        "[client rate",
+        "[action]",
+    ):
+        assert section in report
@@ -0,0 +1,108 @@
+import aws_cdk as core
+import aws_cdk.assertions as assertions
+import pytest
+
+from security.waf_stack import PathRateLimit, WafStack
+
+TEST_ENV = core.Environment(account="123456789012", region="us-east-1")
+
+
+@pytest.fixture(scope="module")
+def rules():
+    app = core.App()
+    stack = WafStack(
+        app,
+        "waf",
+        waf_scope="CLOUDFRONT",
+        search_rate_limit=PathRateLimit(per_client=30),
+        env=TEST_ENV,
+    )
+    template = assertions.Template.from_stack(stack)
+    (web_acl,) = template.find_resources("AWS::WAFv2::WebACL").values()
+    return web_acl["Properties"]
+
+
+def rate_statements(properties):
+    return {
+        rule["Name"]: rule["Statement"]["RateBasedStatement"]
+        for rule in properties["Rules"]
+        if "RateBasedStatement" in rule["Statement"]
+    }
+
+
+def test_rate_limits_per_path_and_client_come_from_props(rules):
+    statements = rate_statements(rules)
+
+    assert {name: s["AggregateKeyType"] for name, s in statements.items()} == {
+        "SearchRateLimitPerIp": "IP",
+        "SearchRateLimitPerForwardedIp": "FORWARDED_IP",
+        "CorrelationsRateLimitPerIp": "IP",
+        "CorrelationsRateLimitPerForwardedIp": "FORWARDED_IP",
+    }
+    assert statements["SearchRateLimitPerIp"]["Limit"] == 30
+    assert statements["CorrelationsRateLimitPerIp"]["Limit"] == 120
+    assert statements["SearchRateLimitPerForwardedIp"]["ForwardedIPConfig"] == {
+        "HeaderName": "X-Forwarded-For",
+        "FallbackBehavior": "NO_MATCH",
+    }
+    for name, statement in statements.items():
+        assert statement["EvaluationWindowSec"] == 60
+        expected_path = "/search" if name.startswith("Search") else "/correlations"
+        scope_down = statement["ScopeDownStatement"]["ByteMatchStatement"]
+        assert scope_down["SearchString"] == expected_path
+
+
+def test_rate_limits_are_evaluated_before_the_allow_rule(rules):
+    priorities = {rule["Name"]: rule["Priority"] for rule in rules["Rules"]}
+
+    assert priorities["AllowSpecificPaths"] == max(priorities.values())
+    assert len(set(priorities.values())) == len(priorities)
+
+
+def test_rate_limited_requests_get_429_at_waf(rules):
+    assert "RateLimited" in rules["CustomResponseBodies"]
+    assert rules["CustomResponseBodies"]["RateLimited"]["ContentType"] == (
+        "APPLICATION_JSON"
+    )
+    for rule in rules["Rules"]:
+        if rule["Name"] == "AllowSpecificPaths":
+            continue
+        custom_response = rule["Action"]["Block"]["CustomResponse"]
+        assert custom_response["ResponseCode"] == 429
+        assert custom_response["CustomResponseBodyKey"] == "RateLimited"
+        assert custom_response["ResponseHeaders"] == [
+            {"Name": "Retry-After", "Value": "60"}
+        ]
+
+
+def test_every_rule_publishes_metrics_and_samples(rules):
+    configs = [rules["VisibilityConfig"]] + [
+        rule["VisibilityConfig"] for rule in rules["Rules"]
+    ]
+
+    assert len(configs) == 6
+    for config in configs:
+        assert config["CloudWatchMetricsEnabled"] is True
+        assert config["SampledRequestsEnabled"] is True
+
+
+def test_waf_logs_are_written_with_redacted_headers():
+    app = core.App()
+    stack = WafStack(app, "waf-logging", waf_scope="CLOUDFRONT", env=TEST_ENV)
+    template = assertions.Template.from_stack(stack)
+
+    template.has_resource_properties(
+        "AWS::Logs::LogGroup",
+        {"LogGroupName": "aws-waf-logs-linked-paper-api", "RetentionInDays": 30},
+    )
+    (logging,) = template.find_resources("AWS::WAFv2::LoggingConfiguration").values()
+    properties = logging["Properties"]
+    assert properties["RedactedFields"] == [
+        {"SingleHeader": {"Name": "authorization"}},
+        {"SingleHeader": {"Name": "cookie"}},
+    ]
+    # ':*' 접미사 없는 로그 그룹 ARN
+    (destination,) = properties["LogDestinationConfigs"]
+    parts = destination["Fn::Join"][1]
+    assert parts[-2].endswith(":log-group:")
+    assert parts[-1]["Ref"].startswith("WafLogGroup")
@@ -0,0 +1,142 @@
+"""트레이스 컬렉터로 검색 요청 경로를 흉내 낸 probe 트레이스를 전송합니다.
+
+API Gateway -> API 서비스 -> 검색 ALB -> 검색 서비스 -> OpenSearch 구간을 각각 하나의
+span으로 만들어 OTLP/HTTP(JSON)로 보내고, X-Ray에서 조회할 트레이스 ID를 출력합니다.
+서비스 이미지에는 이 모듈이 없고 ECS Exec도 활성화되어 있지 않으므로, 태스크와 같은 설정
+(`tracing.collector_config`)으로 띄운 컬렉터를 --endpoint로 지정해 컬렉터 -> X-Ray 전송
+경로를 확인합니다.
+"""
+
+import argparse
+import json
+import os
+import secrets
+import time
+import urllib.request
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+DEFAULT_ENDPOINT = "http://localhost:4318"
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+# (서비스, span 이름, span 종류): 바깥 구간부터 안쪽 구간 순서
+SEARCH_PATH_HOPS = (
+    ("api-gateway", "GET /search", SPAN_KIND_SERVER),
+    ("api-service", "GET /search", SPAN_KIND_SERVER),
+    ("api-service", "search-alb", SPAN_KIND_CLIENT),
+    ("search-service", "POST /search", SPAN_KIND_SERVER),
+    ("search-service", "opensearch knn", SPAN_KIND_CLIENT),
+)
+
+
+@dataclass(frozen=True)
+class ProbeSpan:
+    service: str
+    name: str
+    kind: int
+    span_id: str
+    parent_span_id: Optional[str]
+    start_ns: int
+    end_ns: int
+
+
+def new_trace_id(now: Optional[float] = None) -> str:
+    """X-Ray 호환 트레이스 ID (앞 8자리는 epoch 초, 30일 이내여야 X-Ray가 수용)"""
+    return f"{int(now if now is not None else time.time()):08x}{secrets.token_hex(12)}"
+
+
+def probe_spans(
+    hops: Sequence[tuple] = SEARCH_PATH_HOPS,
+    hop_ms: int = 10,
+    now_ns: Optional[int] = None,
+) -> List[ProbeSpan]:
+    """안쪽 구간일수록 짧게 중첩되는 span 목록 (구간마다 hop_ms씩 줄어듦)"""
+    start = now_ns if now_ns is not None else time.time_ns()
+    total_ns = hop_ms * len(hops) * 1_000_000
+    spans = []
+    parent = None
+    for depth, (service, name, kind) in enumerate(hops):
+        offset = depth * hop_ms * 1_000_000 // 2
+        span = ProbeSpan(
+            service=service,
+            name=name,
+            kind=kind,
+            span_id=secrets.token_hex(8),
+            parent_span_id=parent,
+            start_ns=start + offset,
+            end_ns=start + total_ns - offset,
+        )
+        spans.append(span)
+        parent = span.span_id
+    return spans
+
+
+def otlp_payload(trace_id: str, spans: Sequence[ProbeSpan]) -> dict:
+    """서비스별 resourceSpans로 묶은 OTLP/JSON 요청 본문"""
+    by_service = {}
+    for span in spans:
+        by_service.setdefault(span.service, []).append(
+            {
+                "traceId": trace_id,
+                "spanId": span.span_id,
+                **(
+                    {"parentSpanId": span.parent_span_id} if span.parent_span_id else {}
+                ),
+                "name": span.name,
+                "kind": span.kind,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [
+                    {"key": "probe", "value": {"boolValue": True}},
+                ],
+            }
+        )
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service}}
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": "trace_probe"}, "spans": items}],
+            }
+            for service, items in by_service.items()
+        ]
+    }
+
+
+def send_probe_trace(
+    endpoint: str = DEFAULT_ENDPOINT, hop_ms: int = 10, timeout: float = 5.0
+) -> str:
+    """probe 트레이스를 컬렉터에 전송하고 트레이스 ID를 반환"""
+    trace_id = new_trace_id()
+    request = urllib.request.Request(
+        f"{endpoint.rstrip('/')}/v1/traces",
+        data=json.dumps(otlp_payload(trace_id, probe_spans(hop_ms=hop_ms))).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        if response.status != 200:
+            raise RuntimeError(f"Collector rejected the probe trace: {response.status}")
+    return trace_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--endpoint",
+        # 앱 컨테이너에 설정된 OTLP 엔드포인트를 기본값으로 사용
+        default=os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", DEFAULT_ENDPOINT),
+    )
+    parser.add_argument("--hop-ms", type=int, default=10)
+    args = parser.parse_args()
+
+    trace_id = send_probe_trace(args.endpoint, args.hop_ms)
+    # X-Ray 콘솔/CLI 형식: 1-<epoch 8자리>-<24자리>
+    print(f"1-{trace_id[:8]}-{trace_id[8:]}")
+
+
+if __name__ == "__main__":
+    main()
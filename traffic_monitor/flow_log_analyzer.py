@@ -0,0 +1,291 @@
+"""NAT Gateway VPC Flow Log에서 트래픽 상위 발생원(top talkers)을 집계합니다.
+
+NatGatewayMonitoringStack이 S3에 저장한 Flow Log(gzip 텍스트)를 청크 단위로 스트리밍하며
+(내부 출발지 IP, 외부 목적지)별 바이트를 numpy group-by로 합산하고,
+내부 IP를 ECS 태스크 ENI와 서비스 이름으로 매핑합니다.
+
+    python -m traffic_monitor.flow_log_analyzer \\
+        s3://<NatFlowLogBucketName output>/nat/AWSLogs/ \\
+        --cluster <ApiClusterName> --top 20
+"""
+
+import argparse
+import gzip
+import io
+import ipaddress
+import itertools
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+import boto3
+import numpy as np
+
+DEFAULT_CHUNK_LINES = 100_000
+REQUIRED_FIELDS = (
+    "flow-direction",
+    "srcaddr",
+    "dstaddr",
+    "pkt-srcaddr",
+    "pkt-dstaddr",
+    "bytes",
+)
+PRIVATE_NETWORKS = ("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16")
+
+
+@dataclass(frozen=True)
+class TaskEndpoint:
+    cluster: str
+    service: str
+    task_arn: str
+    eni_id: str
+
+
+@dataclass(frozen=True)
+class Talker:
+    source: str  # VPC 내부 IP (태스크)
+    destination: str  # NAT 너머의 외부 IP
+    bytes: int
+    share: float  # 전체 NAT 트래픽 대비 비율
+    endpoint: Optional[TaskEndpoint] = None
+
+
+def iter_log_paths(locations: Iterable[str], s3_client=None) -> Iterator[str]:
+    """로컬 파일/디렉터리 또는 s3://bucket/prefix 아래의 Flow Log 파일 경로"""
+    for location in locations:
+        if location.startswith("s3://"):
+            bucket, _, prefix = location[len("s3://") :].partition("/")
+            paginator = s3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                for item in page.get("Contents", []):
+                    if item["Key"].endswith((".log", ".log.gz")):
+                        yield f"s3://{bucket}/{item['Key']}"
+        elif os.path.isdir(location):
+            for root, _, files in os.walk(location):
+                for name in sorted(files):
+                    if name.endswith((".log", ".log.gz")):
+                        yield os.path.join(root, name)
+        else:
+            yield location
+
+
+def open_log(path: str, s3_client=None) -> TextIO:
+    if path.startswith("s3://"):
+        bucket, _, key = path[len("s3://") :].partition("/")
+        raw = s3_client.get_object(Bucket=bucket, Key=key)["Body"]
+    else:
+        raw = open(path, "rb")
+    if path.endswith(".gz"):
+        raw = gzip.GzipFile(fileobj=raw)
+    return io.TextIOWrapper(raw, encoding="utf-8")
+
+
+def read_chunks(
+    stream: TextIO, chunk_lines: int = DEFAULT_CHUNK_LINES
+) -> Iterator[Dict[str, np.ndarray]]:
+    """헤더 행의 필드 이름을 기준으로 청크마다 {필드: 컬럼 배열}을 반환"""
+    header = stream.readline().split()
+    missing = set(REQUIRED_FIELDS) - set(header)
+    if missing:
+        raise ValueError(f"Flow log is missing fields: {', '.join(sorted(missing))}")
+    indexes = {name: header.index(name) for name in REQUIRED_FIELDS}
+
+    while True:
+        lines = list(itertools.islice(stream, chunk_lines))
+        if not lines:
+            return
+        rows = np.array([line.split() for line in lines if line.strip()], dtype=str)
+        if rows.size:
+            yield {name: rows[:, index] for name, index in indexes.items()}
+
+
+def addresses_to_int(values: np.ndarray) -> np.ndarray:
+    """IPv4 문자열 배열 -> uint64 배열 (중복 값은 한 번만 파싱, 파싱 불가 값은 0)"""
+    unique, inverse = np.unique(values, return_inverse=True)
+    parsed = np.zeros(len(unique), dtype=np.uint64)
+    for index, value in enumerate(unique):
+        try:
+            parsed[index] = int(ipaddress.IPv4Address(value))
+        except ValueError:
+            pass
+    return parsed[inverse]
+
+
+class TrafficAggregator:
+    """(내부 IP, 외부 IP)별 NAT 처리 바이트를 청크 단위로 누적"""
+
+    def __init__(self, vpc_cidrs: Sequence[str] = PRIVATE_NETWORKS) -> None:
+        self.networks = [ipaddress.IPv4Network(cidr) for cidr in vpc_cidrs]
+        self.keys = np.empty(0, dtype=np.uint64)
+        self.totals = np.empty(0, dtype=np.int64)
+
+    def _in_vpc(self, addresses: np.ndarray) -> np.ndarray:
+        inside = np.zeros(len(addresses), dtype=bool)
+        for network in self.networks:
+            mask = np.uint64(int(network.netmask))
+            inside |= (addresses & mask) == np.uint64(int(network.network_address))
+        return inside
+
+    def add(self, columns: Dict[str, np.ndarray]) -> None:
+        has_bytes = columns["bytes"] != "-"
+        columns = {name: column[has_bytes] for name, column in columns.items()}
+        if not len(columns["bytes"]):
+            return
+
+        pkt_src = addresses_to_int(columns["pkt-srcaddr"])
+        pkt_dst = addresses_to_int(columns["pkt-dstaddr"])
+        # 기록된 ENI(NAT Gateway)의 주소: 수신이면 dstaddr, 송신이면 srcaddr
+        nat_address = addresses_to_int(
+            np.where(
+                columns["flow-direction"] == "ingress",
+                columns["dstaddr"],
+                columns["srcaddr"],
+            )
+        )
+
+        # 태스크 -> NAT (업로드, ingress) 와 NAT -> 태스크 (다운로드, egress) 구간만 집계
+        # NAT <-> 인터넷 구간은 내부 주소가 NAT 자신이므로 제외되어 중복 집계되지 않음
+        src_inside = self._in_vpc(pkt_src)
+        dst_inside = self._in_vpc(pkt_dst)
+        upload = src_inside & ~dst_inside & (pkt_src != nat_address)
+        download = dst_inside & ~src_inside & (pkt_dst != nat_address)
+        selected = upload | download
+        if not selected.any():
+            return
+
+        internal = np.where(upload, pkt_src, pkt_dst)[selected]
+        external = np.where(upload, pkt_dst, pkt_src)[selected]
+        keys = (internal << np.uint64(32)) | external
+        totals = columns["bytes"][selected].astype(np.int64)
+
+        self._merge(keys, totals)
+
+    def _merge(self, keys: np.ndarray, totals: np.ndarray) -> None:
+        keys = np.concatenate([self.keys, keys])
+        totals = np.concatenate([self.totals, totals])
+        self.keys, inverse = np.unique(keys, return_inverse=True)
+        self.totals = np.zeros(len(self.keys), dtype=np.int64)
+        np.add.at(self.totals, inverse, totals)
+
+    @property
+    def total_bytes(self) -> int:
+        return int(self.totals.sum())
+
+    def bytes_by_source(self) -> Dict[str, int]:
+        sources = self.keys >> np.uint64(32)
+        unique, inverse = np.unique(sources, return_inverse=True)
+        totals = np.zeros(len(unique), dtype=np.int64)
+        np.add.at(totals, inverse, self.totals)
+        return {
+            str(ipaddress.IPv4Address(int(source))): int(total)
+            for source, total in zip(unique, totals)
+        }
+
+    def top(
+        self, count: int, endpoints: Optional[Dict[str, TaskEndpoint]] = None
+    ) -> List[Talker]:
+        endpoints = endpoints or {}
+        total = self.total_bytes
+        order = np.argsort(self.totals, kind="stable")[::-1][:count]
+        talkers = []
+        for index in order:
+            key = int(self.keys[index])
+            source = str(ipaddress.IPv4Address(key >> 32))
+            talkers.append(
+                Talker(
+                    source=source,
+                    destination=str(ipaddress.IPv4Address(key & 0xFFFFFFFF)),
+                    bytes=int(self.totals[index]),
+                    share=int(self.totals[index]) / total if total else 0.0,
+                    endpoint=endpoints.get(source),
+                )
+            )
+        return talkers
+
+
+def ecs_task_endpoints(ecs_client, clusters: Sequence[str]) -> Dict[str, TaskEndpoint]:
+    """awsvpc 태스크의 사설 IP -> (클러스터, 서비스, 태스크, ENI) 매핑"""
+    endpoints = {}
+    for cluster in clusters:
+        task_arns = [
+            arn
+            for page in ecs_client.get_paginator("list_tasks").paginate(cluster=cluster)
+            for arn in page["taskArns"]
+        ]
+        # describe_tasks는 한 번에 100개까지 조회 가능
+        for start in range(0, len(task_arns), 100):
+            response = ecs_client.describe_tasks(
+                cluster=cluster, tasks=task_arns[start : start + 100]
+            )
+            for task in response["tasks"]:
+                service = task.get("group", "").removeprefix("service:")
+                for attachment in task.get("attachments", []):
+                    if attachment["type"] != "ElasticNetworkInterface":
+                        continue
+                    details = {d["name"]: d["value"] for d in attachment["details"]}
+                    if "privateIPv4Address" in details:
+                        endpoints[details["privateIPv4Address"]] = TaskEndpoint(
+                            cluster=cluster,
+                            service=service,
+                            task_arn=task["taskArn"],
+                            eni_id=details.get("networkInterfaceId", "-"),
+                        )
+    return endpoints
+
+
+def analyze(
+    locations: Iterable[str],
+    vpc_cidrs: Sequence[str] = PRIVATE_NETWORKS,
+    chunk_lines: int = DEFAULT_CHUNK_LINES,
+    s3_client=None,
+) -> TrafficAggregator:
+    aggregator = TrafficAggregator(vpc_cidrs)
+    for path in iter_log_paths(locations, s3_client=s3_client):
+        with open_log(path, s3_client=s3_client) as stream:
+            for columns in read_chunks(stream, chunk_lines):
+                aggregator.add(columns)
+    return aggregator
+
+
+def format_report(talkers: Sequence[Talker], total_bytes: int) -> str:
+    lines = [
+        f"NAT processed bytes: {total_bytes:,}",
+        f"{'service':<32} {'eni':<22} {'source':<16} {'destination':<16} "
+        f"{'bytes':>15} {'share':>7}",
+    ]
+    for talker in talkers:
+        endpoint = talker.endpoint
+        lines.append(
+            f"{(endpoint.service if endpoint else 'unknown'):<32} "
+            f"{(endpoint.eni_id if endpoint else '-'):<22} "
+            f"{talker.source:<16} {talker.destination:<16} "
+            f"{talker.bytes:>15,} {talker.share:>7.1%}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "locations", nargs="+", help="Flow Log 파일, 디렉터리 또는 s3:// 경로"
+    )
+    parser.add_argument("--vpc-cidr", action="append", dest="vpc_cidrs")
+    parser.add_argument("--cluster", action="append", default=[])
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--chunk-lines", type=int, default=DEFAULT_CHUNK_LINES)
+    args = parser.parse_args()
+
+    aggregator = analyze(
+        args.locations,
+        vpc_cidrs=args.vpc_cidrs or PRIVATE_NETWORKS,
+        chunk_lines=args.chunk_lines,
+        s3_client=boto3.client("s3"),
+    )
+    endpoints = (
+        ecs_task_endpoints(boto3.client("ecs"), args.cluster) if args.cluster else {}
+    )
+    print(format_report(aggregator.top(args.top, endpoints), aggregator.total_bytes))
+
+
+if __name__ == "__main__":
+    main()
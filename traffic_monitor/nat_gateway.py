@@ -1,24 +1,80 @@
-from aws_cdk import Duration, Fn, Stack
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from aws_cdk import Annotations, CfnOutput, Duration, RemovalPolicy, Stack
 from aws_cdk import aws_cloudwatch as cloudwatch
 from aws_cdk import aws_cloudwatch_actions as actions
-from aws_cdk import aws_secretsmanager as secretsmanager
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_lambda as lambda_
+from aws_cdk import aws_s3 as s3
 from aws_cdk import aws_sns as sns
 from aws_cdk import aws_sns_subscriptions as subscriptions
+from aws_cdk import custom_resources as cr
 from constructs import Construct
 
+from linked_paper_web_infra.environments import ENVIRONMENTS
 
-class NatGatewayMonitoringStack(Stack):
-    def __init__(self, scope: Construct, id: str, **kwargs) -> None:
-        super().__init__(scope, id, **kwargs)
+# NAT를 거친 원래 출발지/목적지(pkt-*)를 포함하는 Flow Log 형식 (traffic_monitor/flow_log_analyzer.py에서 사용)
+NAT_FLOW_LOG_FIELDS = (
+    "version",
+    "interface-id",
+    "flow-direction",
+    "srcaddr",
+    "dstaddr",
+    "pkt-srcaddr",
+    "pkt-dstaddr",
+    "dstport",
+    "protocol",
+    "packets",
+    "bytes",
+    "start",
+    "end",
+    "action",
+    "log-status",
+)
 
-        # NAT Gateway ID 가져오기
-        nat_gateway_id = "nat-05c30695a91f4edcb"
 
-        # Slack Webhook URL 가져오기
-        slack_webhook_secret = secretsmanager.Secret.from_secret_name_v2(
-            self, "SlackWebhookSecret", "GlueSlackWebhookURL"
-        )
-        slack_webhook_url = slack_webhook_secret.secret_value.to_string()
+@dataclass(frozen=True)
+class NatAlarmThresholds:
+    """NAT Gateway별 1분 단위 알람 기준"""
+
+    # 기존 "5분에 1GB" 기준을 1분 주기로 환산 (200MB/분)
+    bytes_out_per_minute: int = 1_000_000_000 // 5
+    anomaly_band_width: float = 3  # 이상 탐지 밴드 폭 (표준편차 배수)
+    anomaly_evaluation_periods: int = 5
+    anomaly_datapoints_to_alarm: int = 3
+    packets_drop_per_minute: int = 100
+    # 포트 할당 실패는 동일 목적지 동시 연결 한도(55,000) 도달을 의미하므로 1건부터 알림
+    error_port_allocation_per_minute: int = 0
+
+
+def discover_nat_gateways(
+    vpc: ec2.IVpc,
+) -> List[Tuple[ec2.ISubnet, ec2.CfnNatGateway]]:
+    """CDK로 생성한 VPC의 퍼블릭 서브넷에서 NAT Gateway 리소스를 찾음"""
+    return [
+        (subnet, child)
+        for subnet in vpc.public_subnets
+        for child in subnet.node.find_all()
+        if isinstance(child, ec2.CfnNatGateway)
+    ]
+
+
+class NatGatewayMonitoringStack(Stack):
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        *,
+        vpcs: Sequence[ec2.IVpc],
+        # ec2.Vpc.from_lookup으로 가져온 VPC처럼 자동으로 찾을 수 없는 NAT Gateway
+        nat_gateway_ids: Sequence[str] = (),
+        thresholds: NatAlarmThresholds = NatAlarmThresholds(),
+        slack_secret_name: str = ENVIRONMENTS["prod"].slack_webhook_secret_name,
+        **kwargs,
+    ) -> None:
+        super().__init__(scope, id, **kwargs)
 
         # Slack 통지용 SNS 주제 생성
         slack_topic = sns.Topic(
@@ -27,25 +83,201 @@ class NatGatewayMonitoringStack(Stack):
             display_name="NAT Gateway Slack Notification",
         )
 
-        # 기존 NAT Gateway의 CloudWatch 메트릭 참조
-        nat_gateway_bytes_out_metric = cloudwatch.Metric(
-            namespace="AWS/NATGateway",
-            metric_name="BytesOutToDestination",
-            dimensions_map={"NatGatewayId": nat_gateway_id},
-            statistic="Sum",
-            period=Duration.minutes(5),
+        # 알람을 Slack으로 전달하는 Lambda (SNS 구독)
+        slack_notifier_lambda = lambda_.Function(
+            self,
+            "SlackNotifierLambda",
+            runtime=lambda_.Runtime.PYTHON_3_9,
+            architecture=lambda_.Architecture.ARM_64,  # 순수 Python 핸들러 (Graviton)
+            handler="nat_alarm_notifier.lambda_handler",
+            code=lambda_.Code.from_asset("lambda"),
+            environment={
+                "SECRET_NAME": slack_secret_name,  # Secrets Manager의 Webhook URL 키
+            },
+        )
+        slack_notifier_lambda.add_to_role_policy(
+            iam.PolicyStatement(
+                actions=["secretsmanager:GetSecretValue"],
+                resources=["*"],
+            )
+        )
+        slack_topic.add_subscription(
+            subscriptions.LambdaSubscription(slack_notifier_lambda)
+        )
+
+        # Flow Log 저장 버킷 (gzip 텍스트, 시간 단위 파티션)
+        flow_log_bucket = s3.Bucket(
+            self,
+            "NatFlowLogBucket",
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            enforce_ssl=True,
+            lifecycle_rules=[s3.LifecycleRule(expiration=Duration.days(30))],
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+        # VPC의 NAT Gateway마다 Flow Log와 알람 생성
+        monitored = [(nat_id, nat_id) for nat_id in nat_gateway_ids]
+        for vpc in vpcs:
+            nat_gateways = discover_nat_gateways(vpc)
+            if not nat_gateways and not nat_gateway_ids:
+                Annotations.of(self).add_warning(
+                    f"No NAT gateways found in {vpc.node.path}; "
+                    "only VPCs created with ec2.Vpc can be discovered, "
+                    "pass nat_gateway_ids for looked-up VPCs"
+                )
+            monitored += [
+                (f"{vpc.node.id}{subnet.node.id}", nat_gateway.ref)
+                for subnet, nat_gateway in nat_gateways
+            ]
+
+        for name, nat_gateway_id in monitored:
+            self._add_flow_log(name, nat_gateway_id, flow_log_bucket)
+            self._add_alarms(name, nat_gateway_id, thresholds, slack_topic)
+
+        CfnOutput(
+            self,
+            "NatFlowLogBucketName",
+            value=flow_log_bucket.bucket_name,
+            description="VPC Flow Logs of the NAT gateway ENIs (flow_log_analyzer input)",
         )
 
-        # NAT Gateway 트래픽 알람 생성
-        traffic_alarm = cloudwatch.Alarm(
+    def _add_flow_log(self, name: str, nat_gateway_id: str, bucket: s3.IBucket) -> None:
+        # NAT Gateway ENI 조회 (Flow Log는 ENI 단위로 생성)
+        nat_gateway_lookup = cr.AwsCustomResource(
+            self,
+            f"{name}NatEniLookup",
+            on_update=cr.AwsSdkCall(
+                service="EC2",
+                action="describeNatGateways",
+                parameters={"NatGatewayIds": [nat_gateway_id]},
+                physical_resource_id=cr.PhysicalResourceId.of(nat_gateway_id),
+                output_paths=["NatGateways.0.NatGatewayAddresses.0.NetworkInterfaceId"],
+            ),
+            policy=cr.AwsCustomResourcePolicy.from_sdk_calls(
+                resources=cr.AwsCustomResourcePolicy.ANY_RESOURCE
+            ),
+        )
+
+        ec2.FlowLog(
+            self,
+            f"{name}NatFlowLog",
+            resource_type=ec2.FlowLogResourceType.from_network_interface_id(
+                nat_gateway_lookup.get_response_field(
+                    "NatGateways.0.NatGatewayAddresses.0.NetworkInterfaceId"
+                )
+            ),
+            destination=ec2.FlowLogDestination.to_s3(
+                bucket,
+                "nat/",
+                file_format=ec2.FlowLogFileFormat.PLAIN_TEXT,
+                per_hour_partition=True,
+            ),
+            log_format=[ec2.LogFormat.field(field) for field in NAT_FLOW_LOG_FIELDS],
+            max_aggregation_interval=ec2.FlowLogMaxAggregationInterval.ONE_MINUTE,
+            traffic_type=ec2.FlowLogTrafficType.ALL,
+        )
+
+    def _add_alarms(
+        self,
+        name: str,
+        nat_gateway_id: str,
+        thresholds: NatAlarmThresholds,
+        topic: sns.ITopic,
+    ) -> None:
+        def nat_metric(metric_name: str) -> cloudwatch.Metric:
+            return cloudwatch.Metric(
+                namespace="AWS/NATGateway",
+                metric_name=metric_name,
+                dimensions_map={"NatGatewayId": nat_gateway_id},
+                statistic="Sum",
+                period=Duration.minutes(1),
+            )
+
+        bytes_out = nat_metric("BytesOutToDestination")
+
+        # 평소 트래픽 패턴 대비 이상 탐지 (CDK L2 미지원으로 L1 사용)
+        cloudwatch.CfnAlarm(
             self,
-            "NatGatewayTrafficAlarm",
-            metric=nat_gateway_bytes_out_metric,
-            threshold=20000000,  # 20MB 이상의 트래픽이 발생할 경우
-            evaluation_periods=1,
-            alarm_description="Alarm when NAT Gateway traffic exceeds 1GB in 5 minutes",
-            comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+            f"{name}BytesOutAnomalyAlarm",
+            alarm_description=(
+                "NAT gateway BytesOutToDestination is above the expected "
+                "anomaly detection band"
+            ),
+            comparison_operator="GreaterThanUpperThreshold",
+            evaluation_periods=thresholds.anomaly_evaluation_periods,
+            datapoints_to_alarm=thresholds.anomaly_datapoints_to_alarm,
+            threshold_metric_id="expected",
+            treat_missing_data="notBreaching",
+            alarm_actions=[topic.topic_arn],
+            metrics=[
+                cloudwatch.CfnAlarm.MetricDataQueryProperty(
+                    id="bytes",
+                    return_data=True,
+                    metric_stat=cloudwatch.CfnAlarm.MetricStatProperty(
+                        metric=cloudwatch.CfnAlarm.MetricProperty(
+                            namespace=bytes_out.namespace,
+                            metric_name=bytes_out.metric_name,
+                            dimensions=[
+                                cloudwatch.CfnAlarm.DimensionProperty(
+                                    name="NatGatewayId", value=nat_gateway_id
+                                )
+                            ],
+                        ),
+                        period=60,
+                        stat="Sum",
+                    ),
+                ),
+                cloudwatch.CfnAlarm.MetricDataQueryProperty(
+                    id="expected",
+                    expression=(
+                        f"ANOMALY_DETECTION_BAND(bytes, {thresholds.anomaly_band_width})"
+                    ),
+                    label="BytesOutToDestination (expected)",
+                    return_data=True,
+                ),
+            ],
         )
 
-        # 알람 발생 시 SNS 주제로 알림 전송
-        traffic_alarm.add_alarm_action(actions.SnsAction(slack_topic))
+        alarms = [
+            cloudwatch.Alarm(
+                self,
+                f"{name}BytesOutAlarm",
+                metric=bytes_out,
+                threshold=thresholds.bytes_out_per_minute,
+                evaluation_periods=1,
+                alarm_description=(
+                    "NAT gateway BytesOutToDestination exceeded "
+                    f"{thresholds.bytes_out_per_minute / 1_000_000:g} MB "
+                    f"({thresholds.bytes_out_per_minute:,} bytes) in 1 minute"
+                ),
+                comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+                treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+            ),
+            cloudwatch.Alarm(
+                self,
+                f"{name}PacketsDropAlarm",
+                metric=nat_metric("PacketsDropCount"),
+                threshold=thresholds.packets_drop_per_minute,
+                evaluation_periods=3,
+                datapoints_to_alarm=2,
+                alarm_description="NAT gateway is dropping packets",
+                comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+                treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+            ),
+            cloudwatch.Alarm(
+                self,
+                f"{name}ErrorPortAllocationAlarm",
+                metric=nat_metric("ErrorPortAllocation"),
+                threshold=thresholds.error_port_allocation_per_minute,
+                evaluation_periods=1,
+                alarm_description=(
+                    "NAT gateway could not allocate a source port "
+                    "(too many concurrent connections to one destination)"
+                ),
+                comparison_operator=cloudwatch.ComparisonOperator.GREATER_THAN_THRESHOLD,
+                treat_missing_data=cloudwatch.TreatMissingData.NOT_BREACHING,
+            ),
+        ]
+        for alarm in alarms:
+            alarm.add_alarm_action(actions.SnsAction(topic))